@@ -0,0 +1,93 @@
+"""Benchmark: per-call BigQuery clients vs the pooled client in rate_shop_bq.
+
+Replays the four loader queries a cold tile-modal open issues against
+benchmarks.fake_bigquery, once the way the app used to (new client per
+call, paged REST download) and once through rate_shop_bq.run_query with
+pooled clients and 1/2/4/8 Storage Read API streams.
+
+The timings do not measure the BigQuery libraries. Every delay is a sleep
+in the fakes: client construction, query execution, each REST page and
+each streamed row cost the constants in benchmarks.fake_bigquery, which
+are printed with the results. The output shows how the two paths compare
+under those assumptions; the pooled client wins by avoiding
+SETUP_SECONDS per call and PAGE_SECONDS per PAGE_ROWS rows, so change the
+constants to match costs observed against a real project.
+
+    python benchmarks/bench_bq_client.py --rows 200000 --calls 4
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import rate_shop_bq  # noqa: E402
+from benchmarks import fake_bigquery  # noqa: E402
+from benchmarks.fake_bigquery import FakeClient, FakeReadClient  # noqa: E402
+
+# The fake costs behind every timing below
+FAKE_CONSTANTS = (
+    "SETUP_SECONDS",
+    "READ_SETUP_SECONDS",
+    "QUERY_SECONDS",
+    "PAGE_ROWS",
+    "PAGE_SECONDS",
+    "STREAM_ROW_SECONDS",
+)
+
+
+def make_frame(rows):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "course_name": rng.choice(["coyote_ridge_golf_club", "irving_golf_club"], rows),
+        "tee_date": pd.Timestamp("2026-02-03") + pd.to_timedelta(rng.integers(0, 90, rows), unit="D"),
+        "avg_price": rng.uniform(25, 120, rows),
+    })
+
+
+def per_call_clients(frame, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        client = FakeClient(frame)
+        client.query("SELECT 1").to_dataframe()
+    return time.perf_counter() - start
+
+
+def pooled_clients(frame, calls, streams):
+    rate_shop_bq.reset_clients()
+    start = time.perf_counter()
+    rate_shop_bq.use_clients(FakeClient(frame), FakeReadClient())
+    for _ in range(calls):
+        rate_shop_bq.run_query("SELECT 1", read_streams=streams)
+    elapsed = time.perf_counter() - start
+    rate_shop_bq.reset_clients()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--calls", type=int, default=4)
+    args = parser.parse_args()
+
+    frame = make_frame(args.rows)
+    results = {
+        "rows": args.rows,
+        "calls": args.calls,
+        "fake_constants": {name.lower(): getattr(fake_bigquery, name) for name in FAKE_CONSTANTS},
+    }
+    results["per_call_rest_s"] = round(per_call_clients(frame, args.calls), 3)
+    for streams in (1, 2, 4, 8):
+        results[f"pooled_storage_{streams}_streams_s"] = round(
+            pooled_clients(frame, args.calls, streams), 3
+        )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
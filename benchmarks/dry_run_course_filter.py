@@ -0,0 +1,62 @@
+"""Bytes scanned by the availability query: CASE filter vs raw alias IN-list.
+
+Dry runs show partition pruning only. Pass --execute to run both variants
+and read bytes processed/billed from the finished jobs, which is where
+clustering on course_name shows up.
+
+    python benchmarks/dry_run_course_filter.py --month 2026-03
+"""
+import argparse
+import calendar
+import json
+import sys
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from rate_shop_bq import dry_run_bytes, get_bq_client  # noqa: E402
+from rate_shop_engine import COURSE_ALIASES  # noqa: E402
+from rate_shop_queries import channel_availability_sql  # noqa: E402
+
+
+def executed_bytes(query):
+    from google.cloud import bigquery
+
+    config = bigquery.QueryJobConfig(use_query_cache=False)
+    job = get_bq_client().query(query, job_config=config)
+    job.result()
+    return {"processed": job.total_bytes_processed, "billed": job.total_bytes_billed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--month", default=date.today().strftime("%Y-%m"), help="YYYY-MM")
+    parser.add_argument("--course", action="append", help="canonical course (repeatable)")
+    parser.add_argument("--execute", action="store_true", help="run the queries, not just dry runs")
+    args = parser.parse_args()
+
+    year, month = (int(part) for part in args.month.split("-"))
+    month_start = date(year, month, 1)
+    month_end = date(year, month, calendar.monthrange(year, month)[1])
+    courses = args.course or list(COURSE_ALIASES) + ["coyote_ridge_golf_club"]
+
+    results = []
+    for course in courses:
+        case_sql = channel_availability_sql(course, month_start, month_end, prune=False)
+        in_sql = channel_availability_sql(course, month_start, month_end)
+        row = {
+            "course": course,
+            "dry_run_case_filter": dry_run_bytes(case_sql),
+            "dry_run_in_list": dry_run_bytes(in_sql),
+        }
+        if args.execute:
+            row["executed_case_filter"] = executed_bytes(case_sql)
+            row["executed_in_list"] = executed_bytes(in_sql)
+        results.append(row)
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""In-process stand-ins for the BigQuery and BigQuery Storage clients.
+
+The fakes serve a fixed DataFrame for every query and sleep for
+configurable amounts of time to model client construction, query
+execution and result download, so client pooling and download paths can be
+compared without a warehouse. A comparison made with them reflects only
+these delays, not the cost of the real client libraries.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+MB = 1024 * 1024
+
+# Default delays in seconds; every timing taken against the fakes is made
+# of these sleeps
+SETUP_SECONDS = 0.25
+READ_SETUP_SECONDS = 0.1
+QUERY_SECONDS = 0.05
+PAGE_ROWS = 10_000
+PAGE_SECONDS = 0.04
+STREAM_ROW_SECONDS = 1e-6
+
+
+class FakeRowIterator:
+    """Mimics google.cloud.bigquery.table.RowIterator for a fixed frame."""
+
+    def __init__(self, frame, page_rows, page_seconds, stream_row_seconds):
+        self.frame = frame
+        self.page_rows = page_rows
+        self.page_seconds = page_seconds
+        self.stream_row_seconds = stream_row_seconds
+        self.schema = [SimpleNamespace(name=c) for c in frame.columns]
+        self.total_rows = len(frame)
+
+    def _read_stream(self, chunk):
+        time.sleep(len(chunk) * self.stream_row_seconds)
+        return chunk
+
+    def to_dataframe_iterable(self, bqstorage_client=None, max_stream_count=None, **kwargs):
+        if bqstorage_client is None:
+            # Paged REST download: one JSON page after another
+            for start in range(0, len(self.frame), self.page_rows):
+                time.sleep(self.page_seconds)
+                yield self.frame.iloc[start:start + self.page_rows]
+            return
+
+        streams = max(1, max_stream_count or 1)
+        bounds = np.linspace(0, len(self.frame), streams + 1).astype(int)
+        chunks = [
+            self.frame.iloc[start:stop]
+            for start, stop in zip(bounds[:-1], bounds[1:])
+            if stop > start
+        ]
+        with ThreadPoolExecutor(max_workers=streams) as pool:
+            yield from pool.map(self._read_stream, chunks)
+
+    def to_dataframe(self, bqstorage_client=None, **kwargs):
+        frames = list(self.to_dataframe_iterable(bqstorage_client=bqstorage_client))
+        return pd.concat(frames, ignore_index=True) if frames else self.frame.iloc[:0]
+
+
+class FakeQueryJob:
+    """Mimics google.cloud.bigquery.QueryJob, job statistics included.
+
+    Bytes processed are the in-memory size of the served frame; bytes
+    billed follow BigQuery's 10 MB minimum rounded up to whole MB.
+    """
+
+    def __init__(self, client, query):
+        self.client = client
+        self.query = query
+        self.job_id = f"fake_job_{len(client.queries)}"
+        self.total_bytes_processed = int(client.frame.memory_usage(deep=True).sum())
+        self.total_bytes_billed = max(10 * MB, -(-self.total_bytes_processed // MB) * MB)
+        self.slot_millis = int(client.query_seconds * 1000)
+        self.cache_hit = False
+
+    def result(self):
+        time.sleep(self.client.query_seconds)
+        return FakeRowIterator(
+            self.client.frame,
+            self.client.page_rows,
+            self.client.page_seconds,
+            self.client.stream_row_seconds,
+        )
+
+    def to_dataframe(self, **kwargs):
+        return self.result().to_dataframe(**kwargs)
+
+
+class FakeClient:
+    """Mimics google.cloud.bigquery.Client; construction pays `setup_seconds`."""
+
+    def __init__(
+        self,
+        frame,
+        setup_seconds=SETUP_SECONDS,
+        query_seconds=QUERY_SECONDS,
+        page_rows=PAGE_ROWS,
+        page_seconds=PAGE_SECONDS,
+        stream_row_seconds=STREAM_ROW_SECONDS,
+    ):
+        time.sleep(setup_seconds)
+        self.frame = frame
+        self.query_seconds = query_seconds
+        self.page_rows = page_rows
+        self.page_seconds = page_seconds
+        self.stream_row_seconds = stream_row_seconds
+        self.queries = []
+
+    def query(self, query, **kwargs):
+        job = FakeQueryJob(self, query)
+        self.queries.append(job)
+        return job
+
+
+class FakeReadClient:
+    """Mimics google.cloud.bigquery_storage.BigQueryReadClient."""
+
+    def __init__(self, setup_seconds=READ_SETUP_SECONDS):
+        time.sleep(setup_seconds)
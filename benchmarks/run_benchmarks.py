@@ -0,0 +1,188 @@
+"""Benchmark: rate shop view derivations at 1x, 10x and 100x today's volume.
+
+Generates synthetic scrapes with benchmarks.synthetic_data (seven courses
+per 1x, as scraped today), builds the summary, benchmark frame and price
+history with the pandas engine one seven-course batch at a time, types
+them with the app's compact schema (recording their size before and
+after), then times the work a Rate Shop or Benchmarking rerun does on
+them:
+
+- my_df: preferred-channel row per tee date (select_course_rows)
+- summary_index: month and course-month index the app builds once per load (SummaryIndex)
+- calendar: tile model and grid HTML (build_tile_model, render_calendar_html)
+- benchmark_table: benchmarking table HTML (build_benchmark_table_html)
+- history_chart: tile-modal history pivot/merge (build_history_chart_frame)
+- availability: tile-modal channel availability for a course-month, from the
+  slot lifecycle (course_channel_availability)
+- pace: tile-modal booking pace against a week earlier (PaceCube.same_lead)
+
+Each run appends one JSON line per scale to benchmarks/results.jsonl, so
+a regression shows up as a diff against the previous lines. The file is
+machine-local output and is not committed.
+
+    python benchmarks/run_benchmarks.py --scales 1,10,100 --repeat 5
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from benchmarks.synthetic_data import BASE_COURSES, generate_scrapes  # noqa: E402
+from rate_shop_benchmark import build_benchmark_table_html  # noqa: E402
+from rate_shop_calendar import build_tile_model, render_calendar_html, select_course_rows  # noqa: E402
+from rate_shop_engine import (  # noqa: E402
+    PaceCube,
+    benchmark_from_rollup,
+    build_benchmark_rollup,
+    build_daily_course_summary,
+    build_market_summary,
+    build_price_history,
+    build_slot_lifecycle,
+    course_channel_availability,
+    join_market_summary,
+    label_occupancy,
+    normalize_scrape_rows,
+)
+from rate_shop_history import build_history_chart_frame  # noqa: E402
+from rate_shop_schema import memory_report, typed  # noqa: E402
+from rate_shop_index import SummaryIndex  # noqa: E402
+
+RESULTS_FILE = Path(__file__).resolve().parent / "results.jsonl"
+
+SELF_COURSE = "coyote_ridge_golf_club"
+YEAR, MONTH = 2026, 2
+WINDOW = ("2026-02-03", "2026-02-28")
+
+# Slot lifecycle columns the availability derivation reads
+AVAILABILITY_INPUTS = [
+    "course_name", "source_channel", "tee_date", "tee_time", "first_seen_at", "last_seen_at", "sample_price",
+]
+
+
+# --------------------------
+# DATASET
+# --------------------------
+
+def build_dataset(scale, days, seed):
+    """Summary, benchmark frame and price history for `scale` x BASE_COURSES."""
+    daily, rollups, histories, lifecycles = [], [], [], []
+    raw_rows = 0
+    start = time.perf_counter()
+    for batch in range(scale):
+        courses = [c if batch == 0 else f"{c}_{batch:03d}" for c in BASE_COURSES]
+        rows = normalize_scrape_rows(generate_scrapes(courses, days=days, seed=seed + batch))
+        raw_rows += len(rows)
+        lifecycle = build_slot_lifecycle(rows)
+        daily.append(build_daily_course_summary(label_occupancy(lifecycle)))
+        rollups.append(build_benchmark_rollup(rows))
+        histories.append(build_price_history(lifecycle))
+        lifecycles.append(lifecycle[AVAILABILITY_INPUTS])
+
+    daily = pd.concat(daily, ignore_index=True)
+    summary = join_market_summary(daily, build_market_summary(daily))
+    rollup = pd.concat(rollups, ignore_index=True)
+    bench_df = benchmark_from_rollup(rollup, *WINDOW, *WINDOW, "ALL")
+    history = pd.concat(histories, ignore_index=True).sort_values(
+        ["tee_date", "course_name"], ascending=[False, True], kind="mergesort"
+    )
+    return {
+        "raw_rows": raw_rows,
+        "build_s": round(time.perf_counter() - start, 2),
+        "summary": typed(summary, "summary"),
+        "bench_df": typed(bench_df, "benchmark"),
+        "history": typed(history.reset_index(drop=True), "history"),
+        "lifecycle": pd.concat(lifecycles, ignore_index=True),
+        "pace": PaceCube(typed(rollup, "pace")),
+    }
+
+
+# --------------------------
+# DERIVATIONS
+# --------------------------
+
+def derivations(data):
+    """The timed steps, as zero-argument callables over one dataset."""
+    summary = data["summary"]
+    month_df = summary[
+        (summary["tee_date"].dt.month == MONTH) & (summary["tee_date"].dt.year == YEAR)
+    ]
+    my_df = select_course_rows(month_df[month_df["course_name"] == SELF_COURSE])
+    history_df = data["history"]
+    all_courses = sorted(history_df["course_name"].unique().tolist())
+
+    return {
+        "my_df": lambda: select_course_rows(month_df[month_df["course_name"] == SELF_COURSE]),
+        "summary_index": lambda: SummaryIndex(summary),
+        "calendar": lambda: render_calendar_html(build_tile_model(my_df), YEAR, MONTH),
+        "benchmark_table": lambda: build_benchmark_table_html(data["bench_df"], SELF_COURSE),
+        "history_chart": lambda: build_history_chart_frame(history_df, all_courses, SELF_COURSE),
+        "availability": lambda: course_channel_availability(data["lifecycle"], SELF_COURSE, *WINDOW),
+        "pace": lambda: data["pace"].same_lead(SELF_COURSE, WINDOW[1]),
+    }
+
+
+def time_ms(fn, repeat):
+    """Median wall time of `repeat` calls, in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(1000 * (time.perf_counter() - start))
+    return round(statistics.median(samples), 2)
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", default="1,10,100", help="comma-separated volume multipliers")
+    parser.add_argument("--days", type=int, default=26, help="tee dates per course")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=str(RESULTS_FILE))
+    args = parser.parse_args()
+
+    commit = git_commit()
+    for scale in (int(s) for s in args.scales.split(",")):
+        data = build_dataset(scale, args.days, args.seed)
+        result = {
+            "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": commit,
+            "scale": scale,
+            "courses": scale * len(BASE_COURSES),
+            "raw_rows": data["raw_rows"],
+            "summary_rows": len(data["summary"]),
+            "bench_rows": len(data["bench_df"]),
+            "history_rows": len(data["history"]),
+            "build_s": data["build_s"],
+            "memory_mb": {
+                row.dataset: [row.mb_loaded, row.mb_compact] for row in memory_report().itertuples()
+            },
+            "timings_ms": {
+                name: time_ms(fn, args.repeat) for name, fn in derivations(data).items()
+            },
+        }
+        print(json.dumps(result))
+        with open(args.output, "a", encoding="utf-8") as out:
+            out.write(json.dumps(result) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Benchmark: cold-start import time and rerun time of the Streamlit app.
+
+Imports everything rate_shop_app.py imports at module level in a fresh
+interpreter under `python -X importtime`, and reports the total and the
+slowest top-level packages. Modules the app defers to the paths that need
+them (Altair for charts, the BigQuery client for a cache miss) must not
+show up there. With --bundle, also times the app's first run and a rerun
+against an exported bundle (rate_shop_export.py), so no warehouse is
+involved.
+
+The run fails when a deferred module is imported at startup or a median
+goes over its budget, and appends one JSON line to
+benchmarks/startup_results.jsonl (local output, not committed), so a
+regression shows up as a diff against the previous lines.
+
+    python benchmarks/startup_budget.py --repeat 5 --bundle bundles/
+"""
+import argparse
+import ast
+import json
+import os
+import statistics
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.run_benchmarks import git_commit  # noqa: E402
+
+APP = ROOT / "rate_shop_app.py"
+RESULTS_FILE = Path(__file__).resolve().parent / "startup_results.jsonl"
+
+# Imported only on the paths that need them
+DEFERRED = ("altair", "google.cloud.bigquery", "rate_shop_charts")
+
+IMPORT_BUDGET_MS = 1500
+FIRST_RUN_BUDGET_MS = 3000
+RERUN_BUDGET_MS = 500
+
+RERUN_SCRIPT = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(sys.argv[1], default_timeout=60)
+start = time.perf_counter(); at.run(); first = time.perf_counter() - start
+start = time.perf_counter(); at.run(); rerun = time.perf_counter() - start
+failed = [e.message for e in at.exception] + [e.value for e in at.error]
+print(json.dumps({"first_run_ms": 1000 * first, "rerun_ms": 1000 * rerun, "errors": failed}))
+"""
+
+
+# --------------------------
+# IMPORTS
+# --------------------------
+
+def app_imports(path=APP):
+    """Modules rate_shop_app.py imports at module level, in order."""
+    modules = []
+    for node in ast.parse(path.read_text(encoding="utf-8")).body:
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            modules.append(node.module)
+    return list(dict.fromkeys(modules))
+
+
+def import_profile(modules):
+    """(total ms, {module: cumulative ms}) of importing `modules` in a fresh interpreter.
+
+    The dict covers every module imported, nested ones included.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + ", ".join(modules)],
+        capture_output=True, text=True, cwd=ROOT, check=True,
+    )
+    total_us, cumulative = 0, {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative_us, name = line.split("|")
+        if not cumulative_us.strip().isdigit():
+            continue
+        cumulative[name.strip()] = int(cumulative_us) / 1000
+        # Top-level imports are indented by a single space
+        if not name[1:].startswith(" "):
+            total_us += int(cumulative_us)
+    return total_us / 1000, cumulative
+
+
+def top_packages(cumulative, modules, count=8):
+    """The slowest of the app's own top-level imports, in ms."""
+    roots = {m: cumulative.get(m, 0.0) for m in modules}
+    slowest = sorted(roots.items(), key=lambda item: -item[1])[:count]
+    return {name: round(ms, 1) for name, ms in slowest}
+
+
+# --------------------------
+# RERUNS
+# --------------------------
+
+def rerun_times(bundle):
+    """First-run and rerun ms of the app in a fresh process, served from `bundle`."""
+    env = dict(os.environ, RATE_SHOP_DATA_SOURCE="bundle", RATE_SHOP_BUNDLE=str(Path(bundle).resolve()))
+    proc = subprocess.run(
+        [sys.executable, "-c", RERUN_SCRIPT, str(APP)],
+        capture_output=True, text=True, cwd=ROOT, env=env, check=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--bundle", help="exported bundle to time the first run and a rerun against")
+    parser.add_argument("--import-budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument("--first-run-budget-ms", type=float, default=FIRST_RUN_BUDGET_MS)
+    parser.add_argument("--rerun-budget-ms", type=float, default=RERUN_BUDGET_MS)
+    parser.add_argument("--output", default=str(RESULTS_FILE))
+    args = parser.parse_args()
+
+    modules = app_imports()
+    profiles = [import_profile(modules) for _ in range(args.repeat)]
+    cumulative = profiles[-1][1]
+    result = {
+        "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "import_ms": round(statistics.median(total for total, _ in profiles), 1),
+        "slowest_imports_ms": top_packages(cumulative, modules),
+        "deferred_at_startup": [name for name in DEFERRED if name in cumulative],
+    }
+    budgets = {"import_ms": args.import_budget_ms}
+
+    if args.bundle:
+        runs = [rerun_times(args.bundle) for _ in range(args.repeat)]
+        result["first_run_ms"] = round(statistics.median(run["first_run_ms"] for run in runs), 1)
+        result["rerun_ms"] = round(statistics.median(run["rerun_ms"] for run in runs), 1)
+        result["app_errors"] = runs[-1]["errors"]
+        budgets.update(first_run_ms=args.first_run_budget_ms, rerun_ms=args.rerun_budget_ms)
+
+    over = [name for name, budget in budgets.items() if result[name] > budget]
+    print(json.dumps(result, indent=2))
+    with open(args.output, "a", encoding="utf-8") as out:
+        out.write(json.dumps(result) + "\n")
+
+    for name in over:
+        print(f"{name} {result[name]} ms is over its {budgets[name]:.0f} ms budget", file=sys.stderr)
+    for name in result["deferred_at_startup"]:
+        print(f"{name} is imported at startup; import it where it is used", file=sys.stderr)
+    if result.get("app_errors"):
+        print(f"the app failed: {result['app_errors']}", file=sys.stderr)
+    if over or result["deferred_at_startup"] or result.get("app_errors"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
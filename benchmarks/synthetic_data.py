@@ -0,0 +1,138 @@
+"""Deterministic `tee_time_clean`-shaped scrape rows for benchmarks.
+
+Every (course, channel, tee date, tee time) slot is listed at some scrape
+in the days before its tee date and, with probability `sell_through`,
+disappears at a later scrape, which the pipeline reads as a booking.
+Aliased courses are scraped under the raw names the alias registry maps,
+so the CASE normalization has work to do.
+
+    from benchmarks.synthetic_data import course_names, generate_scrapes
+    raw = generate_scrapes(course_names(scale=10), days=26, seed=0)
+"""
+import numpy as np
+import pandas as pd
+
+from rate_shop_engine import COURSE_ALIASES, SCRAPE_COLUMNS, SEASON_START
+
+# --------------------------
+# CONFIG
+# --------------------------
+
+BASE_COURSES = [
+    "coyote_ridge_golf_club",
+    "bear_creek_golf_club_west",
+    "irving_golf_club",
+    "mesquite_golf_club",
+    "prairie_lakes_golf_course",
+    "riverside_golf_club_dallas",
+    "thorntree_golf_club",
+]
+
+CHANNELS = ["brand", "golfnow", "teeoff", "supremegolf"]
+
+# Channel price relative to the course's brand rate
+CHANNEL_DISCOUNT = {"brand": 1.0, "golfnow": 0.94, "teeoff": 0.96, "supremegolf": 0.92}
+
+
+def course_names(scale=1):
+    """BASE_COURSES, plus numbered copies of them for `scale` > 1."""
+    names = list(BASE_COURSES)
+    for copy in range(1, scale):
+        names += [f"{course}_{copy:03d}" for course in BASE_COURSES]
+    return names
+
+
+# --------------------------
+# GENERATOR
+# --------------------------
+
+def generate_scrapes(
+    courses=None,
+    channels=CHANNELS,
+    start=SEASON_START,
+    days=26,
+    scrapes_per_day=3,
+    lead_days=7,
+    first_tee="07:00",
+    last_tee="16:40",
+    tee_interval_minutes=20,
+    sell_through=0.6,
+    seed=0,
+):
+    """Raw scrape rows for `days` tee dates from `start`; same arguments, same rows.
+
+    Each tee date is scraped `scrapes_per_day` times a day over the
+    `lead_days` before it, at the same UTC hours for every date. Slots are
+    listed within the first third of those scrapes; sold slots vanish at
+    a uniformly drawn later scrape.
+    """
+    courses = list(courses if courses is not None else BASE_COURSES)
+    rng = np.random.default_rng(seed)
+
+    tee_dates = pd.date_range(start, periods=days, freq="D")
+    tee_times = pd.date_range(
+        f"2000-01-01 {first_tee}", f"2000-01-01 {last_tee}", freq=f"{tee_interval_minutes}min"
+    ).strftime("%H:%M")
+    n_scrapes = lead_days * scrapes_per_day
+
+    # One entry per slot, courses outermost
+    shape = (len(courses), len(channels), len(tee_dates), len(tee_times))
+    course_idx, channel_idx, date_idx, time_idx = (
+        a.ravel() for a in np.indices(shape)
+    )
+    n_slots = course_idx.size
+
+    listed = rng.integers(0, max(1, n_scrapes // 3), n_slots)
+    sold = rng.random(n_slots) < sell_through
+    gone = np.where(
+        sold,
+        listed + 1 + (rng.random(n_slots) * (n_scrapes - listed - 1)).astype(int),
+        n_scrapes,
+    )
+
+    # Course-level base rate with a weekend premium and a morning premium
+    base_rate = rng.uniform(35, 95, len(courses)).round()
+    discount = np.array([CHANNEL_DISCOUNT.get(c, 0.95) for c in channels])
+    weekend = np.asarray(tee_dates.dayofweek >= 5)
+    morning = np.asarray([t < "11:00" for t in tee_times])
+    slot_price = (
+        base_rate[course_idx]
+        * discount[channel_idx]
+        * np.where(weekend[date_idx], 1.15, 1.0)
+        * np.where(morning[time_idx], 1.1, 1.0)
+    )
+
+    # Aliased courses are scraped under one of their raw names per slot
+    raw_names = np.empty(n_slots, dtype=object)
+    for i, course in enumerate(courses):
+        in_course = course_idx == i
+        aliases = COURSE_ALIASES.get(course, [course])
+        raw_names[in_course] = np.asarray(aliases, dtype=object)[
+            rng.integers(0, len(aliases), in_course.sum())
+        ]
+
+    # Expand slots into one row per scrape they were listed at
+    counts = gone - listed
+    slot = np.repeat(np.arange(n_slots), counts)
+    offsets = np.arange(slot.size) - np.repeat(np.cumsum(counts) - counts, counts)
+    scrape_idx = listed[slot] + offsets
+
+    scrape_hours = 24 // scrapes_per_day
+    scrape_timestamp = (
+        tee_dates[date_idx[slot]].tz_localize("UTC")
+        - pd.Timedelta(days=lead_days)
+        + pd.to_timedelta(6 + scrape_idx * scrape_hours, unit="h")
+    )
+    # Occasional price moves between scrapes, whole dollars
+    drift = np.where(rng.random(slot.size) < 0.1, rng.choice([-5, 5], slot.size), 0)
+    price = (slot_price[slot] + drift).round().astype("float64")
+
+    rows = pd.DataFrame({
+        "course_name": raw_names[slot],
+        "source_channel": np.asarray(channels, dtype=object)[channel_idx[slot]],
+        "scrape_timestamp": scrape_timestamp,
+        "tee_date": tee_dates[date_idx[slot]],
+        "tee_time": np.asarray(tee_times, dtype=object)[time_idx[slot]],
+        "price": price,
+    })
+    return rows[SCRAPE_COLUMNS]
@@ -1,9 +1,42 @@
 import streamlit as st
 import pandas as pd
-import altair as alt
-from google.cloud import bigquery
 from datetime import datetime, date
 import calendar
+import os
+import threading
+
+from rate_shop_benchmark import (
+    BENCHMARK_CSS,
+    DEFAULT_AS_OF_RANGE,
+    DEFAULT_BENCHMARK_WINDOW,
+    DEFAULT_CHECKIN_RANGE,
+    build_benchmark_table_html,
+    page_as_of_dates,
+)
+from rate_shop_bq import forget_query, run_query
+from rate_shop_calendar import (
+    CALENDAR_CSS,
+    VIEW_ANALYTICS,
+    build_tile_model,
+    calendar_grid,
+)
+from rate_shop_engine import ALL_CHANNELS, AVAILABILITY_CHANNELS, IncrementalSummary, PaceCube
+from rate_shop_export import BUNDLE_DIR, Bundle
+from rate_shop_history import build_history_chart_frame
+from rate_shop_index import SummaryIndex
+from rate_shop_memcache import MB, budget_cache, cache_stats
+from rate_shop_schema import memory_report, shared_view, typed
+from rate_shop_queries import (
+    channel_availability_sql,
+    dashboard_benchmark_sql,
+    dashboard_history_sql,
+    dashboard_pace_sql,
+    dashboard_summary_sql,
+    slot_lifecycle_sql,
+)
+from rate_shop_snapshot import age_label, pending, revalidate, save_snapshot, stale_while_revalidate
+from rate_shop_tasks import Prefetcher, gather
+from rate_shop_telemetry import cache_miss, calls_frame, loader_summary, recent_calls, timed_loader
 
 # --------------------------
 # PAGE CONFIG & STYLING
@@ -16,259 +49,12 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Advanced custom CSS styling
-st.markdown("""
-<style>
-    * {
-        margin: 0;
-        padding: 0;
-        box-sizing: border-box;
-    }
-    
-    body {
-        background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
-    }
-    
-    .main {
-        background: transparent;
-        padding: 20px;
-    }
-    
-    .stTitle {
-        color: #fff !important;
-        font-size: 2.5em !important;
-        margin-bottom: 10px;
-    }
-    
-    /* Calendar Grid Styling */
-    .calendar-container {
-        display: grid;
-        grid-template-columns: repeat(7, 1fr);
-        gap: 12px;
-        margin: 30px 0;
-    }
-    
-    .calendar-tile {
-        aspect-ratio: 1;
-        border-radius: 16px;
-        padding: 12px;
-        text-align: center;
-        transition: all 0.3s cubic-bezier(0.34, 1.56, 0.64, 1);
-        border: 2px solid rgba(255,255,255,0.1);
-        cursor: pointer;
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-        align-items: center;
-        backdrop-filter: blur(10px);
-        font-weight: 600;
-    }
-    
-    .calendar-tile:hover {
-        transform: translateY(-8px) scale(1.05);
-        border-color: rgba(255,255,255,0.3);
-        box-shadow: 0 12px 40px rgba(255,255,255,0.1);
-    }
-    
-    .tile-day {
-        font-size: 0.9em;
-        opacity: 0.9;
-        margin-bottom: 4px;
-    }
-    
-    .tile-price {
-        font-size: 1.8em;
-        margin: 4px 0;
-        font-weight: 700;
-    }
-    
-    .tile-badge {
-        display: inline-block;
-        padding: 2px 8px;
-        border-radius: 8px;
-        font-size: 0.75em;
-        font-weight: 600;
-        margin-bottom: 4px;
-    }
-    
-    .tile-occ {
-        font-size: 0.85em;
-        opacity: 0.85;
-    }
-    
-    /* Modal Overlay */
-    .modal-overlay {
-        position: fixed;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        background: rgba(0, 0, 0, 0.7);
-        backdrop-filter: blur(4px);
-        z-index: 9998;
-        display: flex;
-        justify-content: center;
-        align-items: center;
-        animation: fadeIn 0.3s ease-in-out;
-    }
-    
-    .modal-content {
-        background: linear-gradient(135deg, #ffffff 0%, #f8f9fa 100%);
-        border-radius: 20px;
-        padding: 40px;
-        width: 90%;
-        max-width: 650px;
-        max-height: 80vh;
-        overflow-y: auto;
-        box-shadow: 0 20px 60px rgba(0, 0, 0, 0.4);
-        animation: slideUp 0.4s cubic-bezier(0.34, 1.56, 0.64, 1);
-        position: relative;
-    }
-    
-    .modal-header {
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        margin-bottom: 25px;
-        padding-bottom: 15px;
-        border-bottom: 2px solid #e0e0e0;
-    }
-    
-    .modal-title {
-        font-size: 1.8em;
-        font-weight: 700;
-        color: #1a1a2e;
-    }
-    
-    .modal-close {
-        background: #ff4757;
-        color: white;
-        border: none;
-        border-radius: 50%;
-        width: 40px;
-        height: 40px;
-        font-size: 1.2em;
-        cursor: pointer;
-        transition: all 0.2s;
-    }
-    
-    .modal-close:hover {
-        background: #ff3838;
-        transform: scale(1.1);
-    }
-    
-    .price-section {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 25px;
-        border-radius: 16px;
-        margin-bottom: 25px;
-        box-shadow: 0 8px 20px rgba(102, 126, 234, 0.3);
-    }
-    
-    .price-label {
-        font-size: 0.95em;
-        opacity: 0.9;
-        margin-bottom: 8px;
-    }
-    
-    .price-value {
-        font-size: 2.5em;
-        font-weight: 700;
-    }
-    
-    .market-range {
-        background: #f0f0f5;
-        padding: 20px;
-        border-radius: 12px;
-        margin-bottom: 25px;
-        border-left: 4px solid #667eea;
-    }
-    
-    .market-range-label {
-        font-size: 0.95em;
-        font-weight: 600;
-        color: #666;
-        margin-bottom: 10px;
-    }
-    
-    .market-stats {
-        display: grid;
-        grid-template-columns: repeat(3, 1fr);
-        gap: 15px;
-    }
-    
-    .stat-box {
-        background: white;
-        padding: 12px;
-        border-radius: 8px;
-        text-align: center;
-    }
-    
-    .stat-label {
-        font-size: 0.8em;
-        color: #999;
-        font-weight: 500;
-    }
-    
-    .stat-value {
-        font-size: 1.4em;
-        font-weight: 700;
-        color: #1a1a2e;
-        margin-top: 4px;
-    }
-    
-    .competitors-section h3 {
-        color: #1a1a2e;
-        margin-bottom: 15px;
-        font-size: 1.2em;
-    }
-    
-    /* Animations */
-    @keyframes fadeIn {
-        from {
-            opacity: 0;
-        }
-        to {
-            opacity: 1;
-        }
-    }
-    
-    @keyframes slideUp {
-        from {
-            transform: translateY(30px);
-            opacity: 0;
-        }
-        to {
-            transform: translateY(0);
-            opacity: 1;
-        }
-    }
-    
-    /* Responsive */
-    @media (max-width: 768px) {
-        .calendar-tile {
-            aspect-ratio: auto;
-            min-height: 80px;
-        }
-        
-        .modal-content {
-            width: 95%;
-            padding: 20px;
-        }
-        
-        .market-stats {
-            grid-template-columns: 1fr;
-        }
-    }
-</style>
-""", unsafe_allow_html=True)
+st.markdown(CALENDAR_CSS, unsafe_allow_html=True)
 
 # --------------------------
 # CONFIG
 # --------------------------
 
-PROJECT_ID = "tee-metrics-golf-tee-time"
 TABLE_ID = "RateShop Query"
 
 COURSES = [
@@ -281,446 +67,321 @@ COURSES = [
     "thorntree_golf_club"
 ]
 
-st.set_page_config(layout="wide")
+# Refresh the main summary from scrapes newer than the last one seen
+# instead of re-aggregating the whole season
+INCREMENTAL_REFRESH = True
 
-def get_bq_client():
-    """Returns a BigQuery client using Streamlit secrets."""
-    from google.oauth2 import service_account
-    
-    # This works for both local .streamlit/secrets.toml AND Streamlit Cloud Secrets
-    credentials_info = st.secrets["gcp_service_account"]
-    credentials = service_account.Credentials.from_service_account_info(credentials_info)
-    
-    return bigquery.Client(credentials=credentials, project=credentials_info["project_id"])
+# "raw" aggregates golf_silver scrapes at view time, "gold" reads the tables
+# materialized by rate_shop_pipeline.py, "bundle" reads the latest export of
+# rate_shop_export.py under RATE_SHOP_BUNDLE and never calls the warehouse
+DATA_SOURCE = os.environ.get("RATE_SHOP_DATA_SOURCE", "raw")
+
+# Seconds query results are kept in the on-disk cache, which survives
+# restarts; benchmark results follow their shorter in-memory TTL
+DISK_CACHE_TTL = int(os.environ.get("RATE_SHOP_DISK_CACHE_TTL", "3600"))
+BENCHMARK_TTL = 300
+
+# In-memory budget of the per course-month and per window loaders, so the
+# server stays a predictable size however many users click around
+AVAILABILITY_CACHE_BYTES = int(os.environ.get("RATE_SHOP_AVAILABILITY_CACHE_MB", "64")) * MB
+BENCHMARK_CACHE_BYTES = int(os.environ.get("RATE_SHOP_BENCHMARK_CACHE_MB", "64")) * MB
 
+# As-of rows per page of the benchmarking table
+BENCHMARK_PAGE_SIZE = 30
 
+# Render from the last local snapshot while a process's first live load
+# runs in the background, polling every few seconds to swap it in
+SNAPSHOT_STARTUP = (
+    os.environ.get("RATE_SHOP_SNAPSHOT_STARTUP", "1") == "1" and DATA_SOURCE != "bundle"
+)
+SNAPSHOT_POLL_SECONDS = 3
+SUMMARY_SNAPSHOT = ("summary", DATA_SOURCE)
 
 # --------------------------
 # LOAD DATA
 # --------------------------
 
+def full_summary_query():
+    return dashboard_summary_sql(DATA_SOURCE)
+
+
+def benchmark_query(as_of_start, as_of_end, checkin_start, checkin_end, channel):
+    return dashboard_benchmark_sql(as_of_start, as_of_end, checkin_start, checkin_end, channel, DATA_SOURCE)
+
+
+def availability_month_query(course, year, month):
+    month_start = date(year, month, 1)
+    month_end = date(year, month, calendar.monthrange(year, month)[1])
+    return channel_availability_sql(course, month_start, month_end, source=DATA_SOURCE)
+
+
+def price_history_query():
+    return dashboard_history_sql(DATA_SOURCE)
+
+
+@st.cache_resource
+def get_bundle():
+    """The exported bundle behind DATA_SOURCE == "bundle", opened once"""
+    return Bundle(BUNDLE_DIR)
+
+
 # @st.cache_data(ttl=120)
-@st.cache_data
+@timed_loader()
+@st.cache_resource
+def load_full_summary():
+    """Season summary, typed once and shared read-only by every session.
+
+    Errors propagate so they are not cached; callers show them.
+    """
+    cache_miss()
+    if DATA_SOURCE == "bundle":
+        return get_bundle().summary()
+
+    # client = bigquery.Client.from_service_account_json(
+    #     "golf_credential.json"
+    # )
+
+    query = full_summary_query()
+    return typed(run_query(query, cache_ttl=DISK_CACHE_TTL), "summary")
+
+
+@timed_loader(cached=False)
+def fetch_slot_lifecycle(since=None):
+    """Slot lifecycle aggregates, optionally only from scrapes after `since`."""
+    query = slot_lifecycle_sql(since)
+    # Only the full lifecycle is worth keeping; deltas are fetched once
+    return run_query(query, cache_ttl=DISK_CACHE_TTL if since is None else None)
+
+
+@timed_loader()
+@st.cache_resource
+def get_summary_state():
+    """Process-wide slot lifecycle state behind the incremental refresh."""
+    cache_miss()
+    return IncrementalSummary(fetch_slot_lifecycle())
+
+
+@timed_loader(cached=False)
+def refresh_summary_state():
+    """Folds scrapes newer than the watermark into the shared summary."""
+    return get_summary_state().refresh(lambda watermark: fetch_slot_lifecycle(since=watermark))
+
+
+@timed_loader(cached=False)
 def load_data():
+    # Errors propagate: get_summary_index() would otherwise cache an empty index
+    if not INCREMENTAL_REFRESH or DATA_SOURCE != "raw":
+        return shared_view(load_full_summary())
+    return shared_view(typed(get_summary_state().summary, "summary"))
+
+
+def summary_version():
+    """Changes whenever load_data() would return different rows"""
+    if not INCREMENTAL_REFRESH or DATA_SOURCE != "raw":
+        return 0
+    return get_summary_state().version
+
+
+@timed_loader()
+@st.cache_resource(max_entries=2)
+def get_summary_index(version):
+    """Month and course-month views of load_data(), built once per data version"""
+    cache_miss()
+    index = SummaryIndex(load_data())
+    if SNAPSHOT_STARTUP and not index.summary.empty:
+        save_snapshot(SUMMARY_SNAPSHOT, index.summary)
+    return index
+
+
+def load_summary_index():
+    return get_summary_index(summary_version())
+
+
+@timed_loader()
+@budget_cache(BENCHMARK_CACHE_BYTES, ttl=BENCHMARK_TTL, cost_aware=True)
+def fetch_benchmark_data(as_of_start, as_of_end, checkin_start, checkin_end, channel):
+        cache_miss()
+        if DATA_SOURCE == "bundle":
+            return get_bundle().benchmark((as_of_start, as_of_end, checkin_start, checkin_end, channel))
+        query = benchmark_query(as_of_start, as_of_end, checkin_start, checkin_end, channel)
+        bench_df = typed(run_query(query, cache_ttl=BENCHMARK_TTL), "benchmark")
+        window = (as_of_start, as_of_end, checkin_start, checkin_end, channel)
+        if SNAPSHOT_STARTUP and not bench_df.empty:
+            save_snapshot(benchmark_snapshot(window), bench_df)
+        return bench_df
+
+
+def benchmark_snapshot(window):
+    return ("benchmark", DATA_SOURCE) + tuple(window)
+
+
+def load_benchmark_window(window):
+    """Benchmark rows for a window, from its snapshot until loaded live in this process"""
+    if not SNAPSHOT_STARTUP:
+        return fetch_benchmark_data(*window), None
+    return stale_while_revalidate(benchmark_snapshot(window), lambda: fetch_benchmark_data(*window))
+
+
+@timed_loader(cached=False)
+def load_channel_availability(date_str, course):
+    """Channel availability for one tee date, sliced from the month-wide load"""
+    day = pd.Timestamp(date_str)
     try:
-        # client = bigquery.Client.from_service_account_json(
-        #     "golf_credential.json"
-        # )
-
-        # Then in your load_data() function:
-        client = get_bq_client()
-
-
-        query = f"""
-            WITH normalized AS (
-            SELECT
-                CASE
-                WHEN course_name IN ('thorntree_golf_club','thorntree_country_club')
-                    THEN 'thorntree_golf_club'
-                WHEN course_name IN (
-                    'riverside_golf_club_-_dallas',
-                    'riverside_golf_club',
-                    'riverside_g.c.'
-                ) THEN 'riverside_golf_club_dallas'
-                WHEN course_name IN (
-                    'bear_creek',
-                    'bear_creek_golf_club_-_west',
-                    'bear_creek_golf_club_-_west_course'
-                ) THEN 'bear_creek_golf_club_west'
-                ELSE course_name
-                END AS course_name,
-                source_channel,
-                scrape_timestamp,
-                tee_date,
-                tee_time,
-                price
-            FROM `tee-metrics-golf-tee-time.golf_silver.tee_time_clean`
-            WHERE tee_date >= '2026-02-03'
-            ),
-
-            daily_last_scrape AS (
-            SELECT
-                course_name,
-                source_channel,
-                tee_date,
-                MAX(scrape_timestamp) AS last_scrape_of_day
-            FROM normalized
-            GROUP BY course_name, source_channel, tee_date
-            ),
-
-            slot_lifecycle AS (
-            SELECT
-                n.course_name,
-                n.source_channel,
-                n.tee_date,
-                n.tee_time,
-                MIN(n.scrape_timestamp) AS first_seen_at,
-                MAX(n.scrape_timestamp) AS last_seen_at,
-                COUNT(DISTINCT n.scrape_timestamp) AS scrape_count,
-                AVG(n.price) AS avg_slot_price,
-                MIN(n.price) AS min_slot_price,
-                MAX(n.price) AS max_slot_price
-            FROM normalized n
-            GROUP BY
-                n.course_name,
-                n.source_channel,
-                n.tee_date,
-                n.tee_time
-            ),
-
-            occupancy_labeled AS (
-            SELECT
-                s.*,
-                d.last_scrape_of_day,
-                CASE
-                WHEN s.last_seen_at < d.last_scrape_of_day THEN 'OCCUPIED'
-                ELSE 'STILL_AVAILABLE'
-                END AS occupancy_status,
-                TIMESTAMP_DIFF(
-                s.last_seen_at,
-                s.first_seen_at,
-                MINUTE
-                ) AS minutes_available
-            FROM slot_lifecycle s
-            JOIN daily_last_scrape d
-                ON s.course_name = d.course_name
-            AND s.source_channel = d.source_channel
-            AND s.tee_date = d.tee_date
-            ),
-
-            daily_course_summary AS (
-            SELECT
-                course_name,
-                source_channel,
-                tee_date,
-
-                COUNT(*) AS total_slots,
-                SUM(IF(occupancy_status = 'OCCUPIED', 1, 0)) AS occupied_slots,
-
-                ROUND(
-                100 * SAFE_DIVIDE(
-                    SUM(IF(occupancy_status = 'OCCUPIED', 1, 0)),
-                    COUNT(*)
-                ),
-                2
-                ) AS occupancy_percent,
-
-                ROUND(AVG(minutes_available), 1) AS avg_minutes_available,
-                ROUND(AVG(avg_slot_price), 2) AS average_price,
-
-                MIN(min_slot_price) AS min_price,
-                MAX(max_slot_price) AS max_price
-
-            FROM occupancy_labeled
-            GROUP BY course_name, source_channel, tee_date
-            ),
-
-            market_summary AS (
-            SELECT
-                tee_date,
-                MIN(average_price) AS market_min_price,
-                AVG(average_price) AS market_avg_price,
-                MAX(average_price) AS market_max_price
-            FROM daily_course_summary
-            GROUP BY tee_date
-            )
+        month_availability = load_channel_availability_month(course, day.year, day.month)
+    except Exception as e:
+        st.error(f"Error loading availability: {str(e)}")
+        return pd.DataFrame()
+    if month_availability.empty:
+        return month_availability
+    return month_availability[
+        month_availability["tee_date"] == day
+    ].reset_index(drop=True)
 
-            SELECT
-            d.*,
-
-            m.market_min_price,
-            ROUND(m.market_avg_price, 2) AS market_avg_price,
-            m.market_max_price,
-
-            ROUND(
-                SAFE_DIVIDE(
-                d.average_price - m.market_avg_price,
-                m.market_avg_price
-                ) * 100,
-                2
-            ) AS price_gap_percent,
-
-            CASE
-                WHEN d.average_price >= m.market_max_price THEN 'HIGHEST_IN_MARKET'
-                WHEN d.average_price <= m.market_min_price THEN 'LOWEST_IN_MARKET'
-                WHEN d.average_price < m.market_avg_price THEN 'BELOW_AVERAGE'
-                WHEN d.average_price = m.market_avg_price THEN 'MARKET_AVERAGE'
-                ELSE 'ABOVE_AVERAGE'
-            END AS price_position_flag,
-
-            CASE
-                WHEN d.occupancy_percent >= 90 THEN 'HIGH_DEMAND'
-                WHEN d.occupancy_percent >= 60 THEN 'MEDIUM_DEMAND'
-                ELSE 'LOW_DEMAND'
-            END AS demand_pressure,
-
-            ROUND(
-                SAFE_DIVIDE(d.occupancy_percent, d.average_price),
-                4
-            ) AS revenue_efficiency_score
-
-            FROM daily_course_summary d
-            JOIN market_summary m
-            USING (tee_date)
-
-            ORDER BY tee_date, course_name;
-        """
-        return client.query(query).to_dataframe()
+# @st.cache_data(ttl=60)
+@timed_loader()
+@budget_cache(AVAILABILITY_CACHE_BYTES)
+def load_channel_availability_month(course, year, month):
+    """Load channel availability with lifecycle tracking for every tee date of a month.
+
+    Errors propagate so a failed month is not cached; load_channel_availability() shows them.
+    """
+    cache_miss()
+    # client = bigquery.Client.from_service_account_json(
+    #     "D:\\Aman\\Web Scraping\\Golf Rateshop\\golf_credential.json"
+    # )
+
+    if DATA_SOURCE == "bundle":
+        return get_bundle().availability(course, year, month)
+    if INCREMENTAL_REFRESH and DATA_SOURCE == "raw":
+        # Derived from the shared slot lifecycle, without a query
+        month_start = date(year, month, 1)
+        month_end = date(year, month, calendar.monthrange(year, month)[1])
+        availability = get_summary_state().channel_availability(course, month_start, month_end)
+        return typed(availability, "availability")
+    query = availability_month_query(course, year, month)
+
+    return typed(run_query(query, cache_ttl=DISK_CACHE_TTL), "availability")
+
+@timed_loader()
+@st.cache_resource
+def fetch_price_history():
+    """Average price per course and tee date for the whole season, in one query"""
+    cache_miss()
+    if DATA_SOURCE == "bundle":
+        return get_bundle().history()
+    query = price_history_query()
+    return typed(run_query(query, cache_ttl=DISK_CACHE_TTL), "history")
+
+@timed_loader(cached=False)
+def load_price_history():
+    """The season-wide price series behind every history chart"""
+    if INCREMENTAL_REFRESH and DATA_SOURCE == "raw":
+        return shared_view(get_summary_state().history)
+    return shared_view(fetch_price_history())
+
+@timed_loader(cached=False)
+def load_history_chart(date_str):
+    """Rate shop history up to date_str, sliced from the season-wide price series"""
+    try:
+        history = load_price_history()
     except Exception as e:
-        st.error(f"Error loading data: {str(e)}")
+        st.error(f"Error loading history: {str(e)}")
         return pd.DataFrame()
+    if history.empty:
+        return history
+    return history[
+        history["tee_date"] <= pd.Timestamp(date_str)
+    ].reset_index(drop=True)
+
+
+@st.cache_resource
+def pace_cube_built():
+    """Set once get_pace_cube() has built the cube in this process"""
+    return threading.Event()
+
+
+@timed_loader()
+@st.cache_resource
+def get_pace_cube():
+    """Process-wide booking pace cube behind the tile modal's pace tab"""
+    cache_miss()
+    if DATA_SOURCE == "bundle":
+        cube = PaceCube(get_bundle().pace_rollup())
+    else:
+        query = dashboard_pace_sql(source=DATA_SOURCE)
+        cube = PaceCube(typed(run_query(query, cache_ttl=DISK_CACHE_TTL), "pace"))
+    pace_cube_built().set()
+    return cube
 
 
-@st.cache_data(ttl=300)
-def fetch_benchmark_data(as_of_start, as_of_end, checkin_start, checkin_end, channel):
-        client = get_bq_client()
-        query = f"""
-        WITH normalized AS (
-            SELECT
-                CASE
-                    WHEN course_name IN ('thorntree_golf_club','thorntree_country_club')
-                        THEN 'thorntree_golf_club'
-                    WHEN course_name IN (
-                        'riverside_golf_club_-_dallas',
-                        'riverside_golf_club',
-                        'riverside_g.c.'
-                    ) THEN 'riverside_golf_club_dallas'
-                    WHEN course_name IN (
-                        'bear_creek',
-                        'bear_creek_golf_club_-_west',
-                        'bear_creek_golf_club_-_west_course'
-                    ) THEN 'bear_creek_golf_club_west'
-                    ELSE course_name
-                END AS course_name,
-                source_channel,
-                DATE(scrape_timestamp) AS as_of_date,
-                DATE(tee_date) AS tee_date,
-                tee_time,
-                price,
-                scrape_timestamp
-            FROM `{PROJECT_ID}.golf_silver.tee_time_clean`
-            WHERE DATE(scrape_timestamp) BETWEEN DATE('{as_of_start}')
-                                                                     AND DATE('{as_of_end}')
-                AND DATE(tee_date) BETWEEN DATE('{checkin_start}')
-                                                             AND DATE('{checkin_end}')
-                AND ('{channel}' = 'ALL' OR source_channel = '{channel}')
-        ),
-        daily_last_scrape AS (
-            SELECT
-                course_name,
-                source_channel,
-                as_of_date,
-                tee_date,
-                MAX(scrape_timestamp) AS last_scrape_of_day
-            FROM normalized
-            GROUP BY course_name, source_channel, as_of_date, tee_date
-        ),
-        slot_lifecycle AS (
-            SELECT
-                n.course_name,
-                n.source_channel,
-                n.as_of_date,
-                n.tee_date,
-                n.tee_time,
-                MIN(n.scrape_timestamp) AS first_seen_at,
-                MAX(n.scrape_timestamp) AS last_seen_at,
-                AVG(n.price) AS avg_slot_price
-            FROM normalized n
-            GROUP BY n.course_name, n.source_channel, n.as_of_date, n.tee_date, n.tee_time
-        ),
-        occupancy_labeled AS (
-            SELECT
-                s.course_name,
-                s.source_channel,
-                s.as_of_date,
-                s.tee_date,
-                s.avg_slot_price,
-                CASE
-                    WHEN s.last_seen_at < d.last_scrape_of_day THEN 1
-                    ELSE 0
-                END AS occupied_flag
-            FROM slot_lifecycle s
-            JOIN daily_last_scrape d
-                ON s.course_name = d.course_name
-             AND s.source_channel = d.source_channel
-             AND s.as_of_date = d.as_of_date
-             AND s.tee_date = d.tee_date
-        ),
-        daily_summary AS (
-            SELECT
-                as_of_date,
-                tee_date,
-                course_name,
-                ROUND(AVG(avg_slot_price),0) AS avg_price,
-                ROUND(100 * SAFE_DIVIDE(SUM(occupied_flag), COUNT(*)),0) AS occ_percent
-            FROM occupancy_labeled
-            GROUP BY as_of_date, tee_date, course_name
-        ),
-        market_summary AS (
-            SELECT
-                as_of_date,
-                tee_date,
-                MIN(avg_price) AS market_min,
-                MAX(avg_price) AS market_max,
-                ROUND(AVG(avg_price),0) AS market_avg
-            FROM daily_summary
-            GROUP BY as_of_date, tee_date
-        )
-        SELECT
-            d.as_of_date,
-            d.tee_date,
-            d.course_name,
-            d.avg_price,
-            d.occ_percent,
-            m.market_avg,
-            m.market_min,
-            m.market_max
-        FROM daily_summary d
-        JOIN market_summary m
-            ON d.as_of_date = m.as_of_date
-         AND d.tee_date = m.tee_date
-        ORDER BY as_of_date, tee_date, avg_price
-        """
-        return client.query(query).to_dataframe()
-
-
-def build_benchmark_header(checkin_dates):
-        header_cells = ["AS OF DATE"] + [pd.to_datetime(d).strftime("%m/%d") for d in checkin_dates] + ["HIGH", "LOW"]
-        th_cells = "".join([f"<th class='bench-th'>{c}</th>" for c in header_cells])
-        return f"""
-        <table class='bench-table'>
-            <thead>
-                <tr>{th_cells}</tr>
-            </thead>
-        </table>
-        """
-
-
-def build_benchmark_row_html(as_of_df, property_selected, as_of_value, checkin_dates):
-        self_df = as_of_df[as_of_df["course_name"] == property_selected]
-        if self_df.empty:
-                return ""
-
-        rank_df = as_of_df.copy()
-        rank_df["rank_high"] = rank_df.groupby("tee_date")["avg_price"] \
-                .rank(method="min", ascending=False)
-        rank_df["rank_low"] = rank_df.groupby("tee_date")["avg_price"] \
-                .rank(method="min", ascending=True)
-        self_rank = rank_df[rank_df["course_name"] == property_selected]
-        high_count = int((self_rank["rank_high"] == 1).sum())
-        low_count = int((self_rank["rank_low"] == 1).sum())
-
-        cells_html = []
-        as_of_label = pd.to_datetime(as_of_value).strftime("%m/%d")
-        cells_html.append(f"<td class='bench-td bench-date'>{as_of_label}</td>")
-
-        for d in checkin_dates:
-                cell_df = self_df[self_df["tee_date"] == d]
-                self_val = cell_df["avg_price"].mean()
-                market_val = cell_df["market_avg"].mean()
-                if pd.isna(self_val) and pd.isna(market_val):
-                        cell = ""
-                else:
-                        self_text = f"${self_val:.0f}" if pd.notna(self_val) else ""
-                        market_text = f"${market_val:.0f}" if pd.notna(market_val) else ""
-                        if pd.notna(self_val) and pd.notna(market_val):
-                                self_color = "#22c55e" if self_val <= market_val else "#ef4444"
-                        else:
-                                self_color = "#9ca3af"
-                        cell = (
-                                f"<div class='bench-top' style='color:{self_color};'>{self_text}</div>"
-                                f"<div class='bench-bottom'>{market_text}</div>"
-                        )
-                cells_html.append(f"<td class='bench-td bench-price'>{cell}</td>")
-
-        cells_html.append(f"<td class='bench-td bench-meta'>{high_count}</td>")
-        cells_html.append(f"<td class='bench-td bench-meta'>{low_count}</td>")
-
-        row_html = "".join(cells_html)
-        return f"""
-        <table class='bench-table'>
-            <tbody>
-                <tr>{row_html}</tr>
-            </tbody>
-        </table>
-        """
+@timed_loader(cached=False)
+def refresh_pace_cube():
+    """Folds the as-of dates since the last one held into the shared pace cube"""
+    return get_pace_cube().refresh(
+        lambda since: typed(run_query(dashboard_pace_sql(since, DATA_SOURCE)), "pace")
+    )
+
+
+@timed_loader(cached=False)
+def load_pace(course, date_str, channel):
+    """A tee date's booking pace beside the same lead times a week earlier"""
+    try:
+        return get_pace_cube().same_lead(course, date_str, channel)
+    except Exception as e:
+        st.error(f"Error loading booking pace: {str(e)}")
+        return pd.DataFrame()
+
+
+# --------------------------
+# SCOPED REFRESH
+# --------------------------
+
+def refresh_course_month(course, year, month):
+    """Re-fetches what the Rate Shop screen shows for one course and month.
+
+    Other courses, months and benchmark windows stay cached for everyone.
+    """
+    if INCREMENTAL_REFRESH and DATA_SOURCE == "raw":
+        # Summary and history come from the shared state; fold in new scrapes
+        refresh_summary_state()
+    else:
+        if DATA_SOURCE == "bundle":
+            # Pick up a newer export
+            get_bundle.clear()
+        forget_query(full_summary_query())
+        load_full_summary.clear()
+        get_summary_index.clear()
+        forget_query(price_history_query())
+        fetch_price_history.clear()
+    forget_query(availability_month_query(course, year, month))
+    load_channel_availability_month.clear(course, year, month)
+    # The pace cube is built on the first open of the pace tab, not here
+    if DATA_SOURCE == "bundle":
+        pace_cube_built().clear()
+        get_pace_cube.clear()
+    elif pace_cube_built().is_set():
+        refresh_pace_cube()
+
+
+def refresh_benchmark_window(as_of_start, as_of_end, checkin_start, checkin_end, channel):
+    """Re-fetches one benchmark window; other windows stay cached"""
+    forget_query(benchmark_query(as_of_start, as_of_end, checkin_start, checkin_end, channel))
+    fetch_benchmark_data.clear(as_of_start, as_of_end, checkin_start, checkin_end, channel)
 
 
 def build_benchmark_price_trend_chart(as_of_df, property_selected):
-        chart_df = as_of_df[as_of_df["course_name"] == property_selected].copy()
-        chart_df["tee_date"] = pd.to_datetime(chart_df["tee_date"])
-        base = alt.Chart(chart_df).encode(
-                x=alt.X("tee_date:T", title="Check-in Date")
-        )
-        whisker = base.mark_rule(
-                color="white",
-                strokeWidth=2
-        ).encode(
-                y="market_min:Q",
-                y2="market_max:Q"
-        )
-        top_cap = base.mark_tick(
-                color="white",
-                thickness=2,
-                size=20
-        ).encode(
-                y="market_max:Q"
-        )
-        bottom_cap = base.mark_tick(
-                color="white",
-                thickness=2,
-                size=20
-        ).encode(
-                y="market_min:Q"
-        )
-        market_line = base.mark_line(
-                color="white",
-                strokeWidth=2
-        ).encode(
-                y="market_avg:Q"
-        )
-        market_points = base.mark_circle(
-                color="white",
-                size=60
-        ).encode(
-                y="market_avg:Q"
-        )
-        self_line = base.mark_line(
-                color="#22c55e",
-                strokeWidth=3
-        ).encode(
-                y="avg_price:Q"
-        )
-        self_points = base.mark_circle(
-                color="#22c55e",
-                size=80
-        ).encode(
-                y="avg_price:Q",
-                tooltip=[
-                        alt.Tooltip("tee_date:T", title="Date"),
-                        alt.Tooltip("avg_price:Q", title="Self", format="$,.0f"),
-                        alt.Tooltip("market_avg:Q", title="Avg", format="$,.0f"),
-                        alt.Tooltip("market_min:Q", title="Min", format="$,.0f"),
-                        alt.Tooltip("market_max:Q", title="Max", format="$,.0f"),
-                ]
-        )
-        chart = (
-                whisker
-                + top_cap
-                + bottom_cap
-                + market_line
-                + market_points
-                + self_line
-                + self_points
-        ).properties(height=420)
-        st.altair_chart(chart, use_container_width=True)
+        from rate_shop_charts import price_trend_chart
+
+        chart_df = as_of_df[as_of_df["course_name"] == property_selected]
+        st.altair_chart(price_trend_chart(chart_df), use_container_width=True)
 
 
 def build_benchmark_competitor_matrix(as_of_df, property_selected):
         comp_matrix = as_of_df.pivot_table(
                 index="course_name",
                 columns="tee_date",
-                values="avg_price"
+                values="avg_price",
+                observed=True
         )
         comp_matrix = comp_matrix.reindex(COURSES)
         comp_matrix.columns = [
@@ -733,7 +394,90 @@ def build_benchmark_competitor_matrix(as_of_df, property_selected):
         comp_matrix = comp_matrix.loc[ordered_courses]
         st.dataframe(comp_matrix, use_container_width=True)
 
-df = load_data()
+
+@st.fragment
+def show_benchmark_details(bench_df, property_selected, as_of_dates):
+        """Chart or competitor matrix for one as-of date, built only when asked for"""
+        col1, col2 = st.columns([1, 2])
+        with col1:
+                as_of_value = st.selectbox(
+                        "Details for",
+                        [None] + list(as_of_dates),
+                        format_func=lambda d: "—" if d is None else pd.to_datetime(d).strftime("%Y/%m/%d"),
+                        key="bench_detail_as_of"
+                )
+        with col2:
+                view = st.radio(
+                        "View",
+                        ["Price Trend", "Competitor Data"],
+                        horizontal=True,
+                        key="bench_detail_view"
+                )
+        if as_of_value is None:
+                return
+
+        as_of_df = bench_df[bench_df["as_of_date"] == as_of_value]
+        if view == "Price Trend":
+                build_benchmark_price_trend_chart(as_of_df, property_selected)
+        else:
+                build_benchmark_competitor_matrix(as_of_df, property_selected)
+
+@st.fragment(run_every=SNAPSHOT_POLL_SECONDS)
+def swap_in_live_data(name):
+    """Reruns the app once the background load behind a snapshot lands"""
+    if not pending(name):
+        st.rerun(scope="app")
+
+
+def show_staleness(stale, name):
+    """Labels a page drawn from a snapshot with the snapshot's age"""
+    if stale is None:
+        return
+    if stale.pending:
+        st.caption(f"⏳ Showing data from {age_label(stale.saved_at)} while live data loads.")
+        swap_in_live_data(name)
+    else:
+        st.warning(
+            f"Live data is unavailable ({stale.error}); showing data from {age_label(stale.saved_at)}."
+        )
+
+
+summary_stale = None
+
+if SNAPSHOT_STARTUP:
+    # Start the default benchmark window alongside the summary
+    if "startup_loaded" not in st.session_state:
+        revalidate(
+            benchmark_snapshot(DEFAULT_BENCHMARK_WINDOW),
+            lambda: fetch_benchmark_data(*DEFAULT_BENCHMARK_WINDOW),
+        )
+        st.session_state.startup_loaded = True
+    try:
+        summary_index, summary_stale = stale_while_revalidate(
+            SUMMARY_SNAPSHOT,
+            load_summary_index,
+            frame_of=lambda index: index.summary,
+            from_frame=SummaryIndex,
+        )
+    except Exception as e:
+        st.error(f"Error loading data: {str(e)}")
+        summary_index = SummaryIndex(pd.DataFrame())
+else:
+    try:
+        if "startup_loaded" not in st.session_state:
+            # A session's first run submits the summary and the default benchmark
+            # window together, so it waits for the slower query instead of both
+            summary_index, _ = gather([
+                (load_summary_index, ()),
+                (fetch_benchmark_data, DEFAULT_BENCHMARK_WINDOW),
+            ])
+            st.session_state.startup_loaded = True
+        else:
+            summary_index = load_summary_index()
+    except Exception as e:
+        st.error(f"Error loading data: {str(e)}")
+        summary_index = SummaryIndex(pd.DataFrame())
+df = summary_index.summary
 
 if df.empty:
     st.error("No data available. Please check your credentials.")
@@ -753,6 +497,29 @@ if "tile_modal_date" not in st.session_state:
 # SIDEBAR CONTROLS
 # --------------------------
 
+@st.fragment
+def show_diagnostics_panel():
+    """Loader timings, BigQuery job stats and cache hits recorded by this process"""
+    st.button("↻ Update", key="diagnostics_update")
+    calls = recent_calls()
+    if not calls:
+        st.caption("No loader calls recorded yet.")
+        return
+    st.markdown("**Per loader**")
+    st.dataframe(loader_summary(calls), hide_index=True, use_container_width=True)
+    st.markdown("**In-memory caches**")
+    st.dataframe(cache_stats(), hide_index=True, use_container_width=True)
+    st.markdown("**Loaded frames**")
+    st.dataframe(memory_report(), hide_index=True, use_container_width=True)
+    st.markdown("**Latest calls**")
+    latest = calls_frame(calls[-20:][::-1])
+    st.dataframe(
+        latest[["loader", "cache", "wall_ms", "rows", "queries", "bytes_processed",
+                "bytes_billed", "slot_ms", "job_ids", "error"]],
+        hide_index=True,
+        use_container_width=True
+    )
+
 with st.sidebar:
     st.markdown("### ⚙️ Controls")
 
@@ -761,12 +528,8 @@ with st.sidebar:
         ["Rate Shop", "Benchmarking"]
     )
 
-    if st.button("🔄 Refresh Data"):
-        st.cache_data.clear()
-        st.rerun()
-
     if screen == "Rate Shop":
-        courses = sorted(df["course_name"].unique())
+        courses = summary_index.courses
         selected_course = st.selectbox(
             "Select Your Course",
             courses,
@@ -791,6 +554,23 @@ with st.sidebar:
 
         selected_month = datetime(selected_year, selected_month_num, 1)
 
+        prefetch_tiles = st.checkbox(
+            "⚡ Prefetch tile analytics",
+            value=False,
+            help="Loads Analytics data for the visible month in the background."
+        )
+
+        if st.button("🔄 Refresh this month"):
+            try:
+                refresh_course_month(selected_course, selected_year, selected_month_num)
+            except Exception as e:
+                st.error(f"Error refreshing data: {str(e)}")
+            else:
+                st.rerun()
+
+    if st.checkbox("🩺 Diagnostics", value=False, help="Loader timings, bytes scanned and cache hits."):
+        show_diagnostics_panel()
+
 if screen == "Benchmarking":
     st.title("🏌️ Golf Benchmarking")
 
@@ -804,12 +584,12 @@ if screen == "Benchmarking":
     with col2:
         as_of_range = st.date_input(
             "As of Dates",
-            (date(2026, 2, 18), date(2026, 2, 24))
+            DEFAULT_AS_OF_RANGE
         )
     with col3:
         checkin_range = st.date_input(
             "Check-In Dates",
-            (date(2026, 2, 18), date(2026, 3, 4))
+            DEFAULT_CHECKIN_RANGE
         )
     with col4:
         channel = st.selectbox(
@@ -824,43 +604,35 @@ if screen == "Benchmarking":
         as_of_start = as_of_range
         as_of_end = as_of_range
 
-    bench_df = fetch_benchmark_data(as_of_start, as_of_end, checkin_start, checkin_end, channel)
+    if st.sidebar.button("🔄 Refresh this window"):
+        refresh_benchmark_window(as_of_start, as_of_end, checkin_start, checkin_end, channel)
+
+    window = (as_of_start, as_of_end, checkin_start, checkin_end, channel)
+    try:
+        bench_df, bench_stale = load_benchmark_window(window)
+    except Exception as e:
+        st.error(f"Error loading benchmark data: {str(e)}")
+        st.stop()
+    show_staleness(bench_stale, benchmark_snapshot(window))
     if bench_df.empty:
         st.warning("No data found.")
         st.stop()
 
     st.subheader("Benchmarking by As-Of Date")
+    page_dates, page_count = page_as_of_dates(bench_df, 1, BENCHMARK_PAGE_SIZE)
+    if page_count > 1:
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+        page_dates, page_count = page_as_of_dates(bench_df, page, BENCHMARK_PAGE_SIZE)
+        st.caption(f"Page {page} of {page_count}")
+
     st.markdown(
-        """
-        <style>
-          .bench-table { width: 100%; border-collapse: collapse; table-layout: fixed; }
-          .bench-th, .bench-td { border: 1px solid #2a2f3a; padding: 8px 6px; text-align: center; font-size: 12px; }
-          .bench-th { background: #1f2937; color: #e5e7eb; font-weight: 600; }
-          .bench-date { text-align: left; font-weight: 600; color: #e5e7eb; background: #111827; }
-          .bench-price { background: #0f172a; }
-          .bench-top { font-weight: 700; line-height: 1.1; }
-          .bench-bottom { color: #e5e7eb; opacity: 0.9; line-height: 1.1; }
-          .bench-meta { background: #111827; color: #e5e7eb; font-weight: 600; }
-        </style>
-        """,
+        BENCHMARK_CSS + build_benchmark_table_html(bench_df, property_selected, page_dates),
         unsafe_allow_html=True
     )
 
-    as_of_dates = sorted(bench_df["as_of_date"].unique(), reverse=True)
-    checkin_dates = sorted(bench_df["tee_date"].unique())
-    st.markdown(build_benchmark_header(checkin_dates), unsafe_allow_html=True)
-
-    for as_of_value in as_of_dates:
-        as_of_df = bench_df[bench_df["as_of_date"] == as_of_value]
-        label = pd.to_datetime(as_of_value).strftime("%Y/%m/%d")
-        row_html = build_benchmark_row_html(as_of_df, property_selected, as_of_value, checkin_dates)
-        if row_html:
-            st.markdown(row_html, unsafe_allow_html=True)
-        with st.expander(f"Details for {label}", expanded=False):
-            st.markdown("**Price Trend**")
-            build_benchmark_price_trend_chart(as_of_df, property_selected)
-            with st.expander("Show Competitor Data", expanded=False):
-                build_benchmark_competitor_matrix(as_of_df, property_selected)
+    # Detail views are built for one as-of date at a time, inside a fragment,
+    # so they neither grow with the as-of window nor rerun the whole screen
+    show_benchmark_details(bench_df, property_selected, page_dates)
 
     st.stop()
 
@@ -868,19 +640,17 @@ if screen == "Benchmarking":
 # DATA FILTERING
 # --------------------------
 
-df["tee_date"] = pd.to_datetime(df["tee_date"])
 year = selected_month.year
 month = selected_month.month
 
-month_df = df[
-    (df["tee_date"].dt.month == month) &
-    (df["tee_date"].dt.year == year)
-]
+# Month and course views come from the index built once per data load
+month_df = summary_index.month(year, month)
 
 # Select a single, consistent row per date for the chosen course
 # Prioritize brand channel, otherwise take lowest price
-my_df_raw = month_df[month_df["course_name"] == selected_course]
+my_df = summary_index.preferred_rows(selected_course, year, month)
 
+# my_df_raw = summary_index.course_month(selected_course, year, month)
 # # Debug: Show what we're working with
 # if not my_df_raw.empty and selected_course == "coyote_ridge_golf_club":
 #     st.sidebar.write("**Debug Info:**")
@@ -889,32 +659,10 @@ my_df_raw = month_df[month_df["course_name"] == selected_course]
 #         debug_rows = my_df_raw[my_df_raw["tee_date"] == debug_date][["tee_date", "source_channel", "average_price", "price_position_flag"]]
 #         st.sidebar.dataframe(debug_rows, hide_index=True)
 
-my_df = (
-    my_df_raw
-    .assign(channel_priority=lambda x: x["source_channel"].map({"brand": 0}).fillna(1))
-    .sort_values(["tee_date", "channel_priority", "average_price", "source_channel"])
-    .groupby("tee_date", as_index=False)
-    .first()
-    .drop(columns=["channel_priority"])
-)
-
 # --------------------------
 # COLOR & STYLING FUNCTIONS
 # --------------------------
 
-def get_color(flag):
-    # Flag color mapping used by the UI. Keep this constant near the color helper
-    # so contributors can quickly see which flag maps to which color.
-    FLAG_COLORS = {
-        "LOWEST_IN_MARKET": "#10b981",
-        "BELOW_AVERAGE": "#06b6d4",
-        "MARKET_AVERAGE": "#f59e0b",
-        "ABOVE_AVERAGE": "#f97316",
-        "HIGHEST_IN_MARKET": "#ef4444",
-    }
-
-    return FLAG_COLORS.get(flag, "#6b7280")
-
 def get_demand_opacity(occupancy):
     """Returns opacity based on demand intensity"""
     if occupancy >= 90:
@@ -928,17 +676,6 @@ def get_demand_opacity(occupancy):
     else:
         return 0.4
 
-def get_sell_speed_icon(minutes_available):
-    """Returns icon based on how quickly slots are selling"""
-    if minutes_available is None or minutes_available < 0:
-        return "❄️"
-    elif minutes_available >= 240:
-        return "🐢"
-    elif minutes_available >= 60:
-        return "⚡"
-    else:
-        return "🔥"
-
 # --------------------------
 # PAGE HEADER
 # --------------------------
@@ -947,6 +684,7 @@ col1, col2 = st.columns([3, 1])
 with col1:
     st.markdown(f"# 🏌️ Golf Rate Shop")
     st.markdown(f"**{selected_month.strftime('%B %Y')}** • Course: **{selected_course.replace('_', ' ').title()}**")
+    show_staleness(summary_stale, SUMMARY_SNAPSHOT)
     # Quick visual legend for price-position flags
     st.markdown(
             """
@@ -987,86 +725,16 @@ st.markdown("---")
 # CALENDAR GRID
 # --------------------------
 
-cal = calendar.monthcalendar(year, month)
-
-# Day headers
-day_cols = st.columns(7)
-days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-for i, day in enumerate(days):
-    with day_cols[i]:
-        st.markdown(f"<p style='text-align:center; color:#999; font-weight:600; font-size:0.9em;'>{day}</p>", unsafe_allow_html=True)
-
-# Calendar tiles
-for week in cal:
-    cols = st.columns(7, gap="small")
-    for i, day in enumerate(week):
-        with cols[i]:
-            if day == 0:
-                st.empty()
-            else:
-                day_date = datetime(year, month, day)
-                row = my_df[my_df["tee_date"] == pd.Timestamp(day_date)]
-
-                if not row.empty:
-                    try:
-                        price = row["average_price"].values[0]
-                        flag = row["price_position_flag"].values[0]
-                        occupancy = row["occupancy_percent"].values[0]
-                        gap = row["price_gap_percent"].values[0]
-                        minutes_available = row["avg_minutes_available"].values[0]
-                        market_avg = row["market_avg_price"].values[0]
-
-                        color = get_color(flag)
-                        icon = get_sell_speed_icon(minutes_available)
-                        gap_color = "#10b981" if gap < 0 else "#ef4444"
-
-                        badge_style = f"""
-                            background:{gap_color};
-                            color:white;
-                            padding:3px 8px;
-                            border-radius:6px;
-                            font-size:0.7em;
-                            font-weight:700;
-                        """
-
-                        tile_html = f"""
-                            <div style="
-                                background-color:{color};
-                                padding:14px;
-                                border-radius:14px;
-                                text-align:center;
-                                transition: all 0.3s cubic-bezier(0.34, 1.56, 0.64, 1);
-                                cursor:pointer;
-                                border: 2px solid rgba(255,255,255,0.1);
-                                min-height:100px;
-                                display:flex;
-                                flex-direction:column;
-                                justify-content:center;
-                                align-items:center;
-                                color:white;
-                            "
-                            onmouseover="this.style.transform='translateY(-6px) scale(1.05)'; this.style.boxShadow='0 12px 30px rgba(0,0,0,0.3)'"
-                            onmouseout="this.style.transform='translateY(0) scale(1)'; this.style.boxShadow='none'"
-                            title="Market Avg: ${market_avg:.0f} | Gap: {gap:.1f}%"
-                            >
-                                <div style="font-size:0.85em; opacity:0.9; margin-bottom:4px; font-weight:600;">{day}</div>
-                                <div style="font-size:1.6em; margin:6px 0; font-weight:700;">${price:.0f}</div>
-                                <div style="{badge_style}">{gap:+.1f}%</div>
-                                <div style="font-size:0.8em; margin-top:6px; opacity:0.85;">{occupancy:.0f}% {icon}</div>
-                            </div>
-                        """
-                        st.markdown(tile_html, unsafe_allow_html=True)
-
-                        # Add clickable button for tile modal with distinct label
-                        if st.button("📊 Analytics", key=f"tile_open_{day}", use_container_width=True):
-                            st.session_state.tile_modal_date = day_date
-
-                        if st.button("View Details", key=f"btn_{day}", use_container_width=True):
-                            st.session_state.selected_date = day_date
-                    except Exception as e:
-                        st.warning(f"Error rendering day {day}: {str(e)}")
-                else:
-                    st.empty()
+# Every tile is computed in one pass over my_df and the whole month is drawn
+# as a single HTML block; a tile link click comes back within this session
+tiles = build_tile_model(my_df)
+picked = calendar_grid(tiles, year, month, key="calendar_grid")
+if picked is not None:
+    picked_date, picked_view = picked
+    if picked_view == VIEW_ANALYTICS:
+        st.session_state.tile_modal_date = picked_date
+    else:
+        st.session_state.selected_date = picked_date
 
 # ================================
 # NEW TILE POPUP MODAL
@@ -1075,9 +743,16 @@ for week in cal:
 @st.dialog("📊 Rate Shop Analytics", width="large")
 def show_tile_modal(selected_date, selected_course, month_df):
     """Display analytics modal for selected date"""
+
+    # Both tabs' queries are independent; run them together
+    date_str = selected_date.strftime('%Y-%m-%d')
+    availability_df, history_df = gather([
+        (load_channel_availability, (date_str, selected_course)),
+        (load_history_chart, (date_str,)),
+    ])
     
     # Tabs
-    tab1, tab2 = st.tabs(["📊 Summary", "📈 RateShop History Chart"])
+    tab1, tab2, tab3 = st.tabs(["📊 Summary", "📈 RateShop History Chart", "⏱️ Booking Pace"])
     
     # TAB 1: SUMMARY
     with tab1:
@@ -1127,11 +802,6 @@ def show_tile_modal(selected_date, selected_course, month_df):
         
         st.markdown(f"### ⛳ {filter_label[current_filter]}")
 
-        availability_df = load_channel_availability(
-            selected_date.strftime('%Y-%m-%d'),
-            selected_course
-        )
-
         if not availability_df.empty:
             # Select and format columns for display
             display_df = availability_df[[
@@ -1145,7 +815,7 @@ def show_tile_modal(selected_date, selected_course, month_df):
                 'supremegolf_current_price',
                 'supremegolf_availability_status',
                 'overall_availability_status'
-            ]].copy()
+            ]]
             
             # Apply filter based on current selection
             if current_filter == "occupied":
@@ -1184,8 +854,6 @@ def show_tile_modal(selected_date, selected_course, month_df):
     # TAB 2: RATESHOP HISTORY CHART
     with tab2:
         st.markdown("### 📈 Price Trend by Lead Time")
-        
-        history_df = load_history_chart(selected_date.strftime('%Y-%m-%d'))
 
         if not history_df.empty:
             course_options = sorted(history_df["course_name"].unique().tolist())
@@ -1199,86 +867,13 @@ def show_tile_modal(selected_date, selected_course, month_df):
             if not selected_courses:
                 st.info("Select at least one course to show the chart.")
             else:
-                chart_df = history_df[
-                    history_df["course_name"].isin(selected_courses)
-                ].copy()
-                chart_df["tee_date"] = pd.to_datetime(chart_df["tee_date"])
-                chart_df["course_label"] = chart_df["course_name"].where(
-                    chart_df["course_name"] != selected_course,
-                    "self"
-                )
-                chart_df["date_label"] = chart_df["tee_date"].dt.strftime("%A %b %d")
-
-                pivot_df = (
-                    chart_df.pivot(
-                        index="tee_date",
-                        columns="course_label",
-                        values="avg_price"
-                    )
-                    .reset_index()
-                    .sort_values("tee_date", ascending=False)
-                )
-                pivot_df["date_label"] = pivot_df["tee_date"].dt.strftime("%A %b %d")
-
-                course_cols = [
-                    c for c in pivot_df.columns
-                    if c not in ("tee_date", "date_label")
-                ]
-                course_cols_sorted = sorted(course_cols)
-                if "self" in course_cols_sorted:
-                    course_cols_sorted.remove("self")
-                    course_cols_sorted = ["self"] + course_cols_sorted
-
-                tooltip_course_cols = course_cols_sorted[:7]
-                tooltip_fields = [
-                    alt.Tooltip("date_label:N", title="Date")
-                ]
-                for col in tooltip_course_cols:
-                    tooltip_fields.append(
-                        alt.Tooltip(f"{col}:Q", title=col, format="$.2f")
-                    )
-
-                legend_order = course_cols_sorted
-
-                # Merge pivot data into chart_df for tooltip access
-                chart_df_with_tooltip = chart_df.merge(
-                    pivot_df[["tee_date", "date_label"] + tooltip_course_cols],
-                    on="tee_date",
-                    how="left"
+                chart_df_with_tooltip, legend_order, tooltip_course_cols = build_history_chart_frame(
+                    history_df, selected_courses, selected_course
                 )
 
-                # Build tooltip fields
-                tooltip_fields_list = [
-                    alt.Tooltip("date_label_y:N", title="Date")
-                ]
-                for col in tooltip_course_cols:
-                    tooltip_fields_list.append(
-                        alt.Tooltip(f"{col}:Q", title=col, format="$.2f")
-                    )
-
-                # Single chart with lines and points that show tooltip on hover
-                chart = (
-                    alt.Chart(chart_df_with_tooltip)
-                    .mark_line(point=alt.OverlayMarkDef(size=140, filled=True, opacity=1))
-                    .encode(
-                        x=alt.X("tee_date:T", title="Date", axis=alt.Axis(format="%b %d")),
-                        y=alt.Y("avg_price:Q", title="Avg Price ($)"),
-                        color=alt.Color(
-                            "course_label:N",
-                            title="Course",
-                            sort=legend_order
-                        ),
-                        strokeWidth=alt.condition(
-                            alt.FieldEqualPredicate(field="course_label", equal="self"),
-                            alt.value(4),
-                            alt.value(2)
-                        ),
-                        tooltip=tooltip_fields_list
-                    )
-                    .properties(height=400)
-                    .interactive()
-                )
+                from rate_shop_charts import history_chart
 
+                chart = history_chart(chart_df_with_tooltip, legend_order, tooltip_course_cols)
                 st.altair_chart(chart, use_container_width=True)
                 
                 # st.markdown("")
@@ -1287,248 +882,69 @@ def show_tile_modal(selected_date, selected_course, month_df):
         else:
             st.info("No historical data available for this date.")
 
-# @st.cache_data(ttl=60)
-@st.cache_data
-def load_channel_availability(date_str, course):
-    """Load channel availability with lifecycle tracking for specific date"""
-    try:
-        # client = bigquery.Client.from_service_account_json(
-        #     "D:\\Aman\\Web Scraping\\Golf Rateshop\\golf_credential.json"
-        # )
-        client = get_bq_client() # Updated to use helper function for credentials
-        
-        query = f"""
-        WITH normalized AS (
-          SELECT
-            CASE
-              WHEN course_name IN ('thorntree_golf_club','thorntree_country_club')
-                THEN 'thorntree_golf_club'
-              WHEN course_name IN (
-                'riverside_golf_club_-_dallas',
-                'riverside_golf_club',
-                'riverside_g.c.'
-              ) THEN 'riverside_golf_club_dallas'
-              WHEN course_name IN (
-                'bear_creek',
-                'bear_creek_golf_club_-_west',
-                'bear_creek_golf_club_-_west_course'
-              ) THEN 'bear_creek_golf_club_west'
-              ELSE course_name
-            END AS course_name,
-            source_channel,
-            tee_date,
-            tee_time,
-            price,
-            scrape_timestamp
-          FROM `tee-metrics-golf-tee-time.golf_silver.tee_time_clean`
-          WHERE DATE(tee_date) = '{date_str}'
-            AND CASE
-              WHEN course_name IN ('thorntree_golf_club','thorntree_country_club')
-                THEN 'thorntree_golf_club'
-              WHEN course_name IN (
-                'riverside_golf_club_-_dallas',
-                'riverside_golf_club',
-                'riverside_g.c.'
-              ) THEN 'riverside_golf_club_dallas'
-              WHEN course_name IN (
-                'bear_creek',
-                'bear_creek_golf_club_-_west',
-                'bear_creek_golf_club_-_west_course'
-              ) THEN 'bear_creek_golf_club_west'
-              ELSE course_name
-            END = '{course}'
-        ),
-
-        -- Day boundaries per channel
-        day_bounds AS (
-          SELECT
-            course_name,
-            source_channel,
-            tee_date,
-            MIN(scrape_timestamp) AS first_scrape_ts,
-            MAX(scrape_timestamp) AS last_scrape_ts
-          FROM normalized
-          GROUP BY course_name, source_channel, tee_date
-        ),
-
-        -- Slot lifecycle per channel
-        slot_lifecycle AS (
-          SELECT
-            n.course_name,
-            n.source_channel,
-            n.tee_date,
-            n.tee_time,
-            MIN(n.scrape_timestamp) AS first_seen_at,
-            MAX(n.scrape_timestamp) AS last_seen_at,
-            ANY_VALUE(n.price) AS sample_price
-          FROM normalized n
-          GROUP BY n.course_name, n.source_channel, n.tee_date, n.tee_time
-        ),
-
-        -- Classify lifecycle per channel
-        classified AS (
-          SELECT
-            s.course_name,
-            s.source_channel,
-            s.tee_date,
-            s.tee_time,
-            s.sample_price,
-
-            CASE
-              WHEN s.first_seen_at = d.first_scrape_ts
-                   AND s.last_seen_at = d.last_scrape_ts
-                THEN 'STILL_AVAILABLE'
-
-              WHEN s.first_seen_at = d.first_scrape_ts
-                   AND s.last_seen_at < d.last_scrape_ts
-                THEN 'SOLD_OUT'
-
-              WHEN s.first_seen_at > d.first_scrape_ts
-                   AND s.last_seen_at = d.last_scrape_ts
-                THEN 'ADDED_LATER'
-
-              WHEN s.first_seen_at > d.first_scrape_ts
-                   AND s.last_seen_at < d.last_scrape_ts
-                THEN 'ADDED_AND_SOLD'
-            END AS lifecycle_status
-
-          FROM slot_lifecycle s
-          JOIN day_bounds d
-            ON s.course_name = d.course_name
-           AND s.source_channel = d.source_channel
-           AND s.tee_date = d.tee_date
-        ),
-
-        -- Pivot per slot
-        pivoted AS (
-          SELECT
-            course_name,
-            tee_date,
-            tee_time,
-
-            MAX(IF(source_channel='brand', sample_price, NULL)) AS brand_price,
-            MAX(IF(source_channel='golfnow', sample_price, NULL)) AS golfnow_price,
-            MAX(IF(source_channel='teeoff', sample_price, NULL)) AS teeoff_price,
-            MAX(IF(source_channel='supremegolf', sample_price, NULL)) AS supremegolf_price,
-
-            MAX(IF(source_channel='brand', lifecycle_status, NULL)) AS brand_availability_status,
-            MAX(IF(source_channel='golfnow', lifecycle_status, NULL)) AS golfnow_availability_status,
-            MAX(IF(source_channel='teeoff', lifecycle_status, NULL)) AS teeoff_availability_status,
-            MAX(IF(source_channel='supremegolf', lifecycle_status, NULL)) AS supremegolf_availability_status
-
-          FROM classified
-          GROUP BY course_name, tee_date, tee_time
+    # TAB 3: BOOKING PACE
+    with tab3:
+        st.markdown("### ⏱️ Booking Pace vs. a Week Earlier")
+
+        # "ALL" adds up every channel's listings, so a tee time listed on
+        # several channels counts once per channel; one channel is the default
+        pace_channel = st.selectbox(
+            "Channel",
+            options=AVAILABILITY_CHANNELS + [ALL_CHANNELS],
+            format_func=lambda c: "All channels (channel listings)" if c == ALL_CHANNELS else c,
+            key=f"pace_channel_{selected_date.strftime('%Y%m%d')}"
         )
+        pace_df = load_pace(selected_course, date_str, pace_channel)
+
+        if not pace_df.empty and pace_df["sold_to_date"].notna().any():
+            # Nearest lead time scraped for this date, against the same lead a week earlier
+            latest = pace_df.dropna(subset=["sold_to_date"]).iloc[-1]
+
+            def change(column, digits=0):
+                prior = latest[f"{column}_prior"]
+                if pd.isna(prior) or pd.isna(latest[column]):
+                    return None
+                value = float(latest[column] - prior)
+                return round(value, digits) if digits else int(round(value))
+
+            p1, p2, p3 = st.columns(3)
+            p1.metric(
+                f"Sold by {int(latest['days_before'])} Days Out",
+                int(latest["sold_to_date"]),
+                delta=change("sold_to_date"),
+            )
+            p2.metric("Still Listed", int(latest["available_slots"]), delta=change("available_slots"))
+            avg_price = latest["avg_price"]
+            p3.metric(
+                "Avg Price",
+                f"${avg_price:.0f}" if pd.notna(avg_price) else "-",
+                delta=change("avg_price", 2),
+            )
+            st.caption("Changes compare with the tee date a week earlier at the same days before play.")
+            if pace_channel == ALL_CHANNELS:
+                st.caption("All channels counts channel listings: a tee time on several channels counts once per channel.")
 
-        SELECT
-          ROW_NUMBER() OVER (ORDER BY tee_time) AS Row,
-          course_name,
-          tee_date,
-          tee_time,
-
-          brand_price AS brand_current_price,
-          golfnow_price AS golfnow_current_price,
-          teeoff_price AS teeoff_current_price,
-          supremegolf_price AS supremegolf_current_price,
-
-          COALESCE(brand_availability_status, 'NEVER_LISTED') AS brand_availability_status,
-          COALESCE(golfnow_availability_status, 'NEVER_LISTED') AS golfnow_availability_status,
-          COALESCE(teeoff_availability_status, 'NEVER_LISTED') AS teeoff_availability_status,
-          COALESCE(supremegolf_availability_status, 'NEVER_LISTED') AS supremegolf_availability_status,
-
-          CASE
-            -- All channels never listed
-            WHEN COALESCE(brand_availability_status, 'NEVER_LISTED') = 'NEVER_LISTED'
-             AND COALESCE(golfnow_availability_status, 'NEVER_LISTED') = 'NEVER_LISTED'
-             AND COALESCE(teeoff_availability_status, 'NEVER_LISTED') = 'NEVER_LISTED'
-             AND COALESCE(supremegolf_availability_status, 'NEVER_LISTED') = 'NEVER_LISTED'
-              THEN 'NOT_AVAILABLE_ANYWHERE'
-
-            -- All channels sold out or never listed (not currently available)
-            WHEN COALESCE(brand_availability_status, 'NEVER_LISTED') IN ('SOLD_OUT', 'NEVER_LISTED', 'ADDED_AND_SOLD')
-             AND COALESCE(golfnow_availability_status, 'NEVER_LISTED') IN ('SOLD_OUT', 'NEVER_LISTED', 'ADDED_AND_SOLD')
-             AND COALESCE(teeoff_availability_status, 'NEVER_LISTED') IN ('SOLD_OUT', 'NEVER_LISTED', 'ADDED_AND_SOLD')
-             AND COALESCE(supremegolf_availability_status, 'NEVER_LISTED') IN ('SOLD_OUT', 'NEVER_LISTED', 'ADDED_AND_SOLD')
-              THEN 'SOLD_OUT_EVERYWHERE'
-
-            -- Brand and at least one OTA currently available
-            WHEN COALESCE(brand_availability_status, 'NEVER_LISTED') IN ('STILL_AVAILABLE', 'ADDED_LATER')
-             AND (COALESCE(golfnow_availability_status, 'NEVER_LISTED') IN ('STILL_AVAILABLE', 'ADDED_LATER')
-               OR COALESCE(teeoff_availability_status, 'NEVER_LISTED') IN ('STILL_AVAILABLE', 'ADDED_LATER')
-               OR COALESCE(supremegolf_availability_status, 'NEVER_LISTED') IN ('STILL_AVAILABLE', 'ADDED_LATER'))
-              THEN 'BRAND_AND_OTA'
-
-            -- Only brand currently available
-            WHEN COALESCE(brand_availability_status, 'NEVER_LISTED') IN ('STILL_AVAILABLE', 'ADDED_LATER')
-              THEN 'BRAND_ONLY'
-
-            -- Only OTA channels currently available
-            WHEN COALESCE(golfnow_availability_status, 'NEVER_LISTED') IN ('STILL_AVAILABLE', 'ADDED_LATER')
-              OR COALESCE(teeoff_availability_status, 'NEVER_LISTED') IN ('STILL_AVAILABLE', 'ADDED_LATER')
-              OR COALESCE(supremegolf_availability_status, 'NEVER_LISTED') IN ('STILL_AVAILABLE', 'ADDED_LATER')
-              THEN 'OTA_ONLY'
-
-            ELSE 'NOT_AVAILABLE_ANYWHERE'
-          END AS overall_availability_status
-
-        FROM pivoted
-        ORDER BY tee_time
-        """
-        
-        return client.query(query).to_dataframe()
-    except Exception as e:
-        st.error(f"Error loading availability: {str(e)}")
-        return pd.DataFrame()
+            from rate_shop_charts import pace_chart
 
-# @st.cache_data(ttl=60)
-@st.cache_data
-def load_history_chart(date_str):
-    """Load rate shop history for chart - shows price trends across multiple dates"""
-    try:
-        # client = bigquery.Client.from_service_account_json(
-        #     "D:\\Aman\\Web Scraping\\Golf Rateshop\\golf_credential.json"
-        # )
-        client = get_bq_client() # Updated to use helper function for credentials
-        
-        query = f"""
-        WITH normalized AS (
-          SELECT
-            CASE
-              WHEN course_name IN ('thorntree_golf_club','thorntree_country_club')
-                THEN 'thorntree_golf_club'
-              WHEN course_name IN (
-                'riverside_golf_club_-_dallas',
-                'riverside_golf_club',
-                'riverside_g.c.'
-              ) THEN 'riverside_golf_club_dallas'
-              WHEN course_name IN (
-                'bear_creek',
-                'bear_creek_golf_club_-_west',
-                'bear_creek_golf_club_-_west_course'
-              ) THEN 'bear_creek_golf_club_west'
-              ELSE course_name
-            END AS course_name,
-            source_channel,
-            CAST(tee_date AS DATE) AS tee_date,
-            price,
-            scrape_timestamp
-          FROM `tee-metrics-golf-tee-time.golf_silver.tee_time_clean`
-          WHERE CAST(tee_date AS DATE) >= CAST('2026-02-03' AS DATE)
-            AND CAST(tee_date AS DATE) <= CAST('{date_str}' AS DATE)
-        )
-        SELECT
-            course_name,
-            tee_date,
-            AVG(price) AS avg_price
-        FROM normalized
-        GROUP BY course_name, tee_date
-        ORDER BY tee_date DESC, course_name
-        """
-        
-        return client.query(query).to_dataframe()
-    except Exception as e:
-        st.error(f"Error loading history: {str(e)}")
-        return pd.DataFrame()
+            st.altair_chart(pace_chart(pace_df), use_container_width=True)
+        else:
+            st.info("No booking pace recorded for this date.")
+
+# --------------------------
+# BACKGROUND PREFETCH
+# --------------------------
+
+if "prefetcher" not in st.session_state:
+    st.session_state.prefetcher = Prefetcher()
+
+if prefetch_tiles:
+    st.session_state.prefetcher.schedule(
+        (selected_course, year, month),
+        [(load_channel_availability_month, (selected_course, year, month)),
+         (load_price_history, ())]
+    )
+else:
+    st.session_state.prefetcher.cancel()
 
 # Show tile modal if date is selected
 if st.session_state.tile_modal_date:
@@ -1619,7 +1035,7 @@ if st.session_state.selected_date:
 
             comp_df = day_data[
                 day_data["course_name"] != selected_course
-            ][["course_name", "source_channel", "average_price", "occupancy_percent", "price_position_flag"]].copy()
+            ][["course_name", "source_channel", "average_price", "occupancy_percent", "price_position_flag"]]
             comp_df.columns = ["Course", "Source", "Price", "Occupancy %", "Position"]
             comp_df = comp_df.sort_values("Price")
             
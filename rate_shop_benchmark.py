@@ -0,0 +1,137 @@
+"""Benchmarking grid for the Benchmarking screen.
+
+Pivots the whole fetch_benchmark_data() frame once into as-of × check-in
+matrices and renders the table, HIGH/LOW counts included, as one HTML
+string.
+"""
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+# --------------------------
+# CONFIG
+# --------------------------
+
+# Window the Benchmarking screen opens on: as-of dates, check-in dates, channel
+DEFAULT_AS_OF_RANGE = (date(2026, 2, 18), date(2026, 2, 24))
+DEFAULT_CHECKIN_RANGE = (date(2026, 2, 18), date(2026, 3, 4))
+DEFAULT_CHANNEL = "ALL"
+DEFAULT_BENCHMARK_WINDOW = (*DEFAULT_AS_OF_RANGE, *DEFAULT_CHECKIN_RANGE, DEFAULT_CHANNEL)
+
+BELOW_MARKET_COLOR = "#22c55e"
+ABOVE_MARKET_COLOR = "#ef4444"
+NO_MARKET_COLOR = "#9ca3af"
+
+BENCHMARK_CSS = """
+<style>
+  .bench-table { width: 100%; border-collapse: collapse; table-layout: fixed; }
+  .bench-th, .bench-td { border: 1px solid #2a2f3a; padding: 8px 6px; text-align: center; font-size: 12px; }
+  .bench-th { background: #1f2937; color: #e5e7eb; font-weight: 600; }
+  .bench-date { text-align: left; font-weight: 600; color: #e5e7eb; background: #111827; }
+  .bench-price { background: #0f172a; }
+  .bench-top { font-weight: 700; line-height: 1.1; }
+  .bench-bottom { color: #e5e7eb; opacity: 0.9; line-height: 1.1; }
+  .bench-meta { background: #111827; color: #e5e7eb; font-weight: 600; }
+</style>
+"""
+
+
+# --------------------------
+# MATRICES
+# --------------------------
+
+def build_benchmark_matrices(bench_df, property_selected, as_of_dates=None):
+    """Self price, market average and HIGH/LOW counts for `property_selected`.
+
+    Rows are the as-of dates where the property has data (latest first),
+    limited to `as_of_dates` when given, columns every check-in date in
+    `bench_df`. HIGH counts the check-in dates where the property has the
+    highest average price of the market, LOW the lowest; ties count for
+    everyone tied.
+    """
+    checkin_dates = sorted(bench_df["tee_date"].unique())
+    keys = ["as_of_date", "tee_date"]
+
+    prices = bench_df.groupby(keys)["avg_price"]
+    is_self = bench_df["course_name"] == property_selected
+    self_df = bench_df.loc[is_self, keys + ["avg_price", "market_avg"]].assign(
+        is_high=bench_df.loc[is_self, "avg_price"] == prices.transform("max")[is_self],
+        is_low=bench_df.loc[is_self, "avg_price"] == prices.transform("min")[is_self],
+    )
+
+    self_dates = self_df["as_of_date"].unique()
+    if as_of_dates is not None:
+        self_dates = set(self_dates) & set(as_of_dates)
+    as_of_dates = sorted(self_dates, reverse=True)
+    cells = self_df.groupby(keys)[["avg_price", "market_avg"]].mean()
+    self_price = cells["avg_price"].unstack("tee_date").reindex(index=as_of_dates, columns=checkin_dates)
+    market_avg = cells["market_avg"].unstack("tee_date").reindex(index=as_of_dates, columns=checkin_dates)
+    counts = self_df.groupby("as_of_date")[["is_high", "is_low"]].sum().reindex(as_of_dates)
+
+    return self_price, market_avg, counts.astype(int)
+
+
+def page_as_of_dates(bench_df, page, page_size):
+    """As-of dates on 1-based `page`, latest first, and the number of pages."""
+    as_of_dates = sorted(bench_df["as_of_date"].unique(), reverse=True)
+    page_count = max(1, -(-len(as_of_dates) // page_size))
+    page = min(max(page, 1), page_count)
+    return as_of_dates[(page - 1) * page_size:page * page_size], page_count
+
+
+# --------------------------
+# RENDERING
+# --------------------------
+
+def _money(values):
+    """"$123" per value, "" where missing."""
+    values = np.asarray(values, dtype=float)
+    return np.where(np.isnan(values), "", np.char.mod("$%.0f", values)).astype(object)
+
+
+def build_benchmark_table_html(bench_df, property_selected, as_of_dates=None):
+    """The benchmarking table for `property_selected` as one HTML string."""
+    self_price, market_avg, counts = build_benchmark_matrices(bench_df, property_selected, as_of_dates)
+    self_values = self_price.to_numpy(dtype=float)
+    market_values = market_avg.to_numpy(dtype=float)
+
+    self_color = np.where(
+        np.isnan(self_values) | np.isnan(market_values),
+        NO_MARKET_COLOR,
+        np.where(self_values <= market_values, BELOW_MARKET_COLOR, ABOVE_MARKET_COLOR),
+    ).astype(object)
+    cells = np.where(
+        np.isnan(self_values) & np.isnan(market_values),
+        "",
+        "<div class='bench-top' style='color:" + self_color + ";'>" + _money(self_values) + "</div>"
+        "<div class='bench-bottom'>" + _money(market_values) + "</div>",
+    ).astype(object)
+    cells = "<td class='bench-td bench-price'>" + cells + "</td>"
+
+    header_cells = (
+        ["AS OF DATE"]
+        + [pd.to_datetime(d).strftime("%m/%d") for d in self_price.columns]
+        + ["HIGH", "LOW"]
+    )
+    header = "".join(f"<th class='bench-th'>{c}</th>" for c in header_cells)
+
+    rows = []
+    for as_of_value, row_cells, high, low in zip(
+        self_price.index, cells, counts["is_high"], counts["is_low"]
+    ):
+        rows.append(
+            "<tr>"
+            f"<td class='bench-td bench-date'>{pd.to_datetime(as_of_value).strftime('%m/%d')}</td>"
+            + "".join(row_cells)
+            + f"<td class='bench-td bench-meta'>{high}</td>"
+            f"<td class='bench-td bench-meta'>{low}</td>"
+            "</tr>"
+        )
+
+    return (
+        "<table class='bench-table'>"
+        f"<thead><tr>{header}</tr></thead>"
+        f"<tbody>{''.join(rows)}</tbody>"
+        "</table>"
+    )
@@ -0,0 +1,145 @@
+"""Shared BigQuery access for the rate shop app.
+
+Keeps one BigQuery client and one BigQuery Storage read client per process,
+reused across Streamlit sessions and reruns, and downloads query results
+through the Arrow-based Storage Read API.
+"""
+import os
+import threading
+import time
+
+import pandas as pd
+
+from rate_shop_diskcache import CACHE_MAX_BYTES, cache_key, get_disk_cache
+from rate_shop_telemetry import record_query
+
+# --------------------------
+# CONFIG
+# --------------------------
+
+PROJECT_ID = "tee-metrics-golf-tee-time"
+
+# Parallel Storage Read API streams per result download. Results of queries
+# with ORDER BY are always read over a single stream to keep their order.
+READ_STREAMS = int(os.environ.get("RATE_SHOP_BQ_READ_STREAMS", "4"))
+
+_lock = threading.RLock()
+_clients = {}
+
+
+# --------------------------
+# CLIENTS
+# --------------------------
+
+def _load_credentials():
+    """Service account credentials from Streamlit secrets, or None for ADC."""
+    from google.oauth2 import service_account
+
+    try:
+        import streamlit as st
+        credentials_info = dict(st.secrets["gcp_service_account"])
+    except (ImportError, KeyError, FileNotFoundError):
+        return None, PROJECT_ID
+
+    credentials = service_account.Credentials.from_service_account_info(credentials_info)
+    return credentials, credentials_info["project_id"]
+
+
+def use_clients(client, storage_client=None):
+    """Installs pre-built clients as the process-wide pair (tests, benchmarks)."""
+    with _lock:
+        _clients["bigquery"] = client
+        _clients["storage"] = storage_client
+
+
+def reset_clients():
+    """Drops the pooled clients so the next call builds fresh ones."""
+    with _lock:
+        _clients.clear()
+
+
+def get_bq_client():
+    """Returns the process-wide BigQuery client, building it on first use."""
+    with _lock:
+        if "bigquery" not in _clients:
+            from google.cloud import bigquery
+
+            credentials, project = _load_credentials()
+            _clients["credentials"] = credentials
+            _clients["bigquery"] = bigquery.Client(credentials=credentials, project=project)
+        return _clients["bigquery"]
+
+
+def get_bq_storage_client():
+    """Returns the process-wide BigQuery Storage read client, or None if unavailable."""
+    with _lock:
+        if "storage" not in _clients:
+            get_bq_client()
+            try:
+                from google.cloud import bigquery_storage
+            except ImportError:
+                _clients["storage"] = None
+            else:
+                _clients["storage"] = bigquery_storage.BigQueryReadClient(
+                    credentials=_clients.get("credentials")
+                )
+        return _clients["storage"]
+
+
+# --------------------------
+# QUERIES
+# --------------------------
+
+def _disk_key(query):
+    return cache_key(query, {"project": PROJECT_ID})
+
+
+def forget_query(query):
+    """Drops the on-disk result of `query` so its next run goes to the warehouse."""
+    get_disk_cache().delete(_disk_key(query))
+
+
+def run_query(query, read_streams=None, cache_ttl=None):
+    """Runs a query on the shared client and downloads it as a DataFrame.
+
+    Rows come back as Arrow record batches over the Storage Read API when a
+    storage client is available, and over the paged REST API otherwise.
+    With `cache_ttl` (seconds) the result is also kept in the on-disk cache
+    and served from there, across restarts, until it expires. The job's
+    statistics are recorded against the running loader call.
+    """
+    start = time.perf_counter()
+    use_disk = cache_ttl is not None and CACHE_MAX_BYTES > 0
+    if use_disk:
+        key = _disk_key(query)
+        cached = get_disk_cache().get(key)
+        if cached is not None:
+            record_query(None, len(cached), time.perf_counter() - start, source="disk")
+            return cached
+
+    job = get_bq_client().query(query)
+    rows = job.result()
+    frames = list(
+        rows.to_dataframe_iterable(
+            bqstorage_client=get_bq_storage_client(),
+            max_stream_count=READ_STREAMS if read_streams is None else read_streams,
+        )
+    )
+    if not frames:
+        frame = pd.DataFrame(columns=[field.name for field in rows.schema])
+    elif len(frames) == 1:
+        frame = frames[0]
+    else:
+        frame = pd.concat(frames, ignore_index=True)
+    record_query(job, len(frame), time.perf_counter() - start)
+    if use_disk:
+        get_disk_cache().put(key, frame, ttl=cache_ttl)
+    return frame
+
+
+def dry_run_bytes(query):
+    """Bytes BigQuery would process for `query`, without running it."""
+    from google.cloud import bigquery
+
+    config = bigquery.QueryJobConfig(dry_run=True, use_query_cache=False)
+    return get_bq_client().query(query, job_config=config).total_bytes_processed
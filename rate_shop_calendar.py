@@ -0,0 +1,211 @@
+"""Calendar grid for the Rate Shop screen.
+
+Builds every tile of a month in one vectorized pass over the selected
+course's rows, and renders the whole grid as a single HTML block. The
+block is mounted by `calendar_grid`, a component that hands tile link
+clicks back to the running session, so opening a tile neither reloads the
+page nor drops the session's state.
+"""
+import calendar
+from html import escape
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# --------------------------
+# CONFIG
+# --------------------------
+
+FLAG_COLORS = {
+    "LOWEST_IN_MARKET": "#10b981",
+    "BELOW_AVERAGE": "#06b6d4",
+    "MARKET_AVERAGE": "#f59e0b",
+    "ABOVE_AVERAGE": "#f97316",
+    "HIGHEST_IN_MARKET": "#ef4444",
+}
+NO_FLAG_COLOR = "#6b7280"
+
+GAP_BELOW_COLOR = "#10b981"
+GAP_ABOVE_COLOR = "#ef4444"
+
+WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+# Channel whose row a tile shows when the course was scraped on it
+PREFERRED_CHANNEL = "brand"
+
+# Views a tile link opens
+VIEW_ANALYTICS = "analytics"
+VIEW_DETAILS = "details"
+
+# Page and calendar grid styles, injected once per run
+CALENDAR_CSS = """
+<style>
+  * { margin: 0; padding: 0; box-sizing: border-box; }
+  body { background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%); }
+  .main { background: transparent; padding: 20px; }
+  .stTitle { color: #fff !important; font-size: 2.5em !important; margin-bottom: 10px; }
+  .calendar-container { display: grid; grid-template-columns: repeat(7, 1fr); gap: 12px; margin: 30px 0; }
+  .calendar-tile {
+    aspect-ratio: 1; border-radius: 16px; padding: 12px; text-align: center;
+    transition: all 0.3s cubic-bezier(0.34, 1.56, 0.64, 1); border: 2px solid rgba(255,255,255,0.1);
+    cursor: pointer; display: flex; flex-direction: column; justify-content: center; align-items: center;
+    backdrop-filter: blur(10px); font-weight: 600; color: white;
+  }
+  .calendar-tile:hover {
+    transform: translateY(-8px) scale(1.05); border-color: rgba(255,255,255,0.3);
+    box-shadow: 0 12px 40px rgba(255,255,255,0.1);
+  }
+  .tile-day { font-size: 0.9em; opacity: 0.9; margin-bottom: 4px; }
+  .tile-price { font-size: 1.8em; margin: 4px 0; font-weight: 700; }
+  .tile-badge {
+    display: inline-block; padding: 2px 8px; border-radius: 8px;
+    font-size: 0.75em; font-weight: 600; margin-bottom: 4px;
+  }
+  .tile-occ { font-size: 0.85em; opacity: 0.85; }
+  .tile-links { display: flex; gap: 6px; margin-top: 8px; }
+  .tile-links a {
+    color: white !important; text-decoration: none; font-size: 0.7em;
+    padding: 2px 6px; border-radius: 6px; background: rgba(0,0,0,0.25);
+  }
+  .calendar-dow { text-align: center; color: #999; font-weight: 600; font-size: 0.9em; }
+  @media (max-width: 768px) {
+    .calendar-tile { aspect-ratio: auto; min-height: 80px; }
+  }
+</style>
+"""
+
+# Mounts the grid HTML passed as `data` and reports a tile link click as
+# the trigger value `picked`, {"date": "YYYY-MM-DD", "view": ...}
+CALENDAR_JS = """
+export default function (component) {
+  const { data, setTriggerValue, parentElement } = component;
+  const root = parentElement.querySelector(".calendar-root");
+  root.innerHTML = data;
+  root.querySelectorAll("a[data-date]").forEach((link) => {
+    link.onclick = (event) => {
+      event.preventDefault();
+      setTriggerValue("picked", { date: link.dataset.date, view: link.dataset.view });
+    };
+  });
+}
+"""
+
+# Styles stay unisolated so CALENDAR_CSS, injected into the page, applies
+_calendar_component = st.components.v2.component(
+    "calendar_grid",
+    html='<div class="calendar-root"></div>',
+    js=CALENDAR_JS,
+    isolate_styles=False,
+)
+
+
+# --------------------------
+# TILE MODEL
+# --------------------------
+
+def select_course_rows(course_df, keys=("tee_date",)):
+    """One row per tee date of a course's summary rows.
+
+    Prefers the brand channel, otherwise the lowest average price. Pass
+    `keys=("course_name", "tee_date")` to select for every course at once.
+    """
+    keys = list(keys)
+    return (
+        course_df
+        .assign(channel_priority=lambda x: (x["source_channel"] != PREFERRED_CHANNEL).astype(int))
+        .sort_values(keys + ["channel_priority", "average_price", "source_channel"])
+        .groupby(keys, as_index=False, observed=True)
+        .first()
+        .drop(columns=["channel_priority"])
+    )
+
+
+def sell_speed_icons(minutes_available):
+    """Sell-speed icon per row: ❄️ when negative, 🐢 four hours and up, ⚡ one hour and up, else 🔥.
+
+    Missing values fail every comparison and get 🔥, as the per-tile
+    lookup did.
+    """
+    minutes = pd.to_numeric(pd.Series(minutes_available), errors="coerce").to_numpy(dtype=float)
+    with np.errstate(invalid="ignore"):
+        return np.select(
+            [minutes < 0, minutes >= 240, minutes >= 60],
+            ["❄️", "🐢", "⚡"],
+            default="🔥",
+        )
+
+
+def _format(pattern, values):
+    return np.char.mod(pattern, np.asarray(values, dtype=float))
+
+
+def build_tile_model(my_df):
+    """Everything a tile shows, one row per tee date of `my_df`, indexed by day of month."""
+    tee_dates = my_df["tee_date"]
+    gap = my_df["price_gap_percent"].to_numpy(dtype=float)
+
+    tiles = pd.DataFrame(
+        {
+            "tee_date": tee_dates.dt.strftime("%Y-%m-%d").to_numpy(),
+            "color": my_df["price_position_flag"].astype(object).map(FLAG_COLORS).fillna(NO_FLAG_COLOR).to_numpy(),
+            "price": _format("$%.0f", my_df["average_price"]),
+            "gap_badge": _format("%+.1f%%", gap),
+            "gap_color": np.where(gap < 0, GAP_BELOW_COLOR, GAP_ABOVE_COLOR),
+            "occupancy": _format("%.0f%%", my_df["occupancy_percent"]),
+            "icon": sell_speed_icons(my_df["avg_minutes_available"]),
+        },
+        index=pd.Index(tee_dates.dt.day.to_numpy(), name="day"),
+    )
+    tiles["tooltip"] = (
+        "Market Avg: " + _format("$%.0f", my_df["market_avg_price"]) + " | Gap: " + _format("%.1f%%", gap)
+    )
+    return tiles
+
+
+# --------------------------
+# RENDERING
+# --------------------------
+
+def _tile_link(tee_date, view, label):
+    return f'<a href="#" data-date="{tee_date}" data-view="{view}">{label}</a>'
+
+
+def _tile_html(day, tile):
+    return (
+        f'<div class="calendar-tile" style="background-color:{tile.color};" title="{escape(tile.tooltip)}">'
+        f'<div class="tile-day">{day}</div>'
+        f'<div class="tile-price">{tile.price}</div>'
+        f'<div class="tile-badge" style="background:{tile.gap_color};">{tile.gap_badge}</div>'
+        f'<div class="tile-occ">{tile.occupancy} {tile.icon}</div>'
+        f'<div class="tile-links">'
+        f'{_tile_link(tile.tee_date, VIEW_ANALYTICS, "📊 Analytics")}'
+        f'{_tile_link(tile.tee_date, VIEW_DETAILS, "View Details")}'
+        f'</div>'
+        f'</div>'
+    )
+
+
+def render_calendar_html(tiles, year, month):
+    """The month as one HTML grid; days without a tile are left blank."""
+    cells = [f'<div class="calendar-dow">{name}</div>' for name in WEEKDAYS]
+    for week in calendar.monthcalendar(year, month):
+        for day in week:
+            if day in tiles.index:
+                cells.append(_tile_html(day, tiles.loc[day]))
+            else:
+                cells.append('<div class="calendar-blank"></div>')
+    return f'<div class="calendar-container">{"".join(cells)}</div>'
+
+
+def calendar_grid(tiles, year, month, key):
+    """Mounts the month grid; returns the (tee date, view) of a tile link clicked this run, else None."""
+    result = _calendar_component(
+        data=render_calendar_html(tiles, year, month),
+        key=key,
+        on_picked_change=lambda: None,
+    )
+    picked = result.picked
+    if not picked:
+        return None
+    return pd.Timestamp(picked["date"]).to_pydatetime(), picked["view"]
@@ -0,0 +1,111 @@
+"""Altair charts for the rate shop app.
+
+Altair and its schema stack add a large share of the app's cold-start
+import time, and only the Benchmarking details and the tile modal's
+history tab draw charts, so the app imports this module inside the
+functions that render them.
+"""
+import altair as alt
+
+SELF_COLOR = "#22c55e"
+MARKET_COLOR = "white"
+
+
+def price_trend_chart(chart_df):
+    """Self price against the market min/avg/max band, per check-in date."""
+    base = alt.Chart(chart_df).encode(
+        x=alt.X("tee_date:T", title="Check-in Date")
+    )
+    whisker = base.mark_rule(color=MARKET_COLOR, strokeWidth=2).encode(
+        y="market_min:Q",
+        y2="market_max:Q"
+    )
+    top_cap = base.mark_tick(color=MARKET_COLOR, thickness=2, size=20).encode(y="market_max:Q")
+    bottom_cap = base.mark_tick(color=MARKET_COLOR, thickness=2, size=20).encode(y="market_min:Q")
+    market_line = base.mark_line(color=MARKET_COLOR, strokeWidth=2).encode(y="market_avg:Q")
+    market_points = base.mark_circle(color=MARKET_COLOR, size=60).encode(y="market_avg:Q")
+    self_line = base.mark_line(color=SELF_COLOR, strokeWidth=3).encode(y="avg_price:Q")
+    self_points = base.mark_circle(color=SELF_COLOR, size=80).encode(
+        y="avg_price:Q",
+        tooltip=[
+            alt.Tooltip("tee_date:T", title="Date"),
+            alt.Tooltip("avg_price:Q", title="Self", format="$,.0f"),
+            alt.Tooltip("market_avg:Q", title="Avg", format="$,.0f"),
+            alt.Tooltip("market_min:Q", title="Min", format="$,.0f"),
+            alt.Tooltip("market_max:Q", title="Max", format="$,.0f"),
+        ]
+    )
+    return (
+        whisker
+        + top_cap
+        + bottom_cap
+        + market_line
+        + market_points
+        + self_line
+        + self_points
+    ).properties(height=420)
+
+
+def history_chart(chart_df, legend_order, tooltip_course_cols):
+    """Average price by tee date per course, the selected course drawn thicker.
+
+    Takes the output of rate_shop_history.build_history_chart_frame().
+    """
+    tooltip = [alt.Tooltip("date_label_y:N", title="Date")]
+    for col in tooltip_course_cols:
+        tooltip.append(alt.Tooltip(f"{col}:Q", title=col, format="$.2f"))
+
+    # Single chart with lines and points that show tooltip on hover
+    return (
+        alt.Chart(chart_df)
+        .mark_line(point=alt.OverlayMarkDef(size=140, filled=True, opacity=1))
+        .encode(
+            x=alt.X("tee_date:T", title="Date", axis=alt.Axis(format="%b %d")),
+            y=alt.Y("avg_price:Q", title="Avg Price ($)"),
+            color=alt.Color(
+                "course_label:N",
+                title="Course",
+                sort=legend_order
+            ),
+            strokeWidth=alt.condition(
+                alt.FieldEqualPredicate(field="course_label", equal="self"),
+                alt.value(4),
+                alt.value(2)
+            ),
+            tooltip=tooltip
+        )
+        .properties(height=400)
+        .interactive()
+    )
+
+
+def pace_chart(pace_df):
+    """Slots sold so far by days before play, against the same lead time a week earlier.
+
+    Takes the output of rate_shop_engine.PaceCube.same_lead().
+    """
+    lines = (
+        pace_df[["days_before", "sold_to_date", "sold_to_date_prior"]]
+        .rename(columns={"sold_to_date": "This date", "sold_to_date_prior": "Week before"})
+        .melt(id_vars="days_before", var_name="tee_date_label", value_name="sold")
+        .dropna(subset=["sold"])
+    )
+    return (
+        alt.Chart(lines)
+        .mark_line(point=True)
+        .encode(
+            x=alt.X("days_before:Q", title="Days Before Play", scale=alt.Scale(reverse=True)),
+            y=alt.Y("sold:Q", title="Slots Sold So Far"),
+            color=alt.Color(
+                "tee_date_label:N",
+                title="Tee Date",
+                scale=alt.Scale(domain=["This date", "Week before"], range=[SELF_COLOR, MARKET_COLOR]),
+            ),
+            tooltip=[
+                alt.Tooltip("tee_date_label:N", title="Tee Date"),
+                alt.Tooltip("days_before:Q", title="Days Before"),
+                alt.Tooltip("sold:Q", title="Sold"),
+            ]
+        )
+        .properties(height=360)
+    )
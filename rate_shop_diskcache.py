@@ -0,0 +1,180 @@
+"""Persistent query result cache for the rate shop app.
+
+Stores query results as uncompressed Arrow IPC files keyed by normalized
+SQL and parameters, so a restarted or redeployed app reads its first
+frames from local disk instead of the warehouse. Entries expire after
+their TTL, the directory is kept under a byte budget by evicting the least
+recently used files, and reads are memory-mapped.
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from pathlib import Path
+
+import pyarrow as pa
+
+# --------------------------
+# CONFIG
+# --------------------------
+
+CACHE_DIR = os.environ.get("RATE_SHOP_CACHE_DIR", ".rate_shop_cache")
+CACHE_MAX_BYTES = int(os.environ.get("RATE_SHOP_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+
+# Bump when the file layout changes so old entries are never read back
+CACHE_FORMAT = 1
+
+SUFFIX = ".arrow"
+
+_lock = threading.Lock()
+_cache = None
+
+
+def normalize_sql(sql):
+    """SQL with `--` comments dropped and whitespace collapsed."""
+    sql = re.sub(r"--[^\n]*", "", sql)
+    return re.sub(r"\s+", " ", sql).strip()
+
+
+def cache_key(sql, params=None):
+    """Stable file key for a query and its parameters."""
+    payload = json.dumps(
+        {"format": CACHE_FORMAT, "sql": normalize_sql(sql), "params": params or {}},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class DiskCache:
+    """Arrow IPC files in one directory, with TTLs and an LRU byte budget.
+
+    Expiry lives in the Arrow schema metadata of each file. File
+    mtimes record the last access, so the least recently used entries go
+    first when the directory grows past `max_bytes`.
+    """
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        return self.directory / f"{key}{SUFFIX}"
+
+    def _entries(self):
+        if not self.directory.exists():
+            return []
+        return list(self.directory.glob(f"*{SUFFIX}"))
+
+    def get(self, key):
+        """The cached frame for `key`, or None when missing or expired."""
+        entry = self.get_entry(key)
+        return None if entry is None else entry[0]
+
+    def get_entry(self, key):
+        """(frame, info) for `key`, or None; info has created_at and expires_at."""
+        path = self._path(key)
+        try:
+            source = pa.memory_map(str(path))
+        except FileNotFoundError:
+            return None
+        except (pa.ArrowInvalid, OSError):
+            self._remove(path)
+            return None
+
+        try:
+            # Column buffers stay backed by the mapping; pandas only copies
+            # what it cannot wrap
+            reader = pa.ipc.open_file(source)
+            info = json.loads((reader.schema.metadata or {}).get(b"rate_shop_cache", b"{}"))
+            if info.get("expires_at") is not None and info["expires_at"] < time.time():
+                source.close()
+                self._remove(path)
+                return None
+            frame = reader.read_all().to_pandas(split_blocks=True)
+        except (pa.ArrowInvalid, OSError, json.JSONDecodeError):
+            # A truncated or foreign file would fail every read; drop it so
+            # the next load rewrites it
+            source.close()
+            self._remove(path)
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return frame, info
+
+    def put(self, key, frame, ttl=None):
+        """Stores `frame` under `key` for `ttl` seconds (forever if None)."""
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        info = {
+            "created_at": time.time(),
+            "expires_at": None if ttl is None else time.time() + ttl,
+        }
+        metadata = dict(table.schema.metadata or {})
+        metadata[b"rate_shop_cache"] = json.dumps(info).encode("utf-8")
+        table = table.replace_schema_metadata(metadata)
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = self.directory / f".{key}.{uuid.uuid4().hex}.tmp"
+        with pa.OSFile(str(tmp), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp, self._path(key))
+        self.evict()
+
+    def delete(self, key):
+        """Drops the entry for `key`, if any."""
+        self._remove(self._path(key))
+
+    def _remove(self, path):
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def evict(self):
+        """Drops least recently used entries until the directory fits `max_bytes`."""
+        with self._lock:
+            entries = []
+            for path in self._entries():
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries, key=lambda e: e[0]):
+                if total <= self.max_bytes:
+                    break
+                self._remove(path)
+                total -= size
+
+    def clear(self):
+        """Removes every entry."""
+        with self._lock:
+            for path in self._entries():
+                self._remove(path)
+
+    def stats(self):
+        """Entry count and bytes on disk."""
+        sizes = []
+        for path in self._entries():
+            try:
+                sizes.append(path.stat().st_size)
+            except FileNotFoundError:
+                continue
+        return {"entries": len(sizes), "bytes": sum(sizes), "max_bytes": self.max_bytes}
+
+
+def get_disk_cache():
+    """Returns the process-wide disk cache."""
+    global _cache
+    with _lock:
+        if _cache is None:
+            _cache = DiskCache()
+        return _cache
@@ -0,0 +1,757 @@
+"""Local pandas engine for the rate shop summary.
+
+Reproduces the normalized -> daily_last_scrape -> slot_lifecycle ->
+occupancy_labeled -> daily_course_summary -> market_summary pipeline that
+load_data() runs in BigQuery, working from raw tee_time_clean rows held in
+a DataFrame or a Parquet file.
+
+IncrementalSummary keeps the slot lifecycle as mergeable state so newer
+scrapes can be folded in without re-aggregating the whole season, and the
+tile modal's channel availability is derived from it locally. The
+benchmark rollup holds per as-of date slot counts from which the
+fetch_benchmark_data() frame can be re-aggregated for any channel filter,
+and PaceCube keeps it as booking pace by days before play.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+# --------------------------
+# CONFIG
+# --------------------------
+
+SEASON_START = "2026-02-03"
+
+# Canonical course name -> raw course_name values scraped for it
+COURSE_ALIASES = {
+    "thorntree_golf_club": [
+        "thorntree_golf_club",
+        "thorntree_country_club",
+    ],
+    "riverside_golf_club_dallas": [
+        "riverside_golf_club_-_dallas",
+        "riverside_golf_club",
+        "riverside_g.c.",
+    ],
+    "bear_creek_golf_club_west": [
+        "bear_creek",
+        "bear_creek_golf_club_-_west",
+        "bear_creek_golf_club_-_west_course",
+    ],
+}
+
+ALIAS_TO_COURSE = {
+    alias: course
+    for course, aliases in COURSE_ALIASES.items()
+    for alias in aliases
+}
+
+SCRAPE_COLUMNS = [
+    "course_name",
+    "source_channel",
+    "scrape_timestamp",
+    "tee_date",
+    "tee_time",
+    "price",
+]
+
+SLOT_KEYS = ["course_name", "source_channel", "tee_date", "tee_time"]
+GROUP_KEYS = ["course_name", "source_channel", "tee_date"]
+
+# Same column order as the SELECT in load_data()
+SUMMARY_COLUMNS = [
+    "course_name",
+    "source_channel",
+    "tee_date",
+    "total_slots",
+    "occupied_slots",
+    "occupancy_percent",
+    "avg_minutes_available",
+    "average_price",
+    "min_price",
+    "max_price",
+    "market_min_price",
+    "market_avg_price",
+    "market_max_price",
+    "price_gap_percent",
+    "price_position_flag",
+    "demand_pressure",
+    "revenue_efficiency_score",
+]
+
+BENCHMARK_KEYS = ["course_name", "source_channel", "as_of_date", "tee_date"]
+
+# Same column order as the SELECT in fetch_benchmark_data()
+BENCHMARK_COLUMNS = [
+    "as_of_date",
+    "tee_date",
+    "course_name",
+    "avg_price",
+    "occ_percent",
+    "market_avg",
+    "market_min",
+    "market_max",
+]
+
+# Channels pivoted into the availability table, in column order
+AVAILABILITY_CHANNELS = ["brand", "golfnow", "teeoff", "supremegolf"]
+
+NEVER_LISTED = "NEVER_LISTED"
+AVAILABLE_STATUSES = ["STILL_AVAILABLE", "ADDED_LATER"]
+UNAVAILABLE_STATUSES = ["SOLD_OUT", NEVER_LISTED, "ADDED_AND_SOLD"]
+
+# Same column order as the SELECT in channel_availability_sql()
+AVAILABILITY_COLUMNS = (
+    ["Row", "course_name", "tee_date", "tee_time"]
+    + [f"{channel}_current_price" for channel in AVAILABILITY_CHANNELS]
+    + [f"{channel}_availability_status" for channel in AVAILABILITY_CHANNELS]
+    + ["overall_availability_status"]
+)
+
+# The pace cube's channel summing every channel's listings; a tee time
+# listed on several channels counts once per channel
+ALL_CHANNELS = "ALL"
+PACE_KEYS = ["course_name", "source_channel", "tee_date"]
+PACE_MEASURES = ["slot_count", "occupied_slots", "sold_slots", "slot_price_sum", "priced_slot_count"]
+PACE_COLUMNS = PACE_KEYS + [
+    "as_of_date",
+    "days_before",
+    "available_slots",
+    "sold_slots",
+    "sold_to_date",
+    "avg_price",
+]
+
+
+# --------------------------
+# SQL HELPERS
+# --------------------------
+
+def sql_round(values, digits):
+    """ROUND() with BigQuery semantics: halves round away from zero."""
+    values = np.asarray(values, dtype="float64")
+    scale = 10.0 ** digits
+    return np.sign(values) * np.floor(np.abs(values) * scale + 0.5) / scale
+
+
+def safe_divide(numerator, denominator):
+    """SAFE_DIVIDE(): NULL instead of an error when dividing by zero."""
+    numerator = np.asarray(numerator, dtype="float64")
+    denominator = np.asarray(denominator, dtype="float64")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = numerator / denominator
+    return np.where(denominator == 0, np.nan, result)
+
+
+# --------------------------
+# PIPELINE STAGES
+# --------------------------
+
+def load_scrape_rows(source):
+    """Returns raw tee_time_clean rows from a DataFrame or a Parquet path."""
+    if isinstance(source, pd.DataFrame):
+        return source[SCRAPE_COLUMNS]
+    return pd.read_parquet(source, columns=SCRAPE_COLUMNS)
+
+
+def normalize_scrape_rows(raw, season_start=SEASON_START):
+    """The `normalized` CTE: canonical course names, season filter."""
+    rows = raw[SCRAPE_COLUMNS].copy()
+    rows["course_name"] = rows["course_name"].map(ALIAS_TO_COURSE).fillna(rows["course_name"])
+    rows["tee_date"] = pd.to_datetime(rows["tee_date"])
+    rows["scrape_timestamp"] = pd.to_datetime(rows["scrape_timestamp"])
+    rows = rows[rows["tee_date"] >= pd.Timestamp(season_start)]
+    return rows.reset_index(drop=True)
+
+
+def build_slot_lifecycle(rows):
+    """The `slot_lifecycle` CTE: one row per course/channel/date/tee time."""
+    return (
+        rows.groupby(SLOT_KEYS, sort=True, dropna=False)
+        .agg(
+            first_seen_at=("scrape_timestamp", "min"),
+            last_seen_at=("scrape_timestamp", "max"),
+            scrape_count=("scrape_timestamp", "nunique"),
+            price_sum=("price", "sum"),
+            price_count=("price", "count"),
+            avg_slot_price=("price", "mean"),
+            min_slot_price=("price", "min"),
+            max_slot_price=("price", "max"),
+            sample_price=("price", "first"),
+        )
+        .reset_index()
+    )
+
+
+def merge_slot_lifecycle(base, delta):
+    """Folds a lifecycle built from newer scrapes into an existing one.
+
+    Delta rows must come from scrapes after every scrape in `base`, so
+    distinct scrape counts and price sums simply add up.
+    """
+    combined = pd.concat([base, delta], ignore_index=True)
+    merged = (
+        combined.groupby(SLOT_KEYS, sort=True, dropna=False)
+        .agg(
+            first_seen_at=("first_seen_at", "min"),
+            last_seen_at=("last_seen_at", "max"),
+            scrape_count=("scrape_count", "sum"),
+            price_sum=("price_sum", "sum"),
+            price_count=("price_count", "sum"),
+            min_slot_price=("min_slot_price", "min"),
+            max_slot_price=("max_slot_price", "max"),
+            sample_price=("sample_price", "first"),
+        )
+        .reset_index()
+    )
+    merged["avg_slot_price"] = safe_divide(merged["price_sum"], merged["price_count"])
+    return merged[base.columns]
+
+
+def coerce_slot_lifecycle(lifecycle):
+    """Brings a lifecycle frame read from BigQuery or Parquet to engine dtypes."""
+    lifecycle = lifecycle.copy()
+    lifecycle["tee_date"] = pd.to_datetime(lifecycle["tee_date"])
+    lifecycle["first_seen_at"] = pd.to_datetime(lifecycle["first_seen_at"])
+    lifecycle["last_seen_at"] = pd.to_datetime(lifecycle["last_seen_at"])
+    lifecycle["price_sum"] = lifecycle["price_sum"].astype("float64").fillna(0.0)
+    lifecycle["price_count"] = lifecycle["price_count"].astype("int64")
+    return lifecycle
+
+
+def label_occupancy(lifecycle):
+    """The `daily_last_scrape` join and `occupancy_labeled` CTE."""
+    labeled = lifecycle.copy()
+    labeled["last_scrape_of_day"] = (
+        labeled.groupby(GROUP_KEYS, sort=False, dropna=False)["last_seen_at"].transform("max")
+    )
+    labeled["occupied"] = labeled["last_seen_at"] < labeled["last_scrape_of_day"]
+    labeled["occupancy_status"] = np.where(labeled["occupied"], "OCCUPIED", "STILL_AVAILABLE")
+    # TIMESTAMP_DIFF(..., MINUTE) counts whole minutes
+    labeled["minutes_available"] = (
+        (labeled["last_seen_at"] - labeled["first_seen_at"]) // pd.Timedelta(minutes=1)
+    )
+    return labeled
+
+
+def build_daily_course_summary(labeled):
+    """The `daily_course_summary` CTE."""
+    daily = (
+        labeled.groupby(GROUP_KEYS, sort=True, dropna=False)
+        .agg(
+            total_slots=("occupied", "size"),
+            occupied_slots=("occupied", "sum"),
+            avg_minutes_available=("minutes_available", "mean"),
+            average_price=("avg_slot_price", "mean"),
+            min_price=("min_slot_price", "min"),
+            max_price=("max_slot_price", "max"),
+        )
+        .reset_index()
+    )
+    daily["occupied_slots"] = daily["occupied_slots"].astype("int64")
+    daily["occupancy_percent"] = sql_round(
+        100 * safe_divide(daily["occupied_slots"], daily["total_slots"]), 2
+    )
+    daily["avg_minutes_available"] = sql_round(daily["avg_minutes_available"], 1)
+    daily["average_price"] = sql_round(daily["average_price"], 2)
+    return daily
+
+
+def build_market_summary(daily):
+    """The `market_summary` CTE: market price spread per tee date."""
+    return (
+        daily.groupby("tee_date", sort=True)
+        .agg(
+            market_min_price=("average_price", "min"),
+            market_avg_price=("average_price", "mean"),
+            market_max_price=("average_price", "max"),
+        )
+        .reset_index()
+    )
+
+
+def join_market_summary(daily, market):
+    """The final SELECT: market columns, price position and demand labels."""
+    out = daily.merge(market, on="tee_date", how="inner")
+
+    price = out["average_price"].to_numpy(dtype="float64")
+    market_min = out["market_min_price"].to_numpy(dtype="float64")
+    market_avg = out["market_avg_price"].to_numpy(dtype="float64")
+    market_max = out["market_max_price"].to_numpy(dtype="float64")
+    occupancy = out["occupancy_percent"].to_numpy(dtype="float64")
+
+    out["price_gap_percent"] = sql_round(
+        safe_divide(price - market_avg, market_avg) * 100, 2
+    )
+    # NULL comparisons fall through to the ELSE branch, as they do in SQL
+    with np.errstate(invalid="ignore"):
+        out["price_position_flag"] = np.select(
+            [
+                price >= market_max,
+                price <= market_min,
+                price < market_avg,
+                price == market_avg,
+            ],
+            [
+                "HIGHEST_IN_MARKET",
+                "LOWEST_IN_MARKET",
+                "BELOW_AVERAGE",
+                "MARKET_AVERAGE",
+            ],
+            default="ABOVE_AVERAGE",
+        )
+        out["demand_pressure"] = np.select(
+            [occupancy >= 90, occupancy >= 60],
+            ["HIGH_DEMAND", "MEDIUM_DEMAND"],
+            default="LOW_DEMAND",
+        )
+    out["revenue_efficiency_score"] = sql_round(safe_divide(occupancy, price), 4)
+    out["market_avg_price"] = sql_round(market_avg, 2)
+
+    return (
+        out[SUMMARY_COLUMNS]
+        .sort_values(["tee_date", "course_name", "source_channel"], kind="mergesort")
+        .reset_index(drop=True)
+    )
+
+
+def build_price_history(lifecycle):
+    """history_chart_sql() for every tee date: average scraped price per course and date."""
+    history = (
+        lifecycle.groupby(["course_name", "tee_date"], sort=False, dropna=False)[["price_sum", "price_count"]]
+        .sum()
+        .reset_index()
+    )
+    history["avg_price"] = safe_divide(history["price_sum"], history["price_count"])
+    return (
+        history[["course_name", "tee_date", "avg_price"]]
+        .sort_values(["tee_date", "course_name"], ascending=[False, True], kind="mergesort")
+        .reset_index(drop=True)
+    )
+
+
+# --------------------------
+# BENCHMARK
+# --------------------------
+
+def scrape_dates(timestamps):
+    """DATE(scrape_timestamp): the UTC calendar date of each scrape."""
+    timestamps = pd.to_datetime(timestamps)
+    if timestamps.dt.tz is not None:
+        timestamps = timestamps.dt.tz_convert("UTC").dt.tz_localize(None)
+    return timestamps.dt.normalize()
+
+
+def build_benchmark_rollup(rows):
+    """Slot counts per course/channel/as-of date/tee date behind the benchmark query.
+
+    Occupancy is judged against the last scrape of each as-of date, as in
+    fetch_benchmark_data(). `sold_slots` counts the slots last seen on the
+    as-of date that a later scrape of their tee date no longer lists, the
+    occupied slots of the summary, so they add up to its `occupied_slots`
+    over every as-of date. Counts and slot price sums add up across
+    channels, so any channel filter can be aggregated from the rollup.
+    """
+    rows = rows.assign(as_of_date=scrape_dates(rows["scrape_timestamp"]))
+    slots = (
+        rows.groupby(BENCHMARK_KEYS + ["tee_time"], sort=False, dropna=False)
+        .agg(
+            last_seen_at=("scrape_timestamp", "max"),
+            avg_slot_price=("price", "mean"),
+        )
+        .reset_index()
+    )
+    slots["occupied"] = slots["last_seen_at"] < (
+        slots.groupby(BENCHMARK_KEYS, sort=False, dropna=False)["last_seen_at"].transform("max")
+    )
+    rollup = (
+        slots.groupby(BENCHMARK_KEYS, sort=True, dropna=False)
+        .agg(
+            slot_count=("occupied", "size"),
+            occupied_slots=("occupied", "sum"),
+            slot_price_sum=("avg_slot_price", "sum"),
+            priced_slot_count=("avg_slot_price", "count"),
+        )
+        .reset_index()
+    )
+    rollup["occupied_slots"] = rollup["occupied_slots"].astype("int64")
+
+    # occupied_slots misses slots sold between one as-of date's last scrape
+    # and the next one's first; date each sale by the slot's last sighting
+    # over every as-of date instead, as label_occupancy() labels it
+    lifecycle = (
+        rows.groupby(SLOT_KEYS, sort=False, dropna=False)["scrape_timestamp"]
+        .max()
+        .rename("last_seen_at")
+        .reset_index()
+    )
+    lifecycle["sold"] = lifecycle["last_seen_at"] < (
+        lifecycle.groupby(GROUP_KEYS, sort=False, dropna=False)["last_seen_at"].transform("max")
+    )
+    lifecycle["as_of_date"] = scrape_dates(lifecycle["last_seen_at"])
+    sold = lifecycle.groupby(BENCHMARK_KEYS, sort=False, dropna=False)["sold"].sum().rename("sold_slots")
+    rollup = rollup.merge(sold.reset_index(), on=BENCHMARK_KEYS, how="left")
+    rollup["sold_slots"] = rollup["sold_slots"].fillna(0).astype("int64")
+    return rollup
+
+
+def benchmark_from_rollup(rollup, as_of_start, as_of_end, checkin_start, checkin_end, channel):
+    """Returns the fetch_benchmark_data() frame aggregated from a benchmark rollup."""
+    as_of_date = pd.to_datetime(rollup["as_of_date"])
+    tee_date = pd.to_datetime(rollup["tee_date"])
+    mask = (
+        as_of_date.between(pd.Timestamp(as_of_start), pd.Timestamp(as_of_end))
+        & tee_date.between(pd.Timestamp(checkin_start), pd.Timestamp(checkin_end))
+    )
+    if channel != "ALL":
+        mask &= rollup["source_channel"] == channel
+
+    daily = (
+        rollup[mask]
+        .groupby(["as_of_date", "tee_date", "course_name"], sort=True, dropna=False)
+        .agg(
+            slot_count=("slot_count", "sum"),
+            occupied_slots=("occupied_slots", "sum"),
+            slot_price_sum=("slot_price_sum", "sum"),
+            priced_slot_count=("priced_slot_count", "sum"),
+        )
+        .reset_index()
+    )
+    daily["avg_price"] = sql_round(
+        safe_divide(daily["slot_price_sum"], daily["priced_slot_count"]), 0
+    )
+    daily["occ_percent"] = sql_round(
+        100 * safe_divide(daily["occupied_slots"], daily["slot_count"]), 0
+    )
+    market = (
+        daily.groupby(["as_of_date", "tee_date"], sort=True)
+        .agg(
+            market_min=("avg_price", "min"),
+            market_max=("avg_price", "max"),
+            market_avg=("avg_price", "mean"),
+        )
+        .reset_index()
+    )
+    market["market_avg"] = sql_round(market["market_avg"], 0)
+
+    return (
+        daily.merge(market, on=["as_of_date", "tee_date"], how="inner")[BENCHMARK_COLUMNS]
+        .sort_values(["as_of_date", "tee_date", "avg_price"], kind="mergesort")
+        .reset_index(drop=True)
+    )
+
+
+# --------------------------
+# CHANNEL AVAILABILITY
+# --------------------------
+
+def classify_slot_status(lifecycle):
+    """The `day_bounds` and `classified` CTEs of channel_availability_sql()."""
+    groups = lifecycle.groupby(GROUP_KEYS, sort=False, dropna=False)
+    first_scrape = groups["first_seen_at"].transform("min").to_numpy()
+    last_scrape = groups["last_seen_at"].transform("max").to_numpy()
+    first_seen = lifecycle["first_seen_at"].to_numpy()
+    last_seen = lifecycle["last_seen_at"].to_numpy()
+
+    opened_with_day = first_seen == first_scrape
+    added_later = first_seen > first_scrape
+    open_at_close = last_seen == last_scrape
+    gone_before_close = last_seen < last_scrape
+    status = np.select(
+        [
+            opened_with_day & open_at_close,
+            opened_with_day & gone_before_close,
+            added_later & open_at_close,
+            added_later & gone_before_close,
+        ],
+        ["STILL_AVAILABLE", "SOLD_OUT", "ADDED_LATER", "ADDED_AND_SOLD"],
+        default=None,
+    )
+    classified = lifecycle[["course_name", "source_channel", "tee_date", "tee_time", "sample_price"]]
+    return classified.assign(lifecycle_status=status)
+
+
+def build_channel_availability(lifecycle):
+    """channel_availability_sql() for every course and tee date of `lifecycle` in one pass.
+
+    Slots are pivoted into a slot x channel matrix instead of one query per
+    course and month. Rows are ordered by course, tee date and tee time
+    and numbered per course and tee date, so one course's rows equal that
+    query's result.
+    """
+    classified = classify_slot_status(lifecycle)
+    slot_keys = ["course_name", "tee_date", "tee_time"]
+    slots = classified.groupby(slot_keys, sort=True, dropna=False)
+    slot_ids = slots.ngroup().to_numpy()
+    out = slots.size().reset_index()[slot_keys]
+
+    # Rows of other channels still make a slot, listed nowhere
+    channel = pd.Categorical(classified["source_channel"], categories=AVAILABILITY_CHANNELS).codes
+    pivoted = channel >= 0
+    shape = (len(out), len(AVAILABILITY_CHANNELS))
+    prices = np.full(shape, np.nan)
+    prices[slot_ids[pivoted], channel[pivoted]] = classified["sample_price"].to_numpy(dtype="float64")[pivoted]
+    statuses = np.full(shape, NEVER_LISTED, dtype=object)
+    statuses[slot_ids[pivoted], channel[pivoted]] = classified["lifecycle_status"].to_numpy()[pivoted]
+    statuses[pd.isna(statuses)] = NEVER_LISTED
+
+    available = np.isin(statuses, AVAILABLE_STATUSES)
+    brand_available = available[:, 0]
+    ota_available = available[:, 1:].any(axis=1)
+    overall = np.select(
+        [
+            (statuses == NEVER_LISTED).all(axis=1),
+            np.isin(statuses, UNAVAILABLE_STATUSES).all(axis=1),
+            brand_available & ota_available,
+            brand_available,
+            ota_available,
+        ],
+        ["NOT_AVAILABLE_ANYWHERE", "SOLD_OUT_EVERYWHERE", "BRAND_AND_OTA", "BRAND_ONLY", "OTA_ONLY"],
+        default="NOT_AVAILABLE_ANYWHERE",
+    )
+
+    for i, name in enumerate(AVAILABILITY_CHANNELS):
+        out[f"{name}_current_price"] = prices[:, i]
+        out[f"{name}_availability_status"] = statuses[:, i]
+    out["overall_availability_status"] = overall
+    out["Row"] = out.groupby(["course_name", "tee_date"], sort=False, dropna=False).cumcount() + 1
+    return out[AVAILABILITY_COLUMNS]
+
+
+def course_channel_availability(lifecycle, course, start, end):
+    """channel_availability_sql(course, start, end) from a slot lifecycle."""
+    in_range = lifecycle["tee_date"].between(pd.Timestamp(start), pd.Timestamp(end))
+    return build_channel_availability(lifecycle[(lifecycle["course_name"] == course) & in_range])
+
+
+# --------------------------
+# PACE CUBE
+# --------------------------
+
+def build_pace_cube(rollup):
+    """Booking pace per course, channel, tee date and days before play.
+
+    Built from a benchmark rollup: each as-of date's slots still listed at
+    its last scrape, slots last seen on it before selling, slots sold so
+    far for the tee date and the average slot price. At the nearest lead
+    time `sold_to_date` equals the summary's `occupied_slots`. Channel "ALL" sums every channel's
+    listings, so it counts channel listings rather than distinct tee times.
+    Rows run from the farthest lead time to the nearest.
+    """
+    rollup = rollup.assign(
+        as_of_date=pd.to_datetime(rollup["as_of_date"]),
+        tee_date=pd.to_datetime(rollup["tee_date"]),
+    )
+    all_channels = (
+        rollup.groupby(["course_name", "as_of_date", "tee_date"], sort=False, dropna=False)[PACE_MEASURES]
+        .sum()
+        .reset_index()
+        .assign(source_channel=ALL_CHANNELS)
+    )
+    cube = pd.concat([rollup, all_channels], ignore_index=True)
+    cube["days_before"] = (cube["tee_date"] - cube["as_of_date"]).dt.days
+    cube = cube[cube["days_before"] >= 0].sort_values(
+        ["course_name", "source_channel", "tee_date", "as_of_date"], kind="mergesort"
+    )
+
+    cube["available_slots"] = cube["slot_count"] - cube["occupied_slots"]
+    cube["sold_to_date"] = cube.groupby(PACE_KEYS, sort=False, dropna=False)["sold_slots"].cumsum()
+    cube["avg_price"] = sql_round(safe_divide(cube["slot_price_sum"], cube["priced_slot_count"]), 2)
+    return cube[PACE_COLUMNS].reset_index(drop=True)
+
+
+class PaceCube:
+    """Lead-time pace of every tee date, kept current from new scrapes.
+
+    Holds the benchmark rollup as mergeable state and the pace rows derived
+    from it, with each (course, channel, tee date) curve's row positions in
+    a dict, so a pace curve or a same-lead-time comparison is a lookup
+    rather than a scan. Rollup rows of a finished as-of date never change;
+    `refresh()` refetches from the last as-of date held on and re-derives
+    only the tee dates it touches.
+    """
+
+    def __init__(self, rollup):
+        self._lock = threading.RLock()
+        self.rollup = self._coerce(rollup)
+        self._index(build_pace_cube(self.rollup))
+        # Bumped by every apply() that changes the cube
+        self.version = 0
+
+    @staticmethod
+    def _coerce(rollup):
+        return rollup.assign(
+            as_of_date=pd.to_datetime(rollup["as_of_date"]),
+            tee_date=pd.to_datetime(rollup["tee_date"]),
+        )
+
+    def _index(self, cube):
+        self.cube = cube
+        self._curves = cube.groupby(PACE_KEYS, sort=False, dropna=False).indices
+
+    @property
+    def since(self):
+        """The latest as-of date held, the only one that can still gain scrapes."""
+        latest = self.rollup["as_of_date"].max()
+        return None if pd.isna(latest) else latest
+
+    def apply(self, delta, since):
+        """Replaces the rollup rows of as-of dates from `since` on with `delta`.
+
+        Returns the sorted tee dates whose pace rows changed.
+        """
+        delta = self._coerce(delta)
+        with self._lock:
+            if since is None:
+                stale = np.ones(len(self.rollup), dtype=bool)
+            else:
+                stale = (self.rollup["as_of_date"] >= pd.Timestamp(since)).to_numpy()
+            kept, replaced = self.rollup[~stale], self.rollup[stale]
+            tee_dates = pd.concat([replaced["tee_date"], delta["tee_date"]]).drop_duplicates().sort_values()
+            if tee_dates.empty:
+                return []
+
+            rollup = pd.concat([kept, delta], ignore_index=True)
+            touched = rollup["tee_date"].isin(tee_dates)
+            cube = pd.concat(
+                [self.cube[~self.cube["tee_date"].isin(tee_dates)], build_pace_cube(rollup[touched])],
+                ignore_index=True,
+            )
+
+            self.rollup = rollup
+            self._index(cube)
+            self.version += 1
+        return list(tee_dates)
+
+    def refresh(self, fetch_delta):
+        """Fetches the rollup from the last as-of date held with `fetch_delta(since)` and applies it."""
+        with self._lock:
+            since = self.since
+            return self.apply(fetch_delta(since), since)
+
+    def curve(self, course, tee_date, channel=ALL_CHANNELS):
+        """Pace rows of one tee date, farthest lead time first."""
+        positions = self._curves.get((course, channel, pd.Timestamp(tee_date)))
+        if positions is None:
+            return self.cube.iloc[:0]
+        return self.cube.iloc[positions]
+
+    def same_lead(self, course, tee_date, channel=ALL_CHANNELS, days_earlier=7):
+        """A tee date's pace beside the tee date `days_earlier` before it, by days before play.
+
+        Columns of the earlier date carry a `_prior` suffix; either side is
+        NaN where that date has no scrape at the lead time.
+        """
+        tee_date = pd.Timestamp(tee_date)
+        current = self.curve(course, tee_date, channel)
+        prior = self.curve(course, tee_date - pd.Timedelta(days=days_earlier), channel)
+        measures = ["available_slots", "sold_slots", "sold_to_date", "avg_price"]
+        return (
+            current[["days_before"] + measures]
+            .merge(prior[["days_before"] + measures], on="days_before", how="outer", suffixes=("", "_prior"))
+            .sort_values("days_before", ascending=False, kind="mergesort")
+            .reset_index(drop=True)
+        )
+
+
+# --------------------------
+# ENTRY POINTS
+# --------------------------
+
+def build_rate_shop_summary(source, season_start=SEASON_START):
+    """Returns the load_data() frame computed locally from raw scrape rows."""
+    rows = normalize_scrape_rows(load_scrape_rows(source), season_start)
+    daily = build_daily_course_summary(label_occupancy(build_slot_lifecycle(rows)))
+    return join_market_summary(daily, build_market_summary(daily))
+
+
+def _rows_in_groups(frame, groups, keys):
+    """Boolean mask of frame rows whose `keys` appear in `groups`."""
+    index = pd.MultiIndex.from_frame(frame[keys])
+    return index.isin(pd.MultiIndex.from_frame(groups[keys]))
+
+
+class IncrementalSummary:
+    """Season summary that absorbs newer scrapes without a full rebuild.
+
+    Holds the slot lifecycle as mergeable state together with the
+    scrape_timestamp watermark it covers, None while the state is empty,
+    so the first refresh fetches everything. `apply()` recomputes only the
+    course/channel/date groups a delta touches and re-derives the market
+    summary and the price history for the affected tee dates.
+    """
+
+    def __init__(self, lifecycle):
+        self._lock = threading.RLock()
+        self.lifecycle = coerce_slot_lifecycle(lifecycle)
+        self.daily = build_daily_course_summary(label_occupancy(self.lifecycle))
+        self.summary = join_market_summary(self.daily, build_market_summary(self.daily))
+        self.history = build_price_history(self.lifecycle)
+        latest = self.lifecycle["last_seen_at"].max()
+        self.watermark = None if pd.isna(latest) else latest
+        # Bumped by every apply() that changes the frames
+        self.version = 0
+
+    def apply(self, delta):
+        """Merges a slot lifecycle built from scrapes newer than the watermark.
+
+        Returns the sorted tee dates whose summary rows changed.
+        """
+        delta = coerce_slot_lifecycle(delta)
+        if delta.empty:
+            return []
+
+        with self._lock:
+            groups = delta[GROUP_KEYS].drop_duplicates()
+            touched = _rows_in_groups(self.lifecycle, groups, GROUP_KEYS)
+            merged = merge_slot_lifecycle(self.lifecycle[touched], delta)
+            lifecycle = pd.concat(
+                [self.lifecycle[~touched], merged], ignore_index=True
+            )
+
+            daily_touched = _rows_in_groups(self.daily, groups, GROUP_KEYS)
+            daily = pd.concat(
+                [self.daily[~daily_touched], build_daily_course_summary(label_occupancy(merged))],
+                ignore_index=True,
+            ).sort_values(GROUP_KEYS, kind="mergesort").reset_index(drop=True)
+
+            tee_dates = groups["tee_date"].drop_duplicates().sort_values()
+            affected = daily[daily["tee_date"].isin(tee_dates)]
+            refreshed = join_market_summary(affected, build_market_summary(affected))
+            summary = pd.concat(
+                [self.summary[~self.summary["tee_date"].isin(tee_dates)], refreshed],
+                ignore_index=True,
+            ).sort_values(["tee_date", "course_name", "source_channel"], kind="mergesort")
+
+            history = pd.concat(
+                [
+                    self.history[~self.history["tee_date"].isin(tee_dates)],
+                    build_price_history(lifecycle[lifecycle["tee_date"].isin(tee_dates)]),
+                ],
+                ignore_index=True,
+            ).sort_values(["tee_date", "course_name"], ascending=[False, True], kind="mergesort")
+
+            self.lifecycle = lifecycle
+            self.daily = daily
+            self.summary = summary.reset_index(drop=True)
+            self.history = history.reset_index(drop=True)
+            latest = delta["last_seen_at"].max()
+            if self.watermark is None or latest > self.watermark:
+                self.watermark = latest
+            self.version += 1
+
+        return list(tee_dates)
+
+    def channel_availability(self, course, start, end):
+        """Per-slot channel availability of one course, derived from the held lifecycle."""
+        return course_channel_availability(self.lifecycle, course, start, end)
+
+    def refresh(self, fetch_delta):
+        """Fetches scrapes past the watermark with `fetch_delta(watermark)` and applies them.
+
+        The fetch runs under the state lock so concurrent refreshes cannot
+        fold the same scrapes in twice.
+        """
+        with self._lock:
+            return self.apply(fetch_delta(self.watermark))
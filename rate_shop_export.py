@@ -0,0 +1,245 @@
+"""Precomputed dashboard bundles for the rate shop app.
+
+Runs the dashboard's loader queries without Streamlit for a tee-date range
+and a set of courses, types the results with the app's schema, and writes
+them as a versioned directory of Parquet files described by a manifest.
+The app started against a bundle answers every loader from it and makes
+no warehouse calls, so a nightly export serves demos and offline analysis.
+
+    python rate_shop_export.py bundles/ --start 2026-02-03 --end 2026-03-31
+    RATE_SHOP_DATA_SOURCE=bundle RATE_SHOP_BUNDLE=bundles/ streamlit run rate_shop_app.py
+
+Each run writes bundles/<version>/ and then points bundles/LATEST at it.
+"""
+import argparse
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+
+from rate_shop_benchmark import DEFAULT_BENCHMARK_WINDOW
+from rate_shop_bq import PROJECT_ID, run_query
+from rate_shop_queries import (
+    channel_availability_sql,
+    dashboard_benchmark_sql,
+    dashboard_history_sql,
+    dashboard_pace_sql,
+    dashboard_summary_sql,
+)
+from rate_shop_schema import typed
+
+# --------------------------
+# CONFIG
+# --------------------------
+
+# Bump when the bundle layout changes; readers refuse other formats
+BUNDLE_FORMAT = 3
+
+MANIFEST = "manifest.json"
+LATEST = "LATEST"
+
+BUNDLE_DIR = os.environ.get("RATE_SHOP_BUNDLE", "bundles")
+
+
+def window_key(window):
+    """A benchmark window as JSON-friendly strings: four ISO dates and the channel."""
+    *dates, channel = window
+    return [pd.Timestamp(d).date().isoformat() for d in dates] + [str(channel)]
+
+
+def bundle_months(start, end):
+    """(year, month) of every month the tee-date range touches."""
+    months = pd.period_range(pd.Timestamp(start), pd.Timestamp(end), freq="M")
+    return [(p.year, p.month) for p in months]
+
+
+# --------------------------
+# EXPORT
+# --------------------------
+
+def _write(frame, root, relative):
+    path = root / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    frame.to_parquet(path, index=False)
+    return {"path": relative, "rows": len(frame)}
+
+
+def _availability_month(course, year, month, source):
+    month_start = date(year, month, 1)
+    month_end = (pd.Timestamp(month_start) + pd.offsets.MonthEnd(0)).date()
+    query = channel_availability_sql(course, month_start, month_end, source=source)
+    return typed(run_query(query), "availability")
+
+
+def export_bundle(out_dir, start, end, windows, courses=None, source="raw", workers=4):
+    """Writes a bundle for tee dates `start`..`end` and returns its manifest.
+
+    The summary covers every course, so market comparisons stay complete;
+    availability is exported per course and month of `courses` (every
+    course in the summary by default), the price history and the pace
+    rollup up to `end`, and the benchmark table for each of `windows`.
+    """
+    out_dir = Path(out_dir)
+    version = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    staging = out_dir / f".{version}.tmp"
+    staging.mkdir(parents=True)
+    start, end = pd.Timestamp(start), pd.Timestamp(end)
+    months = bundle_months(start, end)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        summary = pool.submit(run_query, dashboard_summary_sql(source))
+        history = pool.submit(run_query, dashboard_history_sql(source))
+        pace = pool.submit(run_query, dashboard_pace_sql(source=source))
+        benchmarks = [
+            pool.submit(run_query, dashboard_benchmark_sql(*window, source=source)) for window in windows
+        ]
+
+        summary = typed(summary.result(), "summary")
+        summary = summary[summary["tee_date"].between(start, end)]
+        if courses is None:
+            courses = sorted(summary["course_name"].unique())
+        availability = {
+            (course, year, month): pool.submit(_availability_month, course, year, month, source)
+            for course in courses
+            for year, month in months
+        }
+
+        history = typed(history.result(), "history")
+        pace = typed(pace.result(), "pace")
+        files = {
+            "summary": _write(summary, staging, "summary.parquet"),
+            "history": _write(history[history["tee_date"] <= end], staging, "history.parquet"),
+            "pace": _write(pace[pace["tee_date"] <= end], staging, "pace.parquet"),
+            "benchmark": [],
+            "availability": [],
+        }
+        for i, (window, future) in enumerate(zip(windows, benchmarks)):
+            entry = _write(typed(future.result(), "benchmark"), staging, f"benchmark/{i:03d}.parquet")
+            files["benchmark"].append({"window": window_key(window), **entry})
+        for (course, year, month), future in availability.items():
+            entry = _write(future.result(), staging, f"availability/{course}/{year:04d}-{month:02d}.parquet")
+            files["availability"].append({"course": course, "year": year, "month": month, **entry})
+
+    manifest = {
+        "format": BUNDLE_FORMAT,
+        "version": version,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "project": PROJECT_ID,
+        "source": source,
+        "tee_dates": [start.date().isoformat(), end.date().isoformat()],
+        "courses": list(courses),
+        "files": files,
+    }
+    (staging / MANIFEST).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+    # Readers only ever see complete versions
+    staging.rename(out_dir / version)
+    latest = out_dir / f".{LATEST}.tmp"
+    latest.write_text(version + "\n", encoding="utf-8")
+    os.replace(latest, out_dir / LATEST)
+    return manifest
+
+
+# --------------------------
+# READ
+# --------------------------
+
+class Bundle:
+    """One exported bundle; `path` is a version directory or the directory holding LATEST."""
+
+    def __init__(self, path=BUNDLE_DIR):
+        root = Path(path)
+        if not (root / MANIFEST).exists():
+            root = root / (root / LATEST).read_text(encoding="utf-8").strip()
+        self.root = root
+        self.manifest = json.loads((root / MANIFEST).read_text(encoding="utf-8"))
+        if self.manifest.get("format") != BUNDLE_FORMAT:
+            raise ValueError(f"{root} is bundle format {self.manifest.get('format')}, expected {BUNDLE_FORMAT}")
+        files = self.manifest["files"]
+        self._availability = {
+            (entry["course"], entry["year"], entry["month"]): entry["path"] for entry in files["availability"]
+        }
+        self._benchmark = {tuple(entry["window"]): entry["path"] for entry in files["benchmark"]}
+
+    @property
+    def version(self):
+        return self.manifest["version"]
+
+    def _read(self, relative, dataset):
+        if relative is None:
+            return pd.DataFrame()
+        return typed(pd.read_parquet(self.root / relative), dataset)
+
+    def summary(self):
+        return self._read(self.manifest["files"]["summary"]["path"], "summary")
+
+    def history(self):
+        return self._read(self.manifest["files"]["history"]["path"], "history")
+
+    def pace_rollup(self):
+        """The benchmark rollup behind the pace cube."""
+        return self._read(self.manifest["files"]["pace"]["path"], "pace")
+
+    def availability(self, course, year, month):
+        """Availability for a course-month; empty when it was not exported."""
+        return self._read(self._availability.get((course, year, month)), "availability")
+
+    def benchmark(self, window):
+        """Benchmark rows for a window; empty when it was not exported."""
+        return self._read(self._benchmark.get(tuple(window_key(window))), "benchmark")
+
+
+# --------------------------
+# CLI
+# --------------------------
+
+def _parse_window(text):
+    parts = [p.strip() for p in text.split(",")]
+    if len(parts) != 5:
+        raise argparse.ArgumentTypeError("expected AS_OF_START,AS_OF_END,CHECKIN_START,CHECKIN_END,CHANNEL")
+    return tuple(date.fromisoformat(p) for p in parts[:4]) + (parts[4],)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export a precomputed rate shop dashboard bundle.")
+    parser.add_argument("out_dir", help="directory holding bundle versions and LATEST")
+    parser.add_argument("--start", required=True, type=date.fromisoformat, help="first tee date")
+    parser.add_argument("--end", required=True, type=date.fromisoformat, help="last tee date")
+    parser.add_argument(
+        "--courses", default="",
+        help="comma-separated canonical course names for availability (default: every course)",
+    )
+    parser.add_argument(
+        "--benchmark", action="append", type=_parse_window, metavar="WINDOW",
+        help="AS_OF_START,AS_OF_END,CHECKIN_START,CHECKIN_END,CHANNEL; repeatable "
+             "(default: the app's opening window and the whole range on ALL)",
+    )
+    parser.add_argument(
+        "--source", choices=["raw", "gold"], default=os.environ.get("RATE_SHOP_DATA_SOURCE", "raw"),
+    )
+    parser.add_argument("--workers", type=int, default=4, help="queries run at once")
+    args = parser.parse_args()
+
+    courses = [c for c in re.split(r"\s*,\s*", args.courses) if c] or None
+    windows = args.benchmark or [
+        DEFAULT_BENCHMARK_WINDOW,
+        (args.start, args.end, args.start, args.end, "ALL"),
+    ]
+    manifest = export_bundle(
+        args.out_dir, args.start, args.end, windows, courses, source=args.source, workers=args.workers
+    )
+    print(json.dumps({"version": manifest["version"], "files": {
+        "summary": manifest["files"]["summary"]["rows"],
+        "history": manifest["files"]["history"]["rows"],
+        "pace": manifest["files"]["pace"]["rows"],
+        "benchmark": len(manifest["files"]["benchmark"]),
+        "availability": len(manifest["files"]["availability"]),
+    }}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""History chart data for the tile modal's "Price Trend by Lead Time" tab."""
+
+# Course columns shown in the chart tooltip, "self" first
+TOOLTIP_COURSES = 7
+
+
+def build_history_chart_frame(history_df, selected_courses, selected_course):
+    """Chart rows for `selected_courses`, the legend order and the tooltip columns.
+
+    The selected course is labelled "self". Every row carries the prices
+    of up to TOOLTIP_COURSES courses on its tee date so one tooltip can
+    compare them.
+    """
+    chart_df = history_df[
+        history_df["course_name"].isin(selected_courses)
+    ]
+    chart_df["course_label"] = chart_df["course_name"].where(
+        chart_df["course_name"] != selected_course,
+        "self"
+    )
+    chart_df["date_label"] = chart_df["tee_date"].dt.strftime("%A %b %d")
+
+    pivot_df = (
+        chart_df.pivot(
+            index="tee_date",
+            columns="course_label",
+            values="avg_price"
+        )
+        .reset_index()
+        .sort_values("tee_date", ascending=False)
+    )
+    pivot_df["date_label"] = pivot_df["tee_date"].dt.strftime("%A %b %d")
+
+    course_cols = [
+        c for c in pivot_df.columns
+        if c not in ("tee_date", "date_label")
+    ]
+    legend_order = sorted(course_cols)
+    if "self" in legend_order:
+        legend_order.remove("self")
+        legend_order = ["self"] + legend_order
+
+    tooltip_course_cols = legend_order[:TOOLTIP_COURSES]
+
+    # Merge pivot data into chart_df for tooltip access
+    chart_df_with_tooltip = chart_df.merge(
+        pivot_df[["tee_date", "date_label"] + tooltip_course_cols],
+        on="tee_date",
+        how="left"
+    )
+    return chart_df_with_tooltip, legend_order, tooltip_course_cols
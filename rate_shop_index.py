@@ -0,0 +1,67 @@
+"""Month and course-month views of the season summary.
+
+The Rate Shop screen shows one month of the summary and, for the selected
+course, one preferred-channel row per tee date. `SummaryIndex` groups the
+rows by (year, month) and (course, year, month) once per data load, so
+switching month or course is a dictionary lookup instead of a scan of the
+whole frame.
+"""
+import pandas as pd
+
+from rate_shop_calendar import select_course_rows
+from rate_shop_schema import shared_view
+
+
+def _month_positions(frame, keys):
+    """Row positions of `frame` grouped by `keys` plus tee date year and month."""
+    tee_dates = frame["tee_date"].dt
+    by = [frame[k].to_numpy() for k in keys] + [tee_dates.year.to_numpy(), tee_dates.month.to_numpy()]
+    return pd.Series(0, index=frame.index).groupby(by, sort=False).indices
+
+
+class SummaryIndex:
+    """Row positions of the summary and of its preferred rows, by month.
+
+    Expects a summary typed by rate_shop_schema. Views are taken from the
+    positions the first time they are asked for and handed out as shared
+    views, so a caller's edits stay its own.
+    """
+
+    def __init__(self, summary):
+        self._views = {}
+        if summary.empty:
+            self.summary = self.preferred = summary
+            self.courses = []
+            self._months = self._course_months = self._preferred_months = {}
+            return
+
+        self.summary = summary.reset_index(drop=True)
+        self.courses = sorted(self.summary["course_name"].unique())
+        # Same columns, in the same order, as select_course_rows on one course
+        self.preferred = select_course_rows(self.summary, keys=("course_name", "tee_date"))[
+            ["tee_date"] + [c for c in self.summary.columns if c != "tee_date"]
+        ]
+
+        self._months = _month_positions(self.summary, [])
+        self._course_months = _month_positions(self.summary, ["course_name"])
+        self._preferred_months = _month_positions(self.preferred, ["course_name"])
+
+    def _view(self, kind, frame, positions, key):
+        view = self._views.get((kind, key))
+        if view is None:
+            rows = positions.get(key, [])
+            view = frame.take(rows).reset_index(drop=True) if len(rows) else frame.iloc[:0]
+            self._views[(kind, key)] = view
+        return shared_view(view)
+
+    def month(self, year, month):
+        """Every summary row with a tee date in the month."""
+        return self._view("month", self.summary, self._months, (year, month))
+
+    def course_month(self, course, year, month):
+        """The course's summary rows, every channel, for the month."""
+        return self._view("course_month", self.summary, self._course_months, (course, year, month))
+
+    def preferred_rows(self, course, year, month):
+        """One row per tee date of the course for the month, as select_course_rows picks it."""
+        return self._view("preferred", self.preferred, self._preferred_months, (course, year, month))
@@ -0,0 +1,229 @@
+"""Byte-budgeted in-memory cache for the rate shop app's keyed loaders.
+
+`st.cache_data` without `max_entries` keeps every course, month and
+benchmark window a session ever asked for, so a long-running server only
+grows. `budget_cache` keeps each decorated loader under a byte budget
+measured with `DataFrame.memory_usage(deep=True)` instead, evicting either
+the least recently used entry or, with `cost_aware=True`, the one whose
+reload time is cheapest per byte (GreedyDual-Size). Caches live at module
+level, so they are shared by every session and survive reruns, and
+concurrent misses on one key run the loader once.
+
+    @budget_cache(max_bytes=64 * MB, ttl=300)
+    def fetch_benchmark_data(...):
+        ...
+"""
+import functools
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+import pandas as pd
+
+from rate_shop_schema import shared_view
+
+MB = 1024 * 1024
+
+_registry_lock = threading.Lock()
+_registry = {}
+
+
+def frame_bytes(value):
+    """Memory held by a loader result, counting object columns in full."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    return sys.getsizeof(value)
+
+
+class _Entry:
+    __slots__ = ("value", "size", "cost", "priority", "expires_at")
+
+    def __init__(self, value, size, cost, expires_at):
+        self.value = value
+        self.size = size
+        self.cost = cost
+        self.priority = 0.0
+        self.expires_at = expires_at
+
+
+class BudgetCache:
+    """Keyed results of one loader, kept under `max_bytes`.
+
+    Entries larger than the whole budget are returned but not kept. With
+    `cost_aware`, an entry's priority is the inflation value `L` plus its
+    load seconds per megabyte, refreshed on every hit; the lowest priority
+    goes first and becomes the new `L`, so entries nobody reads age out.
+    `load()` lets concurrent misses on a key share a single loader call.
+    """
+
+    def __init__(self, name, max_bytes, ttl=None, cost_aware=False):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.cost_aware = cost_aware
+        self._entries = OrderedDict()
+        # Key -> Future of the loader call filling it
+        self._inflight = {}
+        self._inflation = 0.0
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _prioritize(self, entry):
+        if self.cost_aware:
+            entry.priority = self._inflation + entry.cost / max(entry.size / MB, 1e-3)
+
+    def _drop(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        return entry
+
+    def _live(self, key):
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at is not None and entry.expires_at < time.time():
+            self._drop(key)
+            entry = None
+        return entry
+
+    def get(self, key):
+        """(True, value) for a live entry, else (False, None)."""
+        with self._lock:
+            entry = self._live(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            self._prioritize(entry)
+            return True, entry.value
+
+    def put(self, key, value, cost):
+        size = frame_bytes(value)
+        expires_at = None if self.ttl is None else time.time() + self.ttl
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if size > self.max_bytes:
+                return
+            entry = _Entry(value, size, cost, expires_at)
+            self._prioritize(entry)
+            self._entries[key] = entry
+            self._bytes += size
+            self._evict()
+
+    def load(self, key, loader):
+        """The value for `key`, calling `loader()` on a miss.
+
+        Callers missing on a key that is already loading wait for that
+        call and share its value or its exception instead of running the
+        loader again.
+        """
+        found, value = self.get(key)
+        if found:
+            return value
+        with self._lock:
+            # Filled or claimed since the miss above
+            entry = self._live(key)
+            if entry is not None:
+                return entry.value
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        if not owner:
+            return future.result()
+
+        start = time.perf_counter()
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+        self.put(key, value, time.perf_counter() - start)
+        with self._lock:
+            del self._inflight[key]
+        future.set_result(value)
+        return value
+
+    def _evict(self):
+        while self._bytes > self.max_bytes and self._entries:
+            if self.cost_aware:
+                key = min(self._entries, key=lambda k: self._entries[k].priority)
+                self._inflation = self._entries[key].priority
+            else:
+                key = next(iter(self._entries))
+            self._drop(key)
+            self.evictions += 1
+
+    def discard(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._inflation = 0.0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "cache": self.name,
+                "policy": "cost-aware LRU" if self.cost_aware else "LRU",
+                "entries": len(self._entries),
+                "mb": round(self._bytes / MB, 2),
+                "budget_mb": round(self.max_bytes / MB, 2),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+def budget_cache(max_bytes, ttl=None, cost_aware=False, name=None):
+    """Caches the decorated loader per positional arguments under `max_bytes`.
+
+    Like `st.cache_data`, the wrapper has `.clear()`, which takes the
+    loader's arguments to drop just that entry. It goes below
+    `@timed_loader`, which sees a miss when the body calls `cache_miss()`.
+    """
+    def decorate(fn):
+        cache_name = name or fn.__name__
+        # Streamlit re-runs the decorator on every rerun; keep the entries
+        with _registry_lock:
+            cache = _registry.get(cache_name)
+            if cache is None:
+                cache = _registry[cache_name] = BudgetCache(cache_name, max_bytes, ttl, cost_aware)
+            cache.max_bytes, cache.ttl, cache.cost_aware = max_bytes, ttl, cost_aware
+
+        @functools.wraps(fn)
+        def wrapper(*args):
+            return shared_view(cache.load(args, lambda: fn(*args)))
+
+        def clear(*args):
+            if args:
+                cache.discard(args)
+            else:
+                cache.clear()
+
+        wrapper.clear = clear
+        wrapper.cache = cache
+        return wrapper
+
+    return decorate
+
+
+def cache_stats():
+    """Footprint and hit counts of every budgeted cache, one row each."""
+    with _registry_lock:
+        caches = list(_registry.values())
+    return pd.DataFrame([cache.stats() for cache in caches])
+
@@ -0,0 +1,235 @@
+"""Gold-layer pipeline for the rate shop dashboard.
+
+Materializes the slot lifecycle, daily course summaries, market summaries
+and the benchmark rollup, partitioned by tee_date and clustered by
+course_name, so the dashboard reads pre-aggregated tables instead of raw
+scrapes. Each run rebuilds only the tee-date partitions whose source rows
+changed since the previous run.
+
+    python rate_shop_pipeline.py local raw_scrapes.parquet gold/
+    python rate_shop_pipeline.py bigquery
+
+The local mode runs entirely on Parquet with the pandas engine; the
+bigquery mode runs the same derivations as SQL into RATE_SHOP_GOLD_DATASET.
+"""
+import argparse
+import json
+import shutil
+from pathlib import Path
+
+import pandas as pd
+
+from rate_shop_engine import (
+    build_benchmark_rollup,
+    build_daily_course_summary,
+    build_market_summary,
+    build_slot_lifecycle,
+    join_market_summary,
+    label_occupancy,
+    load_scrape_rows,
+    normalize_scrape_rows,
+)
+
+# --------------------------
+# CONFIG
+# --------------------------
+
+GOLD_TABLES = [
+    "slot_lifecycle",
+    "daily_rate_summary",
+    "market_summary",
+    "benchmark_rollup",
+]
+
+MARKET_COLUMNS = ["tee_date", "market_min_price", "market_avg_price", "market_max_price"]
+
+STATE_FILE = "_pipeline_state.json"
+
+
+# --------------------------
+# CHANGE DETECTION
+# --------------------------
+
+def _fingerprint(row_count, first_scrape, last_scrape):
+    return {
+        "row_count": int(row_count),
+        "first_scrape": pd.Timestamp(first_scrape).isoformat(),
+        "last_scrape": pd.Timestamp(last_scrape).isoformat(),
+    }
+
+
+def source_fingerprints(rows):
+    """Row count and scrape span per tee date of normalized rows, keyed by ISO date."""
+    spans = rows.groupby("tee_date", sort=True).agg(
+        row_count=("scrape_timestamp", "size"),
+        first_scrape=("scrape_timestamp", "min"),
+        last_scrape=("scrape_timestamp", "max"),
+    )
+    return {
+        tee_date.strftime("%Y-%m-%d"): _fingerprint(*span)
+        for tee_date, span in zip(spans.index, spans.itertuples(index=False))
+    }
+
+
+def fingerprints_from_frame(frame):
+    """Same as source_fingerprints() for a fingerprint query or state table result."""
+    return {
+        pd.Timestamp(row.tee_date).strftime("%Y-%m-%d"): _fingerprint(
+            row.row_count, row.first_scrape, row.last_scrape
+        )
+        for row in frame.itertuples(index=False)
+    }
+
+
+def changed_partitions(fingerprints, state):
+    """Tee dates to rebuild and tee dates whose source rows disappeared."""
+    changed = sorted(d for d, fingerprint in fingerprints.items() if state.get(d) != fingerprint)
+    removed = sorted(set(state) - set(fingerprints))
+    return changed, removed
+
+
+# --------------------------
+# LOCAL PARQUET
+# --------------------------
+
+def build_gold_partitions(rows):
+    """Gold tables for the tee dates present in normalized `rows`."""
+    lifecycle = build_slot_lifecycle(rows)
+    daily = build_daily_course_summary(label_occupancy(lifecycle))
+    summary = join_market_summary(daily, build_market_summary(daily))
+    return {
+        "slot_lifecycle": lifecycle,
+        "daily_rate_summary": summary,
+        "market_summary": summary[MARKET_COLUMNS].drop_duplicates("tee_date"),
+        "benchmark_rollup": build_benchmark_rollup(rows),
+    }
+
+
+def write_partitions(table_dir, frame, tee_dates):
+    """Replaces the `tee_date=YYYY-MM-DD` directories of `tee_dates` with `frame` rows."""
+    for tee_date in tee_dates:
+        partition = table_dir / f"tee_date={tee_date}"
+        if partition.exists():
+            shutil.rmtree(partition)
+
+    # Rows are written course by course, the local stand-in for clustering
+    cluster_by = [c for c in ("course_name",) if c in frame.columns]
+    for tee_date, partition_frame in frame.groupby("tee_date", sort=True):
+        partition = table_dir / f"tee_date={tee_date:%Y-%m-%d}"
+        partition.mkdir(parents=True)
+        partition_frame.sort_values(cluster_by, kind="mergesort").to_parquet(
+            partition / "part-0.parquet", index=False
+        )
+
+
+def read_gold_table(gold_dir, table, start=None, end=None):
+    """Reads a local gold table, opening only the partitions between `start` and `end`."""
+    table_dir = Path(gold_dir) / table
+    start = pd.Timestamp(start) if start is not None else None
+    end = pd.Timestamp(end) if end is not None else None
+
+    files = []
+    for partition in sorted(table_dir.glob("tee_date=*")):
+        tee_date = pd.Timestamp(partition.name.split("=", 1)[1])
+        if (start is None or tee_date >= start) and (end is None or tee_date <= end):
+            files.extend(sorted(partition.glob("*.parquet")))
+
+    if not files:
+        return pd.DataFrame()
+    return pd.concat([pd.read_parquet(f) for f in files], ignore_index=True)
+
+
+def local_partitions(gold_dir):
+    """ISO tee dates with a partition directory in any local gold table."""
+    gold_dir = Path(gold_dir)
+    return {
+        partition.name.split("=", 1)[1]
+        for table in GOLD_TABLES
+        for partition in (gold_dir / table).glob("tee_date=*")
+    }
+
+
+def read_state(gold_dir):
+    path = Path(gold_dir) / STATE_FILE
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def run_local(source, gold_dir, full=False):
+    """Refreshes a local Parquet gold layer from raw scrape rows.
+
+    Partitions on disk whose tee date has no source rows are removed even
+    when the state does not list them, as on a `full` run.
+    """
+    gold_dir = Path(gold_dir)
+    rows = normalize_scrape_rows(load_scrape_rows(source))
+    fingerprints = source_fingerprints(rows)
+    state = {} if full else read_state(gold_dir)
+    changed, removed = changed_partitions(fingerprints, state)
+    removed = sorted(set(removed) | (local_partitions(gold_dir) - set(fingerprints)))
+
+    partitions = {}
+    if changed:
+        partitions = build_gold_partitions(rows[rows["tee_date"].isin(pd.to_datetime(changed))])
+    for table in GOLD_TABLES:
+        frame = partitions.get(table, pd.DataFrame(columns=["tee_date"]))
+        write_partitions(gold_dir / table, frame, changed + removed)
+
+    for tee_date in removed:
+        state.pop(tee_date, None)
+    for tee_date in changed:
+        state[tee_date] = fingerprints[tee_date]
+    gold_dir.mkdir(parents=True, exist_ok=True)
+    (gold_dir / STATE_FILE).write_text(json.dumps(state, indent=2, sort_keys=True))
+
+    return {"changed": changed, "removed": removed}
+
+
+# --------------------------
+# BIGQUERY
+# --------------------------
+
+def run_bigquery(full=False):
+    """Refreshes the gold dataset in BigQuery with SQL run inside the warehouse."""
+    from google.api_core.exceptions import NotFound
+
+    from rate_shop_bq import get_bq_client, run_query
+    from rate_shop_queries import gold_refresh_script, gold_state_sql, source_fingerprint_sql
+
+    fingerprints = fingerprints_from_frame(run_query(source_fingerprint_sql()))
+    state = {}
+    if not full:
+        try:
+            state = fingerprints_from_frame(run_query(gold_state_sql()))
+        except NotFound:
+            state = {}
+    changed, removed = changed_partitions(fingerprints, state)
+
+    if changed or removed:
+        get_bq_client().query(gold_refresh_script(changed, removed)).result()
+
+    return {"changed": changed, "removed": removed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Materialize the rate shop gold layer.")
+    parser.add_argument("--full", action="store_true", help="rebuild every partition")
+    modes = parser.add_subparsers(dest="mode", required=True)
+
+    local = modes.add_parser("local", help="raw Parquet in, Parquet gold layer out")
+    local.add_argument("source", help="Parquet file or directory of tee_time_clean rows")
+    local.add_argument("gold_dir", help="output directory for the gold tables")
+
+    modes.add_parser("bigquery", help="refresh the gold dataset inside BigQuery")
+
+    args = parser.parse_args()
+    if args.mode == "local":
+        report = run_local(args.source, args.gold_dir, full=args.full)
+    else:
+        report = run_bigquery(full=args.full)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
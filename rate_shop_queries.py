@@ -0,0 +1,907 @@
+"""SQL for the rate shop loaders.
+
+Every query is generated here so the course alias normalization is defined
+once, in rate_shop_engine.COURSE_ALIASES. Projections use a generated CASE
+expression; course filters expand a canonical course into its raw
+`course_name IN (...)` list so BigQuery can prune on the raw column.
+"""
+import os
+
+import pandas as pd
+
+from rate_shop_bq import PROJECT_ID
+from rate_shop_engine import (
+    ALIAS_TO_COURSE,
+    COURSE_ALIASES,
+    SEASON_START,
+    SUMMARY_COLUMNS,
+)
+
+SOURCE_TABLE = f"`{PROJECT_ID}.golf_silver.tee_time_clean`"
+
+# Dataset holding the tables materialized by rate_shop_pipeline
+GOLD_DATASET = os.environ.get("RATE_SHOP_GOLD_DATASET", "golf_gold")
+
+
+def gold_table(name):
+    """Fully qualified name of a gold-layer table."""
+    return f"`{PROJECT_ID}.{GOLD_DATASET}.{name}`"
+
+
+# --------------------------
+# COURSE ALIASES
+# --------------------------
+
+def sql_literal(value):
+    """Quotes a value as a BigQuery string literal."""
+    text = str(value).replace("\\", "\\\\").replace("'", "\\'")
+    return f"'{text}'"
+
+
+def course_case_sql(column="course_name"):
+    """CASE expression mapping raw course names to canonical ones."""
+    branches = "".join(
+        f"\n        WHEN {column} IN ({', '.join(sql_literal(a) for a in aliases)})"
+        f"\n            THEN {sql_literal(course)}"
+        for course, aliases in COURSE_ALIASES.items()
+    )
+    return f"CASE{branches}\n        ELSE {column}\n    END"
+
+
+def raw_course_names(course):
+    """Raw course_name values that normalize to `course`."""
+    if ALIAS_TO_COURSE.get(course, course) != course:
+        # An alias of another course never survives normalization
+        return []
+    return sorted(set(COURSE_ALIASES.get(course, [])) | {course})
+
+
+def course_filter_sql(course, column="course_name"):
+    """Predicate on the raw column selecting every alias of a canonical course."""
+    names = raw_course_names(course)
+    if not names:
+        return "FALSE"
+    return f"{column} IN ({', '.join(sql_literal(n) for n in names)})"
+
+
+def date_list_sql(dates):
+    """Comma-separated DATE literals; NULL for an empty list so IN () stays valid."""
+    return ", ".join(
+        f"DATE {sql_literal(pd.Timestamp(d).strftime('%Y-%m-%d'))}" for d in dates
+    ) or "NULL"
+
+
+def tee_date_filter_sql(tee_dates, column="tee_date"):
+    """`AND DATE(tee_date) IN (...)` restricting a query to some tee dates."""
+    if tee_dates is None:
+        return ""
+    return f"AND DATE({column}) IN ({date_list_sql(tee_dates)})"
+
+
+# --------------------------
+# LOADER QUERIES
+# --------------------------
+
+def summary_sql(tee_dates=None):
+    """Full-season daily course summary joined with the market summary."""
+    return f"""
+    WITH normalized AS (
+    SELECT
+        {course_case_sql()} AS course_name,
+        source_channel,
+        scrape_timestamp,
+        tee_date,
+        tee_time,
+        price
+    FROM {SOURCE_TABLE}
+    WHERE tee_date >= {sql_literal(SEASON_START)}
+    {tee_date_filter_sql(tee_dates)}
+    ),
+
+    daily_last_scrape AS (
+    SELECT
+        course_name,
+        source_channel,
+        tee_date,
+        MAX(scrape_timestamp) AS last_scrape_of_day
+    FROM normalized
+    GROUP BY course_name, source_channel, tee_date
+    ),
+
+    slot_lifecycle AS (
+    SELECT
+        n.course_name,
+        n.source_channel,
+        n.tee_date,
+        n.tee_time,
+        MIN(n.scrape_timestamp) AS first_seen_at,
+        MAX(n.scrape_timestamp) AS last_seen_at,
+        COUNT(DISTINCT n.scrape_timestamp) AS scrape_count,
+        AVG(n.price) AS avg_slot_price,
+        MIN(n.price) AS min_slot_price,
+        MAX(n.price) AS max_slot_price
+    FROM normalized n
+    GROUP BY
+        n.course_name,
+        n.source_channel,
+        n.tee_date,
+        n.tee_time
+    ),
+
+    occupancy_labeled AS (
+    SELECT
+        s.*,
+        d.last_scrape_of_day,
+        CASE
+        WHEN s.last_seen_at < d.last_scrape_of_day THEN 'OCCUPIED'
+        ELSE 'STILL_AVAILABLE'
+        END AS occupancy_status,
+        TIMESTAMP_DIFF(
+        s.last_seen_at,
+        s.first_seen_at,
+        MINUTE
+        ) AS minutes_available
+    FROM slot_lifecycle s
+    JOIN daily_last_scrape d
+        ON s.course_name = d.course_name
+    AND s.source_channel = d.source_channel
+    AND s.tee_date = d.tee_date
+    ),
+
+    daily_course_summary AS (
+    SELECT
+        course_name,
+        source_channel,
+        tee_date,
+
+        COUNT(*) AS total_slots,
+        SUM(IF(occupancy_status = 'OCCUPIED', 1, 0)) AS occupied_slots,
+
+        ROUND(
+        100 * SAFE_DIVIDE(
+            SUM(IF(occupancy_status = 'OCCUPIED', 1, 0)),
+            COUNT(*)
+        ),
+        2
+        ) AS occupancy_percent,
+
+        ROUND(AVG(minutes_available), 1) AS avg_minutes_available,
+        ROUND(AVG(avg_slot_price), 2) AS average_price,
+
+        MIN(min_slot_price) AS min_price,
+        MAX(max_slot_price) AS max_price
+
+    FROM occupancy_labeled
+    GROUP BY course_name, source_channel, tee_date
+    ),
+
+    market_summary AS (
+    SELECT
+        tee_date,
+        MIN(average_price) AS market_min_price,
+        AVG(average_price) AS market_avg_price,
+        MAX(average_price) AS market_max_price
+    FROM daily_course_summary
+    GROUP BY tee_date
+    )
+
+    SELECT
+    d.*,
+
+    m.market_min_price,
+    ROUND(m.market_avg_price, 2) AS market_avg_price,
+    m.market_max_price,
+
+    ROUND(
+        SAFE_DIVIDE(
+        d.average_price - m.market_avg_price,
+        m.market_avg_price
+        ) * 100,
+        2
+    ) AS price_gap_percent,
+
+    CASE
+        WHEN d.average_price >= m.market_max_price THEN 'HIGHEST_IN_MARKET'
+        WHEN d.average_price <= m.market_min_price THEN 'LOWEST_IN_MARKET'
+        WHEN d.average_price < m.market_avg_price THEN 'BELOW_AVERAGE'
+        WHEN d.average_price = m.market_avg_price THEN 'MARKET_AVERAGE'
+        ELSE 'ABOVE_AVERAGE'
+    END AS price_position_flag,
+
+    CASE
+        WHEN d.occupancy_percent >= 90 THEN 'HIGH_DEMAND'
+        WHEN d.occupancy_percent >= 60 THEN 'MEDIUM_DEMAND'
+        ELSE 'LOW_DEMAND'
+    END AS demand_pressure,
+
+    ROUND(
+        SAFE_DIVIDE(d.occupancy_percent, d.average_price),
+        4
+    ) AS revenue_efficiency_score
+
+    FROM daily_course_summary d
+    JOIN market_summary m
+    USING (tee_date)
+
+    ORDER BY tee_date, course_name
+    """
+
+
+def slot_lifecycle_sql(since=None, tee_dates=None):
+    """Mergeable slot lifecycle aggregates, optionally only scrapes after `since`."""
+    since_filter = ""
+    # NaT is an empty state's watermark: fetch everything
+    if since is not None and not pd.isna(since):
+        since_filter = f"AND scrape_timestamp > TIMESTAMP({sql_literal(since)})"
+
+    return f"""
+    WITH normalized AS (
+    SELECT
+        {course_case_sql()} AS course_name,
+        source_channel,
+        scrape_timestamp,
+        tee_date,
+        tee_time,
+        price
+    FROM {SOURCE_TABLE}
+    WHERE tee_date >= {sql_literal(SEASON_START)}
+    {since_filter}
+    {tee_date_filter_sql(tee_dates)}
+    )
+
+    SELECT
+        course_name,
+        source_channel,
+        tee_date,
+        tee_time,
+        MIN(scrape_timestamp) AS first_seen_at,
+        MAX(scrape_timestamp) AS last_seen_at,
+        COUNT(DISTINCT scrape_timestamp) AS scrape_count,
+        SUM(price) AS price_sum,
+        COUNT(price) AS price_count,
+        AVG(price) AS avg_slot_price,
+        MIN(price) AS min_slot_price,
+        MAX(price) AS max_slot_price,
+        ANY_VALUE(price) AS sample_price
+    FROM normalized
+    GROUP BY course_name, source_channel, tee_date, tee_time
+    """
+
+
+def benchmark_sql(as_of_start, as_of_end, checkin_start, checkin_end, channel):
+    """Course and market prices per as-of date and check-in date."""
+    return f"""
+    WITH normalized AS (
+        SELECT
+            {course_case_sql()} AS course_name,
+            source_channel,
+            DATE(scrape_timestamp) AS as_of_date,
+            DATE(tee_date) AS tee_date,
+            tee_time,
+            price,
+            scrape_timestamp
+        FROM {SOURCE_TABLE}
+        WHERE DATE(scrape_timestamp) BETWEEN DATE({sql_literal(as_of_start)}) AND DATE({sql_literal(as_of_end)})
+            AND DATE(tee_date) BETWEEN DATE({sql_literal(checkin_start)}) AND DATE({sql_literal(checkin_end)})
+            AND ({sql_literal(channel)} = 'ALL' OR source_channel = {sql_literal(channel)})
+    ),
+    daily_last_scrape AS (
+        SELECT
+            course_name,
+            source_channel,
+            as_of_date,
+            tee_date,
+            MAX(scrape_timestamp) AS last_scrape_of_day
+        FROM normalized
+        GROUP BY course_name, source_channel, as_of_date, tee_date
+    ),
+    slot_lifecycle AS (
+        SELECT
+            n.course_name,
+            n.source_channel,
+            n.as_of_date,
+            n.tee_date,
+            n.tee_time,
+            MIN(n.scrape_timestamp) AS first_seen_at,
+            MAX(n.scrape_timestamp) AS last_seen_at,
+            AVG(n.price) AS avg_slot_price
+        FROM normalized n
+        GROUP BY n.course_name, n.source_channel, n.as_of_date, n.tee_date, n.tee_time
+    ),
+    occupancy_labeled AS (
+        SELECT
+            s.course_name,
+            s.source_channel,
+            s.as_of_date,
+            s.tee_date,
+            s.avg_slot_price,
+            CASE
+                WHEN s.last_seen_at < d.last_scrape_of_day THEN 1
+                ELSE 0
+            END AS occupied_flag
+        FROM slot_lifecycle s
+        JOIN daily_last_scrape d
+            ON s.course_name = d.course_name
+         AND s.source_channel = d.source_channel
+         AND s.as_of_date = d.as_of_date
+         AND s.tee_date = d.tee_date
+    ),
+    daily_summary AS (
+        SELECT
+            as_of_date,
+            tee_date,
+            course_name,
+            ROUND(AVG(avg_slot_price),0) AS avg_price,
+            ROUND(100 * SAFE_DIVIDE(SUM(occupied_flag), COUNT(*)),0) AS occ_percent
+        FROM occupancy_labeled
+        GROUP BY as_of_date, tee_date, course_name
+    ),
+    market_summary AS (
+        SELECT
+            as_of_date,
+            tee_date,
+            MIN(avg_price) AS market_min,
+            MAX(avg_price) AS market_max,
+            ROUND(AVG(avg_price),0) AS market_avg
+        FROM daily_summary
+        GROUP BY as_of_date, tee_date
+    )
+    SELECT
+        d.as_of_date,
+        d.tee_date,
+        d.course_name,
+        d.avg_price,
+        d.occ_percent,
+        m.market_avg,
+        m.market_min,
+        m.market_max
+    FROM daily_summary d
+    JOIN market_summary m
+        ON d.as_of_date = m.as_of_date
+     AND d.tee_date = m.tee_date
+    ORDER BY as_of_date, tee_date, avg_price
+    """
+
+
+def _raw_availability_inputs_sql(course, month_start, month_end, prune):
+    """`day_bounds` and `slot_lifecycle` CTEs computed from raw scrapes."""
+    if prune:
+        course_filter = course_filter_sql(course)
+    else:
+        course_filter = f"{course_case_sql()} = {sql_literal(course)}"
+
+    return f"""
+    WITH normalized AS (
+      SELECT
+        {course_case_sql()} AS course_name,
+        source_channel,
+        tee_date,
+        tee_time,
+        price,
+        scrape_timestamp
+      FROM {SOURCE_TABLE}
+      WHERE DATE(tee_date) BETWEEN {sql_literal(month_start)} AND {sql_literal(month_end)}
+        AND {course_filter}
+    ),
+
+    -- Day boundaries per channel
+    day_bounds AS (
+      SELECT
+        course_name,
+        source_channel,
+        tee_date,
+        MIN(scrape_timestamp) AS first_scrape_ts,
+        MAX(scrape_timestamp) AS last_scrape_ts
+      FROM normalized
+      GROUP BY course_name, source_channel, tee_date
+    ),
+
+    -- Slot lifecycle per channel
+    slot_lifecycle AS (
+      SELECT
+        n.course_name,
+        n.source_channel,
+        n.tee_date,
+        n.tee_time,
+        MIN(n.scrape_timestamp) AS first_seen_at,
+        MAX(n.scrape_timestamp) AS last_seen_at,
+        ANY_VALUE(n.price) AS sample_price
+      FROM normalized n
+      GROUP BY n.course_name, n.source_channel, n.tee_date, n.tee_time
+    ),
+    """
+
+
+def _gold_availability_inputs_sql(course, month_start, month_end):
+    """`day_bounds` and `slot_lifecycle` CTEs read from the gold slot lifecycle."""
+    return f"""
+    WITH slot_lifecycle AS (
+      SELECT
+        course_name,
+        source_channel,
+        tee_date,
+        tee_time,
+        first_seen_at,
+        last_seen_at,
+        sample_price
+      FROM {gold_table("slot_lifecycle")}
+      WHERE tee_date BETWEEN DATE({sql_literal(month_start)}) AND DATE({sql_literal(month_end)})
+        AND course_name = {sql_literal(course)}
+    ),
+
+    -- Day boundaries per channel
+    day_bounds AS (
+      SELECT
+        course_name,
+        source_channel,
+        tee_date,
+        MIN(first_seen_at) AS first_scrape_ts,
+        MAX(last_seen_at) AS last_scrape_ts
+      FROM slot_lifecycle
+      GROUP BY course_name, source_channel, tee_date
+    ),
+    """
+
+
+def channel_availability_sql(course, month_start, month_end, prune=True, source="raw"):
+    """Per-slot channel availability for one course between two tee dates.
+
+    `source="gold"` reads the slot lifecycle materialized by
+    rate_shop_pipeline instead of raw scrapes. `prune=False` filters raw
+    rows on the normalized CASE expression instead of the raw course names;
+    it is kept only to compare bytes scanned.
+    """
+    if source == "gold":
+        inputs = _gold_availability_inputs_sql(course, month_start, month_end)
+    else:
+        inputs = _raw_availability_inputs_sql(course, month_start, month_end, prune)
+
+    return inputs + f"""
+    -- Classify lifecycle per channel
+    classified AS (
+      SELECT
+        s.course_name,
+        s.source_channel,
+        s.tee_date,
+        s.tee_time,
+        s.sample_price,
+
+        CASE
+          WHEN s.first_seen_at = d.first_scrape_ts
+               AND s.last_seen_at = d.last_scrape_ts
+            THEN 'STILL_AVAILABLE'
+
+          WHEN s.first_seen_at = d.first_scrape_ts
+               AND s.last_seen_at < d.last_scrape_ts
+            THEN 'SOLD_OUT'
+
+          WHEN s.first_seen_at > d.first_scrape_ts
+               AND s.last_seen_at = d.last_scrape_ts
+            THEN 'ADDED_LATER'
+
+          WHEN s.first_seen_at > d.first_scrape_ts
+               AND s.last_seen_at < d.last_scrape_ts
+            THEN 'ADDED_AND_SOLD'
+        END AS lifecycle_status
+
+      FROM slot_lifecycle s
+      JOIN day_bounds d
+        ON s.course_name = d.course_name
+       AND s.source_channel = d.source_channel
+       AND s.tee_date = d.tee_date
+    ),
+
+    -- Pivot per slot
+    pivoted AS (
+      SELECT
+        course_name,
+        tee_date,
+        tee_time,
+
+        MAX(IF(source_channel='brand', sample_price, NULL)) AS brand_price,
+        MAX(IF(source_channel='golfnow', sample_price, NULL)) AS golfnow_price,
+        MAX(IF(source_channel='teeoff', sample_price, NULL)) AS teeoff_price,
+        MAX(IF(source_channel='supremegolf', sample_price, NULL)) AS supremegolf_price,
+
+        MAX(IF(source_channel='brand', lifecycle_status, NULL)) AS brand_availability_status,
+        MAX(IF(source_channel='golfnow', lifecycle_status, NULL)) AS golfnow_availability_status,
+        MAX(IF(source_channel='teeoff', lifecycle_status, NULL)) AS teeoff_availability_status,
+        MAX(IF(source_channel='supremegolf', lifecycle_status, NULL)) AS supremegolf_availability_status
+
+      FROM classified
+      GROUP BY course_name, tee_date, tee_time
+    )
+
+    SELECT
+      ROW_NUMBER() OVER (PARTITION BY tee_date ORDER BY tee_time) AS Row,
+      course_name,
+      tee_date,
+      tee_time,
+
+      brand_price AS brand_current_price,
+      golfnow_price AS golfnow_current_price,
+      teeoff_price AS teeoff_current_price,
+      supremegolf_price AS supremegolf_current_price,
+
+      COALESCE(brand_availability_status, 'NEVER_LISTED') AS brand_availability_status,
+      COALESCE(golfnow_availability_status, 'NEVER_LISTED') AS golfnow_availability_status,
+      COALESCE(teeoff_availability_status, 'NEVER_LISTED') AS teeoff_availability_status,
+      COALESCE(supremegolf_availability_status, 'NEVER_LISTED') AS supremegolf_availability_status,
+
+      CASE
+        -- All channels never listed
+        WHEN COALESCE(brand_availability_status, 'NEVER_LISTED') = 'NEVER_LISTED'
+         AND COALESCE(golfnow_availability_status, 'NEVER_LISTED') = 'NEVER_LISTED'
+         AND COALESCE(teeoff_availability_status, 'NEVER_LISTED') = 'NEVER_LISTED'
+         AND COALESCE(supremegolf_availability_status, 'NEVER_LISTED') = 'NEVER_LISTED'
+          THEN 'NOT_AVAILABLE_ANYWHERE'
+
+        -- All channels sold out or never listed (not currently available)
+        WHEN COALESCE(brand_availability_status, 'NEVER_LISTED') IN ('SOLD_OUT', 'NEVER_LISTED', 'ADDED_AND_SOLD')
+         AND COALESCE(golfnow_availability_status, 'NEVER_LISTED') IN ('SOLD_OUT', 'NEVER_LISTED', 'ADDED_AND_SOLD')
+         AND COALESCE(teeoff_availability_status, 'NEVER_LISTED') IN ('SOLD_OUT', 'NEVER_LISTED', 'ADDED_AND_SOLD')
+         AND COALESCE(supremegolf_availability_status, 'NEVER_LISTED') IN ('SOLD_OUT', 'NEVER_LISTED', 'ADDED_AND_SOLD')
+          THEN 'SOLD_OUT_EVERYWHERE'
+
+        -- Brand and at least one OTA currently available
+        WHEN COALESCE(brand_availability_status, 'NEVER_LISTED') IN ('STILL_AVAILABLE', 'ADDED_LATER')
+         AND (COALESCE(golfnow_availability_status, 'NEVER_LISTED') IN ('STILL_AVAILABLE', 'ADDED_LATER')
+           OR COALESCE(teeoff_availability_status, 'NEVER_LISTED') IN ('STILL_AVAILABLE', 'ADDED_LATER')
+           OR COALESCE(supremegolf_availability_status, 'NEVER_LISTED') IN ('STILL_AVAILABLE', 'ADDED_LATER'))
+          THEN 'BRAND_AND_OTA'
+
+        -- Only brand currently available
+        WHEN COALESCE(brand_availability_status, 'NEVER_LISTED') IN ('STILL_AVAILABLE', 'ADDED_LATER')
+          THEN 'BRAND_ONLY'
+
+        -- Only OTA channels currently available
+        WHEN COALESCE(golfnow_availability_status, 'NEVER_LISTED') IN ('STILL_AVAILABLE', 'ADDED_LATER')
+          OR COALESCE(teeoff_availability_status, 'NEVER_LISTED') IN ('STILL_AVAILABLE', 'ADDED_LATER')
+          OR COALESCE(supremegolf_availability_status, 'NEVER_LISTED') IN ('STILL_AVAILABLE', 'ADDED_LATER')
+          THEN 'OTA_ONLY'
+
+        ELSE 'NOT_AVAILABLE_ANYWHERE'
+      END AS overall_availability_status
+
+    FROM pivoted
+    ORDER BY tee_date, tee_time
+    """
+
+
+def history_chart_sql(date_str=None):
+    """Average price per course and tee date from the season start to `date_str`, or all of it."""
+    date_bound = ""
+    if date_str is not None:
+        date_bound = f"AND CAST(tee_date AS DATE) <= CAST({sql_literal(date_str)} AS DATE)"
+    return f"""
+    WITH normalized AS (
+      SELECT
+        {course_case_sql()} AS course_name,
+        source_channel,
+        CAST(tee_date AS DATE) AS tee_date,
+        price,
+        scrape_timestamp
+      FROM {SOURCE_TABLE}
+      WHERE CAST(tee_date AS DATE) >= CAST({sql_literal(SEASON_START)} AS DATE)
+        {date_bound}
+    )
+    SELECT
+        course_name,
+        tee_date,
+        AVG(price) AS avg_price
+    FROM normalized
+    GROUP BY course_name, tee_date
+    ORDER BY tee_date DESC, course_name
+    """
+
+
+# --------------------------
+# GOLD LAYER
+# --------------------------
+
+def source_fingerprint_sql(tee_dates=None):
+    """Row count and scrape span per tee date of the raw source, for change detection."""
+    return f"""
+    SELECT
+        DATE(tee_date) AS tee_date,
+        COUNT(*) AS row_count,
+        MIN(scrape_timestamp) AS first_scrape,
+        MAX(scrape_timestamp) AS last_scrape
+    FROM {SOURCE_TABLE}
+    WHERE tee_date >= {sql_literal(SEASON_START)}
+    {tee_date_filter_sql(tee_dates)}
+    GROUP BY tee_date
+    """
+
+
+def benchmark_rollup_sql(tee_dates=None, since_date=None):
+    """Per as-of date slot counts; see rate_shop_engine.build_benchmark_rollup().
+
+    `since_date` keeps only as-of dates from that date on, each in full.
+    """
+    since_filter = ""
+    if since_date is not None:
+        since_filter = f"AND DATE(scrape_timestamp) >= DATE({sql_literal(since_date)})"
+
+    return f"""
+    WITH normalized AS (
+        SELECT
+            {course_case_sql()} AS course_name,
+            source_channel,
+            DATE(scrape_timestamp) AS as_of_date,
+            DATE(tee_date) AS tee_date,
+            tee_time,
+            price,
+            scrape_timestamp
+        FROM {SOURCE_TABLE}
+        WHERE tee_date >= {sql_literal(SEASON_START)}
+        {tee_date_filter_sql(tee_dates)}
+        {since_filter}
+    ),
+    slot_lifecycle AS (
+        SELECT
+            course_name,
+            source_channel,
+            as_of_date,
+            tee_date,
+            tee_time,
+            MAX(scrape_timestamp) AS last_seen_at,
+            AVG(price) AS avg_slot_price
+        FROM normalized
+        GROUP BY course_name, source_channel, as_of_date, tee_date, tee_time
+    ),
+    occupancy_labeled AS (
+        SELECT
+            *,
+            last_seen_at < MAX(last_seen_at) OVER (
+                PARTITION BY course_name, source_channel, as_of_date, tee_date
+            ) AS occupied
+        FROM slot_lifecycle
+    ),
+    -- Sales dated by each slot's last sighting over every as-of date
+    slot_sales AS (
+        SELECT
+            course_name,
+            source_channel,
+            DATE(last_seen_at) AS as_of_date,
+            tee_date,
+            last_seen_at < MAX(last_seen_at) OVER (
+                PARTITION BY course_name, source_channel, tee_date
+            ) AS sold
+        FROM (
+            SELECT course_name, source_channel, tee_date, tee_time, MAX(scrape_timestamp) AS last_seen_at
+            FROM normalized
+            GROUP BY course_name, source_channel, tee_date, tee_time
+        )
+    ),
+    sales AS (
+        SELECT course_name, source_channel, as_of_date, tee_date, COUNTIF(sold) AS sold_slots
+        FROM slot_sales
+        GROUP BY course_name, source_channel, as_of_date, tee_date
+    ),
+    rollup AS (
+        SELECT
+            course_name,
+            source_channel,
+            as_of_date,
+            tee_date,
+            COUNT(*) AS slot_count,
+            COUNTIF(occupied) AS occupied_slots,
+            SUM(avg_slot_price) AS slot_price_sum,
+            COUNT(avg_slot_price) AS priced_slot_count
+        FROM occupancy_labeled
+        GROUP BY course_name, source_channel, as_of_date, tee_date
+    )
+    SELECT
+        r.course_name,
+        r.source_channel,
+        r.as_of_date,
+        r.tee_date,
+        r.slot_count,
+        r.occupied_slots,
+        r.slot_price_sum,
+        r.priced_slot_count,
+        -- Last, where ALTER TABLE adds it to older gold tables
+        COALESCE(s.sold_slots, 0) AS sold_slots
+    FROM rollup r
+    LEFT JOIN sales s
+      ON r.course_name = s.course_name
+     AND r.source_channel = s.source_channel
+     AND r.as_of_date = s.as_of_date
+     AND r.tee_date = s.tee_date
+    """
+
+
+# Gold table -> query producing its rows for some tee dates
+GOLD_SELECTS = {
+    "slot_lifecycle": lambda tee_dates: slot_lifecycle_sql(tee_dates=tee_dates),
+    "daily_rate_summary": lambda tee_dates: summary_sql(tee_dates=tee_dates),
+    "benchmark_rollup": benchmark_rollup_sql,
+}
+
+
+def gold_refresh_script(tee_dates, removed_dates=()):
+    """Multi-statement script rebuilding the gold partitions of `tee_dates`.
+
+    Tables are partitioned by tee_date and clustered by course_name.
+    Partitions listed in `removed_dates` are dropped.
+    """
+    dates = date_list_sql(list(tee_dates) + list(removed_dates))
+    changed = date_list_sql(tee_dates)
+    statements = [f"CREATE SCHEMA IF NOT EXISTS `{PROJECT_ID}.{GOLD_DATASET}`"]
+
+    for name, select in GOLD_SELECTS.items():
+        statements.append(f"""
+    CREATE TABLE IF NOT EXISTS {gold_table(name)}
+    PARTITION BY tee_date
+    CLUSTER BY course_name
+    AS SELECT * REPLACE (DATE(tee_date) AS tee_date) FROM ({select([])}) WHERE FALSE""")
+    # Added after the first release; rows written before it stay NULL until
+    # a full run rebuilds them
+    statements.append(f"""
+    ALTER TABLE {gold_table("benchmark_rollup")}
+    ADD COLUMN IF NOT EXISTS sold_slots INT64""")
+    statements.append(f"""
+    CREATE TABLE IF NOT EXISTS {gold_table("market_summary")} (
+        tee_date DATE,
+        market_min_price FLOAT64,
+        market_avg_price FLOAT64,
+        market_max_price FLOAT64
+    )
+    PARTITION BY tee_date""")
+    statements.append(f"""
+    CREATE TABLE IF NOT EXISTS {gold_table("pipeline_state")} (
+        tee_date DATE,
+        row_count INT64,
+        first_scrape TIMESTAMP,
+        last_scrape TIMESTAMP,
+        refreshed_at TIMESTAMP
+    )""")
+
+    statements.append("BEGIN TRANSACTION")
+    for name, select in GOLD_SELECTS.items():
+        statements.append(f"DELETE FROM {gold_table(name)} WHERE tee_date IN ({dates})")
+        statements.append(f"""
+    INSERT INTO {gold_table(name)}
+    SELECT * REPLACE (DATE(tee_date) AS tee_date) FROM ({select(tee_dates)})""")
+    statements.append(f"DELETE FROM {gold_table('market_summary')} WHERE tee_date IN ({dates})")
+    statements.append(f"""
+    INSERT INTO {gold_table("market_summary")}
+    SELECT DISTINCT tee_date, market_min_price, market_avg_price, market_max_price
+    FROM {gold_table("daily_rate_summary")}
+    WHERE tee_date IN ({changed})""")
+    statements.append(f"DELETE FROM {gold_table('pipeline_state')} WHERE tee_date IN ({dates})")
+    statements.append(f"""
+    INSERT INTO {gold_table("pipeline_state")}
+    SELECT *, CURRENT_TIMESTAMP() AS refreshed_at FROM ({source_fingerprint_sql(tee_dates)})""")
+    statements.append("COMMIT TRANSACTION")
+
+    return ";\n".join(statements) + ";"
+
+
+def gold_state_sql():
+    """Source fingerprints recorded by the last pipeline run."""
+    return f"""
+    SELECT tee_date, row_count, first_scrape, last_scrape
+    FROM {gold_table("pipeline_state")}
+    """
+
+
+def gold_summary_sql():
+    """The load_data() frame read from the gold daily summary."""
+    return f"""
+    SELECT {", ".join(SUMMARY_COLUMNS)}
+    FROM {gold_table("daily_rate_summary")}
+    WHERE tee_date >= {sql_literal(SEASON_START)}
+    ORDER BY tee_date, course_name
+    """
+
+
+def gold_benchmark_sql(as_of_start, as_of_end, checkin_start, checkin_end, channel):
+    """The fetch_benchmark_data() frame aggregated from the gold benchmark rollup."""
+    return f"""
+    WITH daily_summary AS (
+        SELECT
+            as_of_date,
+            tee_date,
+            course_name,
+            ROUND(SAFE_DIVIDE(SUM(slot_price_sum), SUM(priced_slot_count)), 0) AS avg_price,
+            ROUND(100 * SAFE_DIVIDE(SUM(occupied_slots), SUM(slot_count)), 0) AS occ_percent
+        FROM {gold_table("benchmark_rollup")}
+        WHERE as_of_date BETWEEN DATE({sql_literal(as_of_start)}) AND DATE({sql_literal(as_of_end)})
+            AND tee_date BETWEEN DATE({sql_literal(checkin_start)}) AND DATE({sql_literal(checkin_end)})
+            AND ({sql_literal(channel)} = 'ALL' OR source_channel = {sql_literal(channel)})
+        GROUP BY as_of_date, tee_date, course_name
+    ),
+    market_summary AS (
+        SELECT
+            as_of_date,
+            tee_date,
+            MIN(avg_price) AS market_min,
+            MAX(avg_price) AS market_max,
+            ROUND(AVG(avg_price),0) AS market_avg
+        FROM daily_summary
+        GROUP BY as_of_date, tee_date
+    )
+    SELECT
+        d.as_of_date,
+        d.tee_date,
+        d.course_name,
+        d.avg_price,
+        d.occ_percent,
+        m.market_avg,
+        m.market_min,
+        m.market_max
+    FROM daily_summary d
+    JOIN market_summary m
+        ON d.as_of_date = m.as_of_date
+     AND d.tee_date = m.tee_date
+    ORDER BY as_of_date, tee_date, avg_price
+    """
+
+
+def gold_history_chart_sql(date_str=None):
+    """history_chart_sql() answered from the gold slot lifecycle price sums."""
+    date_bound = ""
+    if date_str is not None:
+        date_bound = f"AND tee_date <= DATE({sql_literal(date_str)})"
+    return f"""
+    SELECT
+        course_name,
+        tee_date,
+        SAFE_DIVIDE(SUM(price_sum), SUM(price_count)) AS avg_price
+    FROM {gold_table("slot_lifecycle")}
+    WHERE tee_date >= DATE({sql_literal(SEASON_START)})
+    {date_bound}
+    GROUP BY course_name, tee_date
+    ORDER BY tee_date DESC, course_name
+    """
+
+
+# --------------------------
+# DASHBOARD LOADERS BY SOURCE
+# --------------------------
+
+def dashboard_summary_sql(source="raw"):
+    """The load_data() query for `source` ("raw" or "gold")."""
+    if source == "gold":
+        return gold_summary_sql()
+    return summary_sql()
+
+
+def dashboard_benchmark_sql(as_of_start, as_of_end, checkin_start, checkin_end, channel, source="raw"):
+    """The fetch_benchmark_data() query for `source`."""
+    if source == "gold":
+        return gold_benchmark_sql(as_of_start, as_of_end, checkin_start, checkin_end, channel)
+    return benchmark_sql(as_of_start, as_of_end, checkin_start, checkin_end, channel)
+
+
+def dashboard_history_sql(source="raw"):
+    """The season-wide price history query for `source`."""
+    if source == "gold":
+        return gold_history_chart_sql()
+    return history_chart_sql()
+
+
+def dashboard_pace_sql(since_date=None, source="raw"):
+    """The benchmark rollup behind the pace cube, from `since_date` on, for `source`."""
+    if source == "gold":
+        since_filter = ""
+        if since_date is not None:
+            since_filter = f"AND as_of_date >= DATE({sql_literal(since_date)})"
+        return f"""
+    SELECT
+        course_name,
+        source_channel,
+        as_of_date,
+        tee_date,
+        slot_count,
+        occupied_slots,
+        slot_price_sum,
+        priced_slot_count,
+        sold_slots
+    FROM {gold_table("benchmark_rollup")}
+    WHERE tee_date >= DATE({sql_literal(SEASON_START)})
+    {since_filter}
+    """
+    return benchmark_rollup_sql(since_date=since_date)
@@ -0,0 +1,118 @@
+"""Typed, compact, shared datasets for the rate shop app's loaders.
+
+Loaders parse dates, encode repeated labels as categoricals and narrow
+integer counts once, when a result is loaded, and cache the typed frame. Callers
+get a shallow copy of it: under pandas copy-on-write, the only mode from
+pandas 3 (pinned in requirements.txt), the copy shares the cached buffers,
+and any edit a session makes (a changed cell, a new column) lands on its
+own copy instead of the frame every other session reads.
+"""
+import threading
+
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype
+
+# Columns parsed to datetime64 at load, per dataset
+DATE_COLUMNS = {
+    "summary": ("tee_date",),
+    "benchmark": ("as_of_date", "tee_date"),
+    "availability": ("tee_date",),
+    "history": ("tee_date",),
+    "pace": ("as_of_date", "tee_date"),
+}
+
+# Low-cardinality labels repeated on every row, stored as categoricals
+CATEGORY_COLUMNS = {
+    "summary": ("course_name", "source_channel", "price_position_flag", "demand_pressure"),
+    "benchmark": ("course_name",),
+    "availability": (
+        "course_name",
+        "tee_time",
+        "brand_availability_status",
+        "golfnow_availability_status",
+        "teeoff_availability_status",
+        "supremegolf_availability_status",
+        "overall_availability_status",
+    ),
+    "history": (),
+    "pace": (),
+}
+
+# Slot counts and flags fit these comfortably. Floats stay 64-bit: prices,
+# price sums and the percents derived from them are shown and summed to the
+# cent, and float32 holds only about seven significant digits
+NARROW_TYPES = {
+    "int64": "int32",
+    "Int64": "Int32",
+}
+INT32_MAX = 2 ** 31 - 1
+
+_lock = threading.Lock()
+_footprints = {}
+
+
+def frame_mb(frame):
+    """Memory held by `frame` in megabytes, counting object columns in full."""
+    return frame.memory_usage(index=True, deep=True).sum() / (1024 * 1024)
+
+
+def _narrow_type(series):
+    narrow = NARROW_TYPES.get(str(series.dtype))
+    if narrow:
+        largest = series.dropna().abs().max()
+        # Empty and all-NA columns have no max; leave them as loaded
+        if pd.isna(largest) or largest > INT32_MAX:
+            return None
+    return narrow
+
+
+def typed(frame, dataset):
+    """`frame` in the compact schema of `dataset`, as every loader returns it.
+
+    Dates become datetime64, repeated labels categoricals and 64-bit
+    integers that fit int32 their 32-bit types; floats keep full precision. The memory saved is recorded for
+    `memory_report()`.
+    """
+    parsed = {
+        column: pd.to_datetime(frame[column])
+        for column in DATE_COLUMNS[dataset]
+        if column in frame.columns and not is_datetime64_any_dtype(frame[column])
+    }
+    dtypes = {
+        column: "category"
+        for column in CATEGORY_COLUMNS[dataset]
+        if column in frame.columns and not isinstance(frame[column].dtype, pd.CategoricalDtype)
+    }
+    for column in frame.columns:
+        if column not in dtypes and column not in parsed:
+            narrow = _narrow_type(frame[column])
+            if narrow:
+                dtypes[column] = narrow
+    if not parsed and not dtypes:
+        return frame
+
+    compact = frame.assign(**parsed).astype(dtypes)
+    with _lock:
+        _footprints[dataset] = {
+            "dataset": dataset,
+            "rows": len(frame),
+            "mb_loaded": round(frame_mb(frame), 2),
+            "mb_compact": round(frame_mb(compact), 2),
+        }
+    return compact
+
+
+def memory_report():
+    """Loaded versus compact size of the latest frame of each dataset."""
+    with _lock:
+        report = pd.DataFrame(list(_footprints.values()))
+    if not report.empty:
+        report["ratio"] = (report["mb_loaded"] / report["mb_compact"]).round(1)
+    return report
+
+
+def shared_view(value):
+    """A caller's handle on a cached frame; edits to it never reach the cache."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=False)
+    return value
@@ -0,0 +1,178 @@
+"""Stale-while-revalidate loading from last-good local snapshots.
+
+Loaders write each good result of a named dataset to a local Arrow
+snapshot with `save_snapshot()`. Until a dataset has loaded live in this
+process, readers get its last snapshot right away while the live load
+runs in the background, so the first paint never waits on the warehouse,
+and a failed load leaves the snapshot on screen instead of an empty page.
+
+    value, stale = stale_while_revalidate(("summary", "raw"), load_summary_index,
+                                          frame_of=lambda index: index.summary,
+                                          from_frame=SummaryIndex)
+"""
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import wait
+
+from rate_shop_diskcache import CACHE_DIR, DiskCache
+from rate_shop_tasks import get_executor
+
+logger = logging.getLogger(__name__)
+
+# --------------------------
+# CONFIG
+# --------------------------
+
+SNAPSHOT_DIR = os.environ.get("RATE_SHOP_SNAPSHOT_DIR", os.path.join(CACHE_DIR, "snapshots"))
+SNAPSHOT_MAX_BYTES = int(os.environ.get("RATE_SHOP_SNAPSHOT_MAX_BYTES", str(256 * 1024 * 1024)))
+
+# Seconds a failed background load is shown before it is tried again
+RETRY_SECONDS = int(os.environ.get("RATE_SHOP_SNAPSHOT_RETRY_SECONDS", "60"))
+
+# How a reader was answered from a snapshot: when it was saved, whether the
+# live load is still running, and why it failed if it did
+Staleness = namedtuple("Staleness", ["saved_at", "pending", "error"])
+
+_lock = threading.Lock()
+_store = None
+_live = set()
+_loads = {}
+_restored = {}
+
+
+def get_snapshot_store():
+    """Returns the process-wide snapshot directory."""
+    global _store
+    with _lock:
+        if _store is None:
+            _store = DiskCache(SNAPSHOT_DIR, SNAPSHOT_MAX_BYTES)
+        return _store
+
+
+def _key(name):
+    return hashlib.sha256(repr(name).encode("utf-8")).hexdigest()
+
+
+def save_snapshot(name, frame):
+    """Replaces the snapshot of `name`; a full or read-only disk only loses the snapshot."""
+    try:
+        get_snapshot_store().put(_key(name), frame)
+    except OSError:
+        logger.warning("Could not save the %r snapshot", name, exc_info=True)
+
+
+def read_snapshot(name):
+    """(frame, saved_at) of the last snapshot of `name`, or (None, None)."""
+    entry = get_snapshot_store().get_entry(_key(name))
+    if entry is None:
+        return None, None
+    frame, info = entry
+    return frame, info.get("created_at")
+
+
+def age_label(saved_at, now=None):
+    """'just now', '12 min ago', '3 h ago' or '2 days ago'."""
+    seconds = max(0, (now or time.time()) - saved_at)
+    if seconds < 60:
+        return "just now"
+    if seconds < 3600:
+        return f"{int(seconds // 60)} min ago"
+    if seconds < 86400:
+        return f"{int(seconds // 3600)} h ago"
+    return f"{int(seconds // 86400)} days ago"
+
+
+# --------------------------
+# REVALIDATION
+# --------------------------
+
+def _identity(value):
+    return value
+
+
+def _load_live(load, frame_of):
+    value = load()
+    # An empty result is no better than the snapshot; keep the snapshot then
+    if frame_of(value).empty:
+        raise ValueError("the load returned no rows")
+    return value
+
+
+def _finished(future):
+    future.finished_at = time.time()
+
+
+def revalidate(name, load, frame_of=_identity):
+    """Starts loading `name` in the background unless it has been; returns the future.
+
+    A failed load is kept for RETRY_SECONDS before it is tried again.
+    """
+    with _lock:
+        future = _loads.get(name)
+        if future is not None and (
+            not future.done()
+            or future.exception() is None
+            or time.time() - getattr(future, "finished_at", time.time()) < RETRY_SECONDS
+        ):
+            return future
+        future = get_executor().submit(_load_live, load, frame_of)
+        future.add_done_callback(_finished)
+        _loads[name] = future
+        return future
+
+
+def pending(name):
+    """Whether a background load of `name` is still running."""
+    with _lock:
+        future = _loads.get(name)
+    return future is not None and not future.done()
+
+
+def _restore(name, frame, saved_at, from_frame):
+    # Readers rerun often; convert each snapshot once
+    with _lock:
+        restored = _restored.get(name)
+        if restored is not None and restored[0] == saved_at:
+            return restored[1]
+    value = from_frame(frame)
+    with _lock:
+        _restored[name] = (saved_at, value)
+    return value
+
+
+def stale_while_revalidate(name, load, frame_of=_identity, from_frame=_identity):
+    """(value, staleness) for the dataset `name`.
+
+    Once `load()` has succeeded in this process it is called directly and
+    staleness is None. Before that, the live load runs in the background
+    and the last snapshot, converted with `from_frame`, is returned with
+    its Staleness. Without a snapshot the call waits for the live load,
+    and raises its error if it fails.
+    """
+    with _lock:
+        live = name in _live
+    if live:
+        return load(), None
+
+    future = revalidate(name, load, frame_of)
+    if not future.done():
+        frame, saved_at = read_snapshot(name)
+        if frame is not None:
+            return _restore(name, frame, saved_at, from_frame), Staleness(saved_at, True, None)
+        wait([future])
+
+    error = future.exception()
+    if error is None:
+        with _lock:
+            _live.add(name)
+            _restored.pop(name, None)
+        return future.result(), None
+
+    frame, saved_at = read_snapshot(name)
+    if frame is None:
+        raise error
+    return _restore(name, frame, saved_at, from_frame), Staleness(saved_at, False, error)
@@ -0,0 +1,117 @@
+"""Background and concurrent work for the rate shop app.
+
+A bounded thread pool shared by every session in the process, a
+per-session prefetcher that warms cached loaders before the user clicks,
+and `gather()`, which runs a page's independent loaders at once.
+"""
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from streamlit.runtime.scriptrunner import add_script_run_ctx
+
+logger = logging.getLogger(__name__)
+
+# --------------------------
+# CONFIG
+# --------------------------
+
+BACKGROUND_WORKERS = int(os.environ.get("RATE_SHOP_BACKGROUND_WORKERS", "2"))
+
+_lock = threading.Lock()
+_executor = None
+
+
+def get_executor():
+    """Returns the process-wide background thread pool."""
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=BACKGROUND_WORKERS,
+                thread_name_prefix="rate-shop-bg",
+            )
+        return _executor
+
+
+def _run_quietly(fn, *args):
+    """Runs a warm-up call; failures are logged, the real call will surface them."""
+    try:
+        fn(*args)
+    except Exception:
+        logger.exception("Background call %s%r failed", getattr(fn, "__name__", fn), args)
+
+
+# --------------------------
+# PREFETCH
+# --------------------------
+
+class Prefetcher:
+    """Warms loader results for one session.
+
+    `schedule()` queues `(fn, args)` calls on the shared pool under a key
+    such as (course, year, month). Scheduling a different key cancels
+    everything still queued for the previous one.
+    """
+
+    def __init__(self):
+        self.key = None
+        self.futures = []
+
+    def schedule(self, key, tasks):
+        if key == self.key:
+            return
+        self.cancel()
+        executor = get_executor()
+        self.key = key
+        self.futures = [executor.submit(_run_quietly, fn, *args) for fn, args in tasks]
+
+    def cancel(self):
+        for future in self.futures:
+            future.cancel()
+        self.key = None
+        self.futures = []
+
+    def pending(self):
+        return sum(not future.done() for future in self.futures)
+
+
+# --------------------------
+# GATHER
+# --------------------------
+
+def gather(calls):
+    """Runs independent `(fn, args)` calls at once; returns their results in order.
+
+    The first call runs on the calling thread and the others on threads
+    of their own that carry the session's script context, so loaders can
+    still write errors to the page. Every call finishes before the first
+    failure, in call order, is re-raised. A page waits for its slowest
+    query instead of the sum of them.
+    """
+    results = [None] * len(calls)
+    errors = [None] * len(calls)
+
+    def run(i):
+        fn, args = calls[i]
+        try:
+            results[i] = fn(*args)
+        except BaseException as e:
+            errors[i] = e
+
+    threads = [
+        add_script_run_ctx(threading.Thread(target=run, args=(i,), name=f"rate-shop-gather-{i}"))
+        for i in range(1, len(calls))
+    ]
+    for thread in threads:
+        thread.start()
+    if calls:
+        run(0)
+    for thread in threads:
+        thread.join()
+
+    for error in errors:
+        if error is not None:
+            raise error
+    return results
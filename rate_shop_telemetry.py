@@ -0,0 +1,208 @@
+"""Loader telemetry for the rate shop app.
+
+Times every instrumented loader call, tells `st.cache_data` hits from
+misses, and collects the BigQuery job statistics of the queries a call
+runs. Records are kept in memory for the diagnostics panel and, when
+RATE_SHOP_TELEMETRY_LOG names a file, appended to it as JSON lines.
+
+    python rate_shop_telemetry.py rate_shop_telemetry.jsonl
+
+prints the per-loader summary of a log.
+"""
+import contextvars
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+
+import pandas as pd
+
+# --------------------------
+# CONFIG
+# --------------------------
+
+# JSON-lines file every loader call is appended to; off unless set, since
+# it is written on every call and never rotated
+TELEMETRY_LOG = os.environ.get("RATE_SHOP_TELEMETRY_LOG", "")
+
+# Loader calls kept in memory for the diagnostics panel
+TELEMETRY_HISTORY = int(os.environ.get("RATE_SHOP_TELEMETRY_HISTORY", "500"))
+
+_lock = threading.Lock()
+_records = deque(maxlen=TELEMETRY_HISTORY)
+_current_call = contextvars.ContextVar("rate_shop_loader_call", default=None)
+
+
+# --------------------------
+# RECORDING
+# --------------------------
+
+def _describe(args, kwargs):
+    parts = [repr(a) for a in args] + [f"{k}={v!r}" for k, v in kwargs.items()]
+    return ", ".join(parts)[:200]
+
+
+def _record(call):
+    with _lock:
+        _records.append(call)
+        if TELEMETRY_LOG:
+            with open(TELEMETRY_LOG, "a", encoding="utf-8") as log:
+                log.write(json.dumps(call, default=str) + "\n")
+
+
+def timed_loader(name=None, cached=True):
+    """Records every call of the decorated loader; goes above `@st.cache_data`.
+
+    A call counts as a cache hit unless the loader body calls
+    `cache_miss()`, which only runs when the cache has no entry. Loaders
+    without a cache are recorded with `cached=False`.
+    """
+    def decorate(fn):
+        loader_name = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            call = {
+                "loader": loader_name,
+                "args": _describe(args, kwargs),
+                "started_at": datetime.now(timezone.utc).isoformat(),
+                "cache": "hit" if cached else "uncached",
+                "rows": None,
+                "error": None,
+                "queries": [],
+            }
+            token = _current_call.set(call)
+            start = time.perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                call["error"] = f"{type(e).__name__}: {e}"
+                raise
+            else:
+                if isinstance(result, pd.DataFrame):
+                    call["rows"] = len(result)
+                return result
+            finally:
+                call["wall_ms"] = round(1000 * (time.perf_counter() - start), 1)
+                _current_call.reset(token)
+                _record(call)
+
+        if hasattr(fn, "clear"):
+            wrapper.clear = fn.clear
+        return wrapper
+
+    return decorate
+
+
+def cache_miss():
+    """Marks the running loader call as a cache miss."""
+    call = _current_call.get()
+    if call is not None and call["cache"] == "hit":
+        call["cache"] = "miss"
+
+
+def record_query(job, rows, seconds, source="bigquery"):
+    """Attaches a finished BigQuery job's statistics to the running loader call.
+
+    Results answered without a job (`source="disk"`) are recorded with
+    `job=None`.
+    """
+    call = _current_call.get()
+    if call is None:
+        return
+    call["queries"].append({
+        "source": source,
+        "job_id": getattr(job, "job_id", None),
+        "bytes_processed": getattr(job, "total_bytes_processed", None),
+        "bytes_billed": getattr(job, "total_bytes_billed", None),
+        "slot_ms": getattr(job, "slot_millis", None),
+        "bq_cache_hit": getattr(job, "cache_hit", None),
+        "rows": rows,
+        "ms": round(1000 * seconds, 1),
+    })
+
+
+def recent_calls():
+    """Loader calls recorded by this process, oldest first."""
+    with _lock:
+        return list(_records)
+
+
+def reset():
+    with _lock:
+        _records.clear()
+
+
+# --------------------------
+# SUMMARIES
+# --------------------------
+
+def calls_frame(calls):
+    """One row per loader call with its query statistics summed."""
+    rows = []
+    for call in calls:
+        queries = call.get("queries") or []
+        rows.append({
+            "loader": call["loader"],
+            "started_at": call.get("started_at"),
+            "args": call.get("args"),
+            "cache": call.get("cache"),
+            "wall_ms": call.get("wall_ms"),
+            "rows": call.get("rows"),
+            "queries": len(queries),
+            "disk_hits": sum(q.get("source") == "disk" for q in queries),
+            "bytes_processed": sum(q.get("bytes_processed") or 0 for q in queries),
+            "bytes_billed": sum(q.get("bytes_billed") or 0 for q in queries),
+            "slot_ms": sum(q.get("slot_ms") or 0 for q in queries),
+            "job_ids": ",".join(str(q.get("job_id")) for q in queries),
+            "error": call.get("error"),
+        })
+    return pd.DataFrame(rows)
+
+
+def loader_summary(calls):
+    """Calls, cache hit ratio, wall time and bytes per loader."""
+    frame = calls_frame(calls)
+    if frame.empty:
+        return frame
+    frame["hits"] = frame["cache"] == "hit"
+    frame["misses"] = frame["cache"] == "miss"
+    summary = frame.groupby("loader", sort=True).agg(
+        calls=("wall_ms", "size"),
+        hits=("hits", "sum"),
+        misses=("misses", "sum"),
+        mean_ms=("wall_ms", "mean"),
+        max_ms=("wall_ms", "max"),
+        queries=("queries", "sum"),
+        disk_hits=("disk_hits", "sum"),
+        bytes_processed=("bytes_processed", "sum"),
+        bytes_billed=("bytes_billed", "sum"),
+        slot_ms=("slot_ms", "sum"),
+        errors=("error", "count"),
+    )
+    cached_calls = summary["hits"] + summary["misses"]
+    summary["hit_ratio"] = (summary["hits"] / cached_calls.where(cached_calls > 0)).round(2)
+    summary["mean_ms"] = summary["mean_ms"].round(1)
+    return summary.reset_index()
+
+
+def read_log(path=TELEMETRY_LOG):
+    """Loader calls from a JSON-lines telemetry log."""
+    with open(path, encoding="utf-8") as log:
+        return [json.loads(line) for line in log if line.strip()]
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else TELEMETRY_LOG
+    if not path:
+        sys.exit("usage: python rate_shop_telemetry.py LOG (or set RATE_SHOP_TELEMETRY_LOG)")
+    with pd.option_context("display.width", 200, "display.max_columns", None):
+        print(loader_summary(read_log(path)).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# The app's modules live at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from benchmarks.synthetic_data import generate_scrapes  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def raw_scrapes():
+    """Synthetic tee_time_clean rows starting two days before the season."""
+    return generate_scrapes(start="2026-02-01", days=8, seed=7)
@@ -0,0 +1,85 @@
+"""A BigQuery client stand-in that runs the generated SQL on DuckDB.
+
+Rewrites the few BigQuery-only constructs the rate shop queries use into
+DuckDB SQL and serves every table reference from in-memory tables, so
+the SQL in rate_shop_queries can be checked against the pandas engine on
+the same synthetic scrape rows.
+"""
+import re
+from types import SimpleNamespace
+
+import duckdb
+import pandas as pd
+
+SOURCE = "tee_time_clean"
+
+
+def translate(sql):
+    """BigQuery SQL -> DuckDB SQL for the constructs rate_shop_queries emits."""
+    # `project.dataset.table` -> "table"
+    sql = re.sub(r"`([^`]*)`", lambda m: '"' + m.group(1).split(".")[-1] + '"', sql)
+    sql = re.sub(r"\bSAFE_DIVIDE\(", "safe_divide(", sql)
+    sql = re.sub(
+        r"TIMESTAMP_DIFF\(\s*([\w.]+)\s*,\s*([\w.]+)\s*,\s*MINUTE\s*\)",
+        r"date_diff('minute', \2, \1)",
+        sql,
+    )
+    sql = re.sub(r"\bTIMESTAMP\('([^']*)'\)", r"CAST('\1' AS TIMESTAMPTZ)", sql)
+    sql = re.sub(r"\bDATE\(", "as_date(", sql)
+    return re.sub(r";\s*$", "", sql.strip())
+
+
+class DuckRows:
+    """Mimics the RowIterator a finished query job returns."""
+
+    def __init__(self, frame):
+        self.frame = frame
+        self.schema = [SimpleNamespace(name=c) for c in frame.columns]
+        self.total_rows = len(frame)
+
+    def to_dataframe_iterable(self, **kwargs):
+        yield self.frame
+
+    def to_dataframe(self, **kwargs):
+        return self.frame
+
+
+class DuckJob:
+    def __init__(self, job_id, frame):
+        self.job_id = job_id
+        self.frame = frame
+        self.total_bytes_processed = int(frame.memory_usage(deep=True).sum())
+        self.total_bytes_billed = self.total_bytes_processed
+        self.slot_millis = 0
+        self.cache_hit = False
+
+    def result(self, **kwargs):
+        return DuckRows(self.frame)
+
+    def to_dataframe(self, **kwargs):
+        return self.frame
+
+
+class DuckClient:
+    """Runs queries against `raw` scrape rows loaded as tee_time_clean."""
+
+    def __init__(self, raw):
+        self.con = duckdb.connect()
+        # DATE(timestamp) is a UTC date in BigQuery
+        self.con.execute("SET TimeZone = 'UTC'")
+        self.con.execute("CREATE MACRO safe_divide(a, b) AS CASE WHEN b = 0 THEN NULL ELSE a / b END")
+        self.con.execute("CREATE MACRO as_date(x) AS CAST(x AS DATE)")
+        rows = raw.copy()
+        rows["tee_date"] = pd.to_datetime(rows["tee_date"]).dt.date
+        self.add_table(SOURCE, rows)
+        self.queries = []
+
+    def add_table(self, name, frame):
+        self.con.register("incoming", frame)
+        self.con.execute(f'CREATE OR REPLACE TABLE "{name}" AS SELECT * FROM incoming')
+        self.con.unregister("incoming")
+
+    def query(self, sql, job_config=None, **kwargs):
+        self.queries.append(sql)
+        frame = self.con.cursor().execute(translate(sql)).df()
+        return DuckJob(f"duck_job_{len(self.queries)}", frame)
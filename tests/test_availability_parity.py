@@ -0,0 +1,68 @@
+"""channel_availability_sql() on DuckDB against the pandas derivation."""
+from datetime import date
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("duckdb")
+
+from duckdb_bigquery import DuckClient  # noqa: E402
+from rate_shop_engine import (  # noqa: E402
+    AVAILABILITY_CHANNELS,
+    SEASON_START,
+    build_slot_lifecycle,
+    course_channel_availability,
+    normalize_scrape_rows,
+)
+from rate_shop_queries import channel_availability_sql  # noqa: E402
+
+MONTH = (date(2026, 2, 1), date(2026, 2, 28))
+PRICES = [f"{channel}_current_price" for channel in AVAILABILITY_CHANNELS]
+
+
+@pytest.fixture(scope="module")
+def client(raw_scrapes):
+    return DuckClient(raw_scrapes)
+
+
+@pytest.fixture(scope="module")
+def lifecycle(raw_scrapes):
+    return build_slot_lifecycle(normalize_scrape_rows(raw_scrapes))
+
+
+def sql_availability(client, course, prune):
+    frame = client.query(channel_availability_sql(course, *MONTH, prune=prune)).result().to_dataframe()
+    frame["tee_date"] = pd.to_datetime(frame["tee_date"])
+    # The engine drops tee dates before the season; the query does not
+    return frame[frame["tee_date"] >= pd.Timestamp(SEASON_START)].reset_index(drop=True)
+
+
+@pytest.mark.parametrize("prune", [True, False])
+def test_statuses_match_engine(client, lifecycle, prune):
+    for course in lifecycle["course_name"].unique():
+        sql = sql_availability(client, course, prune)
+        local = course_channel_availability(lifecycle, course, *MONTH).reset_index(drop=True)
+
+        assert len(sql) > 0
+        pd.testing.assert_frame_equal(
+            sql.drop(columns=PRICES),
+            local.drop(columns=PRICES),
+            check_dtype=False,
+            check_column_type=False,
+        )
+
+
+def test_prices_are_scraped_prices(client, lifecycle):
+    """ANY_VALUE keeps any price the slot was scraped at, not always the first."""
+    course = lifecycle["course_name"].iloc[0]
+    sql = sql_availability(client, course, prune=True)
+    slots = lifecycle[lifecycle["course_name"] == course]
+
+    for channel in AVAILABILITY_CHANNELS:
+        prices = sql[["tee_date", "tee_time", f"{channel}_current_price"]].merge(
+            slots[slots["source_channel"] == channel], on=["tee_date", "tee_time"], how="left"
+        )
+        listed = prices["min_slot_price"].notna()
+        price = prices[f"{channel}_current_price"]
+        assert price[~listed].isna().all()
+        assert price[listed].between(prices["min_slot_price"][listed], prices["max_slot_price"][listed]).all()
@@ -0,0 +1,124 @@
+"""build_benchmark_table_html against the row-at-a-time rendering it replaced."""
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from rate_shop_benchmark import (
+    ABOVE_MARKET_COLOR,
+    BELOW_MARKET_COLOR,
+    NO_MARKET_COLOR,
+    build_benchmark_matrices,
+    build_benchmark_table_html,
+)
+from rate_shop_engine import benchmark_from_rollup, build_benchmark_rollup, normalize_scrape_rows
+
+SELF = "coyote_ridge_golf_club"
+ROW = re.compile(r"<tr>(.*?)</tr>", re.S)
+
+
+def build_benchmark_row_html(as_of_df, property_selected, as_of_value, checkin_dates):
+    self_df = as_of_df[as_of_df["course_name"] == property_selected]
+    if self_df.empty:
+        return ""
+
+    rank_df = as_of_df.copy()
+    rank_df["rank_high"] = rank_df.groupby("tee_date")["avg_price"].rank(method="min", ascending=False)
+    rank_df["rank_low"] = rank_df.groupby("tee_date")["avg_price"].rank(method="min", ascending=True)
+    self_rank = rank_df[rank_df["course_name"] == property_selected]
+    high_count = int((self_rank["rank_high"] == 1).sum())
+    low_count = int((self_rank["rank_low"] == 1).sum())
+
+    cells_html = [f"<td class='bench-td bench-date'>{pd.to_datetime(as_of_value).strftime('%m/%d')}</td>"]
+    for d in checkin_dates:
+        cell_df = self_df[self_df["tee_date"] == d]
+        self_val = cell_df["avg_price"].mean()
+        market_val = cell_df["market_avg"].mean()
+        if pd.isna(self_val) and pd.isna(market_val):
+            cell = ""
+        else:
+            self_text = f"${self_val:.0f}" if pd.notna(self_val) else ""
+            market_text = f"${market_val:.0f}" if pd.notna(market_val) else ""
+            if pd.notna(self_val) and pd.notna(market_val):
+                self_color = "#22c55e" if self_val <= market_val else "#ef4444"
+            else:
+                self_color = "#9ca3af"
+            cell = (
+                f"<div class='bench-top' style='color:{self_color};'>{self_text}</div>"
+                f"<div class='bench-bottom'>{market_text}</div>"
+            )
+        cells_html.append(f"<td class='bench-td bench-price'>{cell}</td>")
+
+    cells_html.append(f"<td class='bench-td bench-meta'>{high_count}</td>")
+    cells_html.append(f"<td class='bench-td bench-meta'>{low_count}</td>")
+    return f"<table class='bench-table'><tbody><tr>{''.join(cells_html)}</tr></tbody></table>"
+
+
+def baseline_rows(bench_df, property_selected):
+    """The <tr> contents the old screen drew, one per as-of date, latest first."""
+    checkin_dates = sorted(bench_df["tee_date"].unique())
+    rows = []
+    for as_of_value in sorted(bench_df["as_of_date"].unique(), reverse=True):
+        as_of_df = bench_df[bench_df["as_of_date"] == as_of_value]
+        row_html = build_benchmark_row_html(as_of_df, property_selected, as_of_value, checkin_dates)
+        rows.extend(ROW.findall(row_html))
+    return rows
+
+
+def table_rows(html):
+    return ROW.findall(html.split("<tbody>", 1)[1])
+
+
+@pytest.fixture(scope="module")
+def bench_df(raw_scrapes):
+    rollup = build_benchmark_rollup(normalize_scrape_rows(raw_scrapes))
+    return benchmark_from_rollup(rollup, "2026-02-01", "2026-02-08", "2026-02-01", "2026-03-31", "ALL")
+
+
+@pytest.fixture(scope="module")
+def edge_df(bench_df):
+    """bench_df with a tie for highest and lowest, all-NaN cells and missing self cells."""
+    frame = bench_df.copy()
+    is_self = frame["course_name"] == SELF
+    others = frame["avg_price"].where(~is_self).groupby([frame["as_of_date"], frame["tee_date"]])
+    self_rows = frame.index[is_self]
+
+    # Ties: self matches a competitor's highest price on one cell, lowest on another
+    frame.loc[self_rows[0], "avg_price"] = others.transform("max")[self_rows[0]]
+    frame.loc[self_rows[1], "avg_price"] = others.transform("min")[self_rows[1]]
+    # No self price but a market average, then neither
+    frame.loc[self_rows[2], "avg_price"] = np.nan
+    frame.loc[self_rows[3], ["avg_price", "market_avg"]] = np.nan
+    # A check-in date the property has no row for at all
+    return frame.drop(index=self_rows[4])
+
+
+def test_header_matches(bench_df):
+    html = build_benchmark_table_html(bench_df, SELF)
+    checkin_dates = sorted(bench_df["tee_date"].unique())
+    labels = ["AS OF DATE"] + [pd.to_datetime(d).strftime("%m/%d") for d in checkin_dates] + ["HIGH", "LOW"]
+    assert html.split("<tbody>")[0].count("<th class='bench-th'>") == len(labels)
+    assert "".join(f"<th class='bench-th'>{label}</th>" for label in labels) in html
+
+
+@pytest.mark.parametrize("frame", ["bench_df", "edge_df"])
+def test_rows_match_baseline_for_every_course(frame, request):
+    frame = request.getfixturevalue(frame)
+    for course in sorted(frame["course_name"].unique()):
+        assert table_rows(build_benchmark_table_html(frame, course)) == baseline_rows(frame, course)
+
+
+def test_edge_cells_render_every_color(edge_df):
+    html = build_benchmark_table_html(edge_df, SELF)
+    for color in (BELOW_MARKET_COLOR, ABOVE_MARKET_COLOR, NO_MARKET_COLOR):
+        assert f"style='color:{color};'" in html
+    assert "<td class='bench-td bench-price'></td>" in html
+
+
+def test_ties_count_for_everyone_tied(edge_df):
+    _, _, counts = build_benchmark_matrices(edge_df, SELF)
+    as_of_dates = edge_df.loc[edge_df["course_name"] == SELF, "as_of_date"]
+    tied_high, tied_low = as_of_dates.iloc[0], as_of_dates.iloc[1]
+    assert counts.loc[tied_high, "is_high"] >= 1
+    assert counts.loc[tied_low, "is_low"] >= 1
@@ -0,0 +1,84 @@
+"""build_tile_model against the per-day row lookups the calendar loop used to do."""
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from rate_shop_calendar import build_tile_model, select_course_rows, sell_speed_icons
+from rate_shop_engine import build_rate_shop_summary
+
+COURSE = "coyote_ridge_golf_club"
+
+
+def get_color(flag):
+    return {
+        "LOWEST_IN_MARKET": "#10b981",
+        "BELOW_AVERAGE": "#06b6d4",
+        "MARKET_AVERAGE": "#f59e0b",
+        "ABOVE_AVERAGE": "#f97316",
+        "HIGHEST_IN_MARKET": "#ef4444",
+    }.get(flag, "#6b7280")
+
+
+def get_sell_speed_icon(minutes_available):
+    if minutes_available is None or minutes_available < 0:
+        return "❄️"
+    elif minutes_available >= 240:
+        return "🐢"
+    elif minutes_available >= 60:
+        return "⚡"
+    else:
+        return "🔥"
+
+
+def baseline_tile(my_df, day_date):
+    """What the old loop drew for one day, or None for an empty cell."""
+    row = my_df[my_df["tee_date"] == pd.Timestamp(day_date)]
+    if row.empty:
+        return None
+    price = row["average_price"].values[0]
+    gap = row["price_gap_percent"].values[0]
+    market_avg = row["market_avg_price"].values[0]
+    return {
+        "color": get_color(row["price_position_flag"].values[0]),
+        "price": f"${price:.0f}",
+        "gap_badge": f"{gap:+.1f}%",
+        "gap_color": "#10b981" if gap < 0 else "#ef4444",
+        "occupancy": f"{row['occupancy_percent'].values[0]:.0f}%",
+        "icon": get_sell_speed_icon(row["avg_minutes_available"].values[0]),
+        "tooltip": f"Market Avg: ${market_avg:.0f} | Gap: {gap:.1f}%",
+    }
+
+
+@pytest.fixture(scope="module")
+def my_df(raw_scrapes):
+    summary = build_rate_shop_summary(raw_scrapes)
+    return select_course_rows(summary[summary["course_name"] == COURSE])
+
+
+def test_tiles_match_per_day_lookups(my_df):
+    tiles = build_tile_model(my_df)
+    tee_dates = my_df["tee_date"]
+    year, month = tee_dates.dt.year.iloc[0], tee_dates.dt.month.iloc[0]
+
+    drawn = 0
+    for day in range(1, 32):
+        try:
+            day_date = datetime(year, month, day)
+        except ValueError:
+            break
+        expected = baseline_tile(my_df, day_date)
+        if expected is None:
+            assert day not in tiles.index
+            continue
+        tile = tiles.loc[day]
+        assert tile["tee_date"] == day_date.strftime("%Y-%m-%d")
+        assert {key: tile[key] for key in expected} == expected
+        drawn += 1
+    assert drawn == len(tiles) > 0
+
+
+def test_sell_speed_icons_match_per_row_lookup():
+    minutes = [np.nan, -5, 0, 59.9, 60, 239, 240, 1000]
+    assert list(sell_speed_icons(minutes)) == [get_sell_speed_icon(m) for m in minutes]
@@ -0,0 +1,50 @@
+"""Arrow IPC entries of the on-disk query cache."""
+import pandas as pd
+import pytest
+
+from rate_shop_diskcache import DiskCache, cache_key
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return DiskCache(tmp_path / "cache", max_bytes=1 << 30)
+
+
+def frame():
+    return pd.DataFrame({"course_name": ["a", "b"], "price": [40.0, 55.5]})
+
+
+def test_round_trip(cache):
+    key = cache_key("SELECT 1 -- comment")
+    cache.put(key, frame())
+
+    assert key == cache_key("SELECT   1")
+    pd.testing.assert_frame_equal(cache.get(key), frame())
+
+
+def test_expired_entry_is_removed(cache):
+    cache.put("k", frame(), ttl=-1)
+
+    assert cache.get("k") is None
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.parametrize("content", [b"", b"not arrow at all", None])
+def test_corrupt_entry_is_removed(cache, content):
+    cache.put("k", frame())
+    path = cache._path("k")
+    # None: an entry cut short mid-write
+    path.write_bytes(path.read_bytes()[:100] if content is None else content)
+
+    assert cache.get("k") is None
+    assert not path.exists()
+
+    cache.put("k", frame())
+    pd.testing.assert_frame_equal(cache.get("k"), frame())
+
+
+def test_lru_budget(tmp_path):
+    cache = DiskCache(tmp_path / "cache", max_bytes=1)
+    cache.put("a", frame())
+
+    assert cache.stats()["entries"] == 0
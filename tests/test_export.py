@@ -0,0 +1,118 @@
+"""export_bundle() on DuckDB, read back through Bundle, against the live queries."""
+import json
+from datetime import date
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("duckdb")
+
+import rate_shop_bq  # noqa: E402
+from duckdb_bigquery import DuckClient  # noqa: E402
+from rate_shop_export import BUNDLE_FORMAT, LATEST, MANIFEST, Bundle, export_bundle  # noqa: E402
+from rate_shop_queries import (  # noqa: E402
+    channel_availability_sql,
+    dashboard_benchmark_sql,
+    dashboard_history_sql,
+    dashboard_pace_sql,
+    dashboard_summary_sql,
+)
+from rate_shop_schema import typed  # noqa: E402
+
+# The conftest scrapes cover February tee dates; March exports empty files
+START, END = date(2026, 2, 1), date(2026, 3, 31)
+MONTHS = [(2026, 2), (2026, 3)]
+WINDOW = (date(2026, 2, 1), date(2026, 2, 8), date(2026, 2, 1), date(2026, 3, 31), "ALL")
+COURSES = ["coyote_ridge_golf_club", "irving_golf_club"]
+
+
+@pytest.fixture(scope="module")
+def client(raw_scrapes):
+    client = DuckClient(raw_scrapes)
+    rate_shop_bq.use_clients(client, None)
+    yield client
+    rate_shop_bq.reset_clients()
+
+
+@pytest.fixture(scope="module")
+def exported(client, tmp_path_factory):
+    out_dir = tmp_path_factory.mktemp("bundles")
+    return out_dir, export_bundle(out_dir, START, END, [WINDOW], COURSES, workers=2)
+
+
+def live(client, sql, dataset):
+    return typed(client.query(sql).result().to_dataframe(), dataset)
+
+
+def assert_same(bundled, expected):
+    pd.testing.assert_frame_equal(
+        bundled.reset_index(drop=True), expected.reset_index(drop=True), check_column_type=False
+    )
+
+
+def test_manifest_and_latest(exported):
+    out_dir, manifest = exported
+    version_dir = out_dir / manifest["version"]
+
+    assert json.loads((version_dir / MANIFEST).read_text(encoding="utf-8")) == manifest
+    assert (out_dir / LATEST).read_text(encoding="utf-8").strip() == manifest["version"]
+    assert [p.name for p in out_dir.iterdir() if p.name.startswith(".")] == []
+    assert manifest["format"] == BUNDLE_FORMAT
+    assert manifest["tee_dates"] == [START.isoformat(), END.isoformat()]
+    assert manifest["courses"] == COURSES
+
+    availability = manifest["files"]["availability"]
+    assert sorted((e["course"], e["year"], e["month"]) for e in availability) == sorted(
+        (course, year, month) for course in COURSES for year, month in MONTHS
+    )
+    for entry in availability:
+        assert (version_dir / entry["path"]).exists()
+
+    assert Bundle(out_dir).version == Bundle(version_dir).version == manifest["version"]
+
+
+def test_datasets_match_live_queries(client, exported):
+    out_dir, manifest = exported
+    bundle = Bundle(out_dir)
+    end = pd.Timestamp(END)
+
+    summary = live(client, dashboard_summary_sql(), "summary")
+    assert not summary.empty
+    assert_same(bundle.summary(), summary[summary["tee_date"].between(pd.Timestamp(START), end)])
+    assert len(bundle.summary()) == manifest["files"]["summary"]["rows"]
+
+    history = live(client, dashboard_history_sql(), "history")
+    assert_same(bundle.history(), history[history["tee_date"] <= end])
+
+    pace = live(client, dashboard_pace_sql(), "pace")
+    assert_same(bundle.pace_rollup(), pace[pace["tee_date"] <= end])
+
+    assert_same(bundle.benchmark(WINDOW), live(client, dashboard_benchmark_sql(*WINDOW), "benchmark"))
+
+
+@pytest.mark.parametrize("course", COURSES)
+@pytest.mark.parametrize("year,month", MONTHS)
+def test_availability_matches_live_query(client, exported, course, year, month):
+    month_start = date(year, month, 1)
+    month_end = (pd.Timestamp(month_start) + pd.offsets.MonthEnd(0)).date()
+    expected = live(client, channel_availability_sql(course, month_start, month_end), "availability")
+    assert expected.empty == (month == 3)
+    assert_same(Bundle(exported[0]).availability(course, year, month), expected)
+
+
+def test_missing_entries_read_empty(exported):
+    bundle = Bundle(exported[0])
+    assert bundle.availability("not_a_course", 2026, 2).empty
+    assert bundle.availability(COURSES[0], 2027, 1).empty
+    assert bundle.benchmark((date(2025, 1, 1), date(2025, 1, 2), date(2025, 1, 1), date(2025, 1, 2), "ALL")).empty
+
+
+def test_other_format_is_refused(exported):
+    out_dir, manifest = exported
+    version_dir = out_dir / manifest["version"]
+    stale = out_dir / "stale"
+    stale.mkdir()
+    (stale / MANIFEST).write_text(json.dumps({**manifest, "format": BUNDLE_FORMAT - 1}), encoding="utf-8")
+    with pytest.raises(ValueError, match="bundle format"):
+        Bundle(stale)
+    assert Bundle(version_dir).manifest == manifest
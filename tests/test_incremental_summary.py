@@ -0,0 +1,60 @@
+"""IncrementalSummary folded forward against one built from every scrape."""
+import pandas as pd
+import pytest
+
+from rate_shop_engine import (
+    IncrementalSummary,
+    build_rate_shop_summary,
+    build_slot_lifecycle,
+    normalize_scrape_rows,
+)
+from rate_shop_queries import slot_lifecycle_sql
+
+
+@pytest.fixture(scope="module")
+def rows(raw_scrapes):
+    return normalize_scrape_rows(raw_scrapes)
+
+
+def fetch_from(rows, fetched):
+    def fetch(watermark):
+        fetched.append(watermark)
+        if watermark is None:
+            return build_slot_lifecycle(rows)
+        return build_slot_lifecycle(rows[rows["scrape_timestamp"] > watermark])
+    return fetch
+
+
+def test_refresh_matches_full_build(raw_scrapes, rows):
+    cut = rows["scrape_timestamp"].sort_values().iloc[len(rows) // 2]
+    state = IncrementalSummary(build_slot_lifecycle(rows[rows["scrape_timestamp"] <= cut]))
+    fetched = []
+
+    changed = state.refresh(fetch_from(rows, fetched))
+
+    assert fetched == [cut]
+    assert changed
+    assert state.watermark == rows["scrape_timestamp"].max()
+    pd.testing.assert_frame_equal(state.summary, build_rate_shop_summary(raw_scrapes), check_dtype=False)
+
+
+def test_empty_state_fetches_everything(raw_scrapes, rows):
+    state = IncrementalSummary(build_slot_lifecycle(rows.iloc[:0]))
+    fetched = []
+
+    assert state.watermark is None
+    state.refresh(fetch_from(rows, fetched))
+
+    assert fetched == [None]
+    assert state.watermark == rows["scrape_timestamp"].max()
+    pd.testing.assert_frame_equal(state.summary, build_rate_shop_summary(raw_scrapes), check_dtype=False)
+
+    # Nothing newer: the next refresh changes nothing
+    assert state.refresh(fetch_from(rows, fetched)) == []
+    assert state.version == 1
+
+
+def test_lifecycle_sql_ignores_missing_watermark():
+    assert "TIMESTAMP(" not in slot_lifecycle_sql(pd.NaT)
+    assert "TIMESTAMP(" not in slot_lifecycle_sql(None)
+    assert "TIMESTAMP('2026-02-05" in slot_lifecycle_sql(pd.Timestamp("2026-02-05 06:00", tz="UTC"))
@@ -0,0 +1,68 @@
+"""Byte budgets and single-flight loading of budget_cache."""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from rate_shop_memcache import BudgetCache, budget_cache, frame_bytes
+
+
+def frame(rows):
+    return pd.DataFrame({"price": range(rows)})
+
+
+def test_concurrent_misses_run_the_loader_once():
+    calls = []
+
+    @budget_cache(max_bytes=1 << 20, name="test_single_flight")
+    def load(month):
+        calls.append(month)
+        time.sleep(0.1)
+        return frame(10)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(load, ["2026-03"] * 8))
+
+    assert calls == ["2026-03"]
+    assert all(len(r) == 10 for r in results)
+    assert load.cache.stats()["entries"] == 1
+
+
+def test_waiters_share_the_loader_error():
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+    cache = BudgetCache("test_errors", max_bytes=1 << 20)
+
+    def failing():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        raise RuntimeError("warehouse down")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first = pool.submit(cache.load, "k", failing)
+        started.wait(5)
+        second = pool.submit(cache.load, "k", failing)
+        time.sleep(0.05)
+        release.set()
+        for future in (first, second):
+            with pytest.raises(RuntimeError):
+                future.result()
+
+    assert calls == [1]
+    # Nothing cached, so the next call retries
+    assert cache.load("k", lambda: frame(3)).shape == (3, 1)
+
+
+def test_lru_eviction_keeps_the_budget():
+    size = frame_bytes(frame(1000))
+    cache = BudgetCache("test_lru", max_bytes=2 * size)
+    for key in "abc":
+        cache.load(key, lambda: frame(1000))
+
+    assert cache.get("a") == (False, None)
+    assert cache.get("c")[0]
+    assert cache.stats()["evictions"] == 1
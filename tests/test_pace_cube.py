@@ -0,0 +1,103 @@
+"""PaceCube against a full build, the rollup SQL and the summary's occupancy."""
+import pandas as pd
+import pytest
+
+from rate_shop_engine import (
+    ALL_CHANNELS,
+    PACE_KEYS,
+    PaceCube,
+    build_benchmark_rollup,
+    build_rate_shop_summary,
+    normalize_scrape_rows,
+    scrape_dates,
+)
+from rate_shop_queries import benchmark_rollup_sql
+
+ORDER = ["course_name", "source_channel", "tee_date", "as_of_date"]
+
+
+@pytest.fixture(scope="module")
+def rows(raw_scrapes):
+    return normalize_scrape_rows(raw_scrapes)
+
+
+def sorted_cube(cube):
+    return cube.cube.sort_values(ORDER).reset_index(drop=True)
+
+
+def test_refresh_matches_full_build(rows):
+    full = PaceCube(build_benchmark_rollup(rows))
+
+    # Start from the first two thirds of the scrapes, cut mid-day
+    cut = rows["scrape_timestamp"].sort_values().iloc[len(rows) * 2 // 3]
+    cube = PaceCube(build_benchmark_rollup(rows[rows["scrape_timestamp"] <= cut]))
+    days = scrape_dates(rows["scrape_timestamp"])
+    fetched = []
+
+    def fetch(since):
+        fetched.append(since)
+        return build_benchmark_rollup(rows[days >= since])
+
+    changed = cube.refresh(fetch)
+
+    assert fetched == [cut.tz_localize(None).normalize()]
+    assert changed
+    assert cube.version == 1
+    pd.testing.assert_frame_equal(sorted_cube(cube), sorted_cube(full), check_dtype=False)
+
+
+def test_empty_cube_refresh_is_a_full_build(rows):
+    full = PaceCube(build_benchmark_rollup(rows))
+    cube = PaceCube(build_benchmark_rollup(rows.iloc[:0]))
+
+    cube.refresh(lambda since: build_benchmark_rollup(rows))
+
+    assert cube.since == full.since
+    pd.testing.assert_frame_equal(sorted_cube(cube), sorted_cube(full), check_dtype=False)
+
+
+def test_sold_to_date_matches_summary_occupancy(raw_scrapes, rows):
+    cube = PaceCube(build_benchmark_rollup(rows)).cube
+    summary = build_rate_shop_summary(raw_scrapes)
+    # Nearest lead time of every curve
+    nearest = cube.sort_values("days_before", kind="mergesort").drop_duplicates(PACE_KEYS)
+
+    per_channel = nearest[nearest["source_channel"] != ALL_CHANNELS].set_index(PACE_KEYS)["sold_to_date"]
+    occupied = summary.set_index(PACE_KEYS)["occupied_slots"]
+    pd.testing.assert_series_equal(
+        per_channel.sort_index(), occupied.sort_index(), check_names=False, check_dtype=False
+    )
+
+    all_channels = nearest[nearest["source_channel"] == ALL_CHANNELS].set_index(["course_name", "tee_date"])
+    by_course = summary.groupby(["course_name", "tee_date"])["occupied_slots"].sum()
+    pd.testing.assert_series_equal(
+        all_channels["sold_to_date"].sort_index(), by_course.sort_index(), check_names=False, check_dtype=False
+    )
+
+
+def test_rollup_sql_matches_engine(raw_scrapes, rows):
+    pytest.importorskip("duckdb")
+    from duckdb_bigquery import DuckClient
+
+    keys = ["course_name", "source_channel", "as_of_date", "tee_date"]
+    sql = DuckClient(raw_scrapes).query(benchmark_rollup_sql()).result().to_dataframe()
+    sql = sql.assign(as_of_date=pd.to_datetime(sql["as_of_date"]), tee_date=pd.to_datetime(sql["tee_date"]))
+    local = build_benchmark_rollup(rows)
+
+    pd.testing.assert_frame_equal(
+        sql.sort_values(keys).reset_index(drop=True),
+        local.sort_values(keys).reset_index(drop=True),
+        check_dtype=False,
+    )
+
+
+def test_all_channels_counts_listings(rows):
+    cube = PaceCube(build_benchmark_rollup(rows))
+    course, tee_date = rows["course_name"].iloc[0], rows["tee_date"].max()
+    channels = rows["source_channel"].unique()
+
+    all_channels = cube.curve(course, tee_date, ALL_CHANNELS)
+    per_channel = sum(
+        cube.curve(course, tee_date, channel)["sold_to_date"].iloc[-1] for channel in channels
+    )
+    assert all_channels["sold_to_date"].iloc[-1] == per_channel
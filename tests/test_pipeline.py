@@ -0,0 +1,60 @@
+"""Local gold layer written by rate_shop_pipeline against the pandas engine."""
+import pandas as pd
+import pytest
+
+from rate_shop_engine import build_rate_shop_summary
+from rate_shop_pipeline import local_partitions, read_gold_table, run_local
+
+KEYS = ["tee_date", "course_name", "source_channel"]
+
+
+def gold_summary(gold_dir):
+    summary = read_gold_table(gold_dir, "daily_rate_summary")
+    return summary.sort_values(KEYS).reset_index(drop=True)
+
+
+def engine_summary(raw):
+    return build_rate_shop_summary(raw).sort_values(KEYS).reset_index(drop=True)
+
+
+@pytest.fixture
+def gold_dir(tmp_path):
+    return tmp_path / "gold"
+
+
+def test_local_run_matches_engine(raw_scrapes, gold_dir):
+    first = run_local(raw_scrapes, gold_dir)
+
+    assert first["changed"] and not first["removed"]
+    pd.testing.assert_frame_equal(gold_summary(gold_dir), engine_summary(raw_scrapes), check_dtype=False)
+
+    # Nothing new: no partition is rebuilt
+    assert run_local(raw_scrapes, gold_dir) == {"changed": [], "removed": []}
+
+
+def test_changed_tee_dates_are_rebuilt(raw_scrapes, gold_dir):
+    run_local(raw_scrapes, gold_dir)
+    last_day = raw_scrapes["tee_date"].max()
+    # A late scrape for the last tee date only
+    extra = raw_scrapes[raw_scrapes["tee_date"] == last_day].head(5).assign(
+        scrape_timestamp=raw_scrapes["scrape_timestamp"].max() + pd.Timedelta(hours=1)
+    )
+    grown = pd.concat([raw_scrapes, extra], ignore_index=True)
+
+    result = run_local(grown, gold_dir)
+
+    assert result == {"changed": [f"{last_day:%Y-%m-%d}"], "removed": []}
+    pd.testing.assert_frame_equal(gold_summary(gold_dir), engine_summary(grown), check_dtype=False)
+
+
+@pytest.mark.parametrize("full", [False, True])
+def test_vanished_tee_dates_are_removed(raw_scrapes, gold_dir, full):
+    run_local(raw_scrapes, gold_dir)
+    last_day = raw_scrapes["tee_date"].max()
+    shrunk = raw_scrapes[raw_scrapes["tee_date"] < last_day]
+
+    result = run_local(shrunk, gold_dir, full=full)
+
+    assert result["removed"] == [f"{last_day:%Y-%m-%d}"]
+    assert f"{last_day:%Y-%m-%d}" not in local_partitions(gold_dir)
+    pd.testing.assert_frame_equal(gold_summary(gold_dir), engine_summary(shrunk), check_dtype=False)
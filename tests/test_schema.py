@@ -0,0 +1,44 @@
+"""typed() keeps every displayed price as loaded while narrowing counts."""
+import pandas as pd
+import pytest
+
+from rate_shop_engine import PaceCube, build_benchmark_rollup, build_rate_shop_summary, normalize_scrape_rows
+from rate_shop_schema import typed
+
+SUMMARY_PRICES = [
+    "average_price",
+    "min_price",
+    "max_price",
+    "market_min_price",
+    "market_avg_price",
+    "market_max_price",
+    "price_gap_percent",
+]
+
+
+@pytest.fixture(scope="module")
+def rollup(raw_scrapes):
+    return build_benchmark_rollup(normalize_scrape_rows(raw_scrapes))
+
+
+def test_summary_prices_round_trip(raw_scrapes):
+    summary = build_rate_shop_summary(raw_scrapes)
+    compact = typed(summary, "summary")
+    for column in SUMMARY_PRICES:
+        pd.testing.assert_series_equal(compact[column], summary[column])
+    assert compact["total_slots"].dtype == "int32"
+
+
+def test_pace_prices_round_trip(rollup):
+    compact = typed(rollup, "pace")
+    pd.testing.assert_series_equal(compact["slot_price_sum"], rollup["slot_price_sum"])
+    assert compact["slot_count"].dtype == "int32"
+
+    cube, expected = PaceCube(compact).cube, PaceCube(rollup).cube
+    pd.testing.assert_series_equal(cube["avg_price"], expected["avg_price"])
+
+
+def test_large_price_sums_keep_cents():
+    frame = pd.DataFrame({"slot_price_sum": [1234567.89, 98765.43], "slot_count": [10, 20]})
+    compact = typed(frame, "pace")
+    assert compact["slot_price_sum"].tolist() == [1234567.89, 98765.43]
@@ -0,0 +1,129 @@
+"""stale_while_revalidate() against a snapshot store in a temporary directory."""
+import threading
+
+import pandas as pd
+import pytest
+
+import rate_shop_snapshot as snapshot
+from rate_shop_diskcache import DiskCache
+
+NAME = ("summary", "raw")
+
+
+@pytest.fixture(autouse=True)
+def store(tmp_path, monkeypatch):
+    store = DiskCache(tmp_path / "snapshots", max_bytes=1 << 30)
+    monkeypatch.setattr(snapshot, "_store", store)
+    monkeypatch.setattr(snapshot, "_live", set())
+    monkeypatch.setattr(snapshot, "_loads", {})
+    monkeypatch.setattr(snapshot, "_restored", {})
+    return store
+
+
+def frame(price):
+    return pd.DataFrame({"course_name": ["a", "b"], "price": [price, price + 10]})
+
+
+class Load:
+    """A live load that records its threads and can be held until released."""
+
+    def __init__(self, result, hold=False):
+        self.result = result
+        self.released = threading.Event()
+        if not hold:
+            self.released.set()
+        self.threads = []
+
+    def __call__(self):
+        self.threads.append(threading.current_thread().name)
+        assert self.released.wait(10)
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def test_snapshot_served_while_live_load_runs():
+    snapshot.save_snapshot(NAME, frame(40.0))
+    load = Load(frame(50.0), hold=True)
+    conversions = []
+
+    def from_frame(f):
+        conversions.append(len(f))
+        return f
+
+    try:
+        for _ in range(2):
+            value, stale = snapshot.stale_while_revalidate(NAME, load, from_frame=from_frame)
+            pd.testing.assert_frame_equal(value, frame(40.0))
+            assert stale.pending and stale.error is None and stale.saved_at is not None
+        assert snapshot.pending(NAME)
+    finally:
+        load.released.set()
+    snapshot.revalidate(NAME, load).result(timeout=10)
+
+    # One background load on the shared pool, one conversion of the snapshot
+    assert len(load.threads) == 1 and load.threads[0].startswith("rate-shop-bg")
+    assert conversions == [2]
+
+    value, stale = snapshot.stale_while_revalidate(NAME, load)
+    pd.testing.assert_frame_equal(value, frame(50.0))
+    assert stale is None
+
+    # Live from now on: called directly, on this thread
+    snapshot.stale_while_revalidate(NAME, load)
+    assert load.threads[1:] == [threading.current_thread().name]
+
+
+def test_missing_snapshot_waits_for_live_load():
+    load = Load(frame(50.0))
+    value, stale = snapshot.stale_while_revalidate(NAME, load)
+
+    pd.testing.assert_frame_equal(value, frame(50.0))
+    assert stale is None
+    assert load.threads[0].startswith("rate-shop-bg")
+
+
+@pytest.mark.parametrize("content", [b"", b"not arrow at all"])
+def test_corrupt_snapshot_waits_for_live_load(store, content):
+    snapshot.save_snapshot(NAME, frame(40.0))
+    store._path(snapshot._key(NAME)).write_bytes(content)
+
+    value, stale = snapshot.stale_while_revalidate(NAME, Load(frame(50.0)))
+    pd.testing.assert_frame_equal(value, frame(50.0))
+    assert stale is None
+
+
+def test_failed_load_keeps_snapshot():
+    snapshot.save_snapshot(NAME, frame(40.0))
+    error = RuntimeError("warehouse down")
+    load = Load(error)
+    snapshot.revalidate(NAME, load).exception(timeout=10)
+
+    value, stale = snapshot.stale_while_revalidate(NAME, load)
+    pd.testing.assert_frame_equal(value, frame(40.0))
+    assert stale.error is error and not stale.pending
+    # Not retried within RETRY_SECONDS
+    assert len(load.threads) == 1
+
+
+def test_empty_load_keeps_snapshot():
+    snapshot.save_snapshot(NAME, frame(40.0))
+    load = Load(frame(40.0).iloc[:0])
+    snapshot.revalidate(NAME, load).exception(timeout=10)
+
+    value, stale = snapshot.stale_while_revalidate(NAME, load)
+    pd.testing.assert_frame_equal(value, frame(40.0))
+    assert isinstance(stale.error, ValueError)
+
+
+def test_failed_load_without_snapshot_raises(monkeypatch):
+    load = Load(RuntimeError("warehouse down"))
+    with pytest.raises(RuntimeError, match="warehouse down"):
+        snapshot.stale_while_revalidate(NAME, load)
+
+    # Past the retry window the next reader starts a fresh load
+    monkeypatch.setattr(snapshot, "RETRY_SECONDS", 0)
+    load.result = frame(50.0)
+    value, stale = snapshot.stale_while_revalidate(NAME, load)
+    pd.testing.assert_frame_equal(value, frame(50.0))
+    assert len(load.threads) == 2
@@ -0,0 +1,81 @@
+"""SummaryIndex lookups against the boolean filters the Rate Shop screen used."""
+import pandas as pd
+import pytest
+
+from rate_shop_engine import build_rate_shop_summary
+from rate_shop_index import SummaryIndex
+from rate_shop_schema import typed
+
+
+@pytest.fixture(scope="module")
+def summary(raw_scrapes):
+    return typed(build_rate_shop_summary(raw_scrapes), "summary")
+
+
+@pytest.fixture(scope="module")
+def index(summary):
+    return SummaryIndex(summary)
+
+
+def filtered_month(df, year, month):
+    return df[(df["tee_date"].dt.month == month) & (df["tee_date"].dt.year == year)]
+
+
+def filtered_preferred(month_df, course):
+    my_df_raw = month_df[month_df["course_name"] == course]
+    return (
+        my_df_raw
+        .assign(channel_priority=lambda x: x["source_channel"].map({"brand": 0}).fillna(1))
+        .sort_values(["tee_date", "channel_priority", "average_price", "source_channel"])
+        .groupby("tee_date", as_index=False)
+        .first()
+        .drop(columns=["channel_priority"])
+    )
+
+
+def months(summary):
+    present = sorted({(d.year, d.month) for d in summary["tee_date"]})
+    return present + [(2025, 12)]
+
+
+def assert_same(view, expected):
+    pd.testing.assert_frame_equal(view, expected.reset_index(drop=True))
+
+
+def test_month_matches_filter(summary, index):
+    for year, month in months(summary):
+        assert_same(index.month(year, month), filtered_month(summary, year, month))
+
+
+def test_course_month_matches_filter(summary, index):
+    assert index.courses == sorted(summary["course_name"].unique())
+    for year, month in months(summary):
+        month_df = filtered_month(summary, year, month)
+        for course in index.courses:
+            assert_same(
+                index.course_month(course, year, month),
+                month_df[month_df["course_name"] == course],
+            )
+
+
+def test_preferred_rows_match_filter(summary, index):
+    for year, month in months(summary):
+        month_df = filtered_month(summary, year, month)
+        for course in index.courses:
+            expected = filtered_preferred(month_df, course)
+            view = index.preferred_rows(course, year, month)
+            if expected.empty:
+                assert view.empty
+            else:
+                assert_same(view, expected)
+
+
+def test_edits_stay_with_the_caller(summary, index):
+    year, month = months(summary)[0]
+    view = index.month(year, month)
+    view.loc[0, "average_price"] = -1.0
+    view["note"] = "mine"
+
+    again = index.month(year, month)
+    assert "note" not in again.columns
+    assert_same(again, filtered_month(summary, year, month))
@@ -0,0 +1,38 @@
+"""summary_sql() on DuckDB against the pandas engine on the same rows."""
+import pandas as pd
+import pytest
+
+pytest.importorskip("duckdb")
+
+from duckdb_bigquery import DuckClient  # noqa: E402
+from rate_shop_engine import SEASON_START, build_rate_shop_summary  # noqa: E402
+from rate_shop_queries import summary_sql  # noqa: E402
+
+KEYS = ["tee_date", "course_name", "source_channel"]
+
+
+def run(client, sql):
+    frame = client.query(sql).result().to_dataframe()
+    frame["tee_date"] = pd.to_datetime(frame["tee_date"])
+    return frame.sort_values(KEYS).reset_index(drop=True)
+
+
+def test_full_season_matches_engine(raw_scrapes):
+    sql = run(DuckClient(raw_scrapes), summary_sql())
+    local = build_rate_shop_summary(raw_scrapes).sort_values(KEYS).reset_index(drop=True)
+
+    assert local["tee_date"].min() == pd.Timestamp(SEASON_START)
+    assert local["price_position_flag"].nunique() > 1
+    pd.testing.assert_frame_equal(sql, local, check_dtype=False)
+
+
+def test_tee_date_filter_matches_engine(raw_scrapes):
+    tee_dates = ["2026-02-04", "2026-02-07"]
+    sql = run(DuckClient(raw_scrapes), summary_sql(tee_dates))
+    local = build_rate_shop_summary(raw_scrapes)
+    local = local[local["tee_date"].isin(pd.to_datetime(tee_dates))]
+
+    assert not sql.empty
+    pd.testing.assert_frame_equal(
+        sql, local.sort_values(KEYS).reset_index(drop=True), check_dtype=False
+    )
@@ -0,0 +1,69 @@
+"""gather() ordering, failures and script context."""
+import time
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from rate_shop_tasks import gather
+
+
+def slow(value, seconds):
+    time.sleep(seconds)
+    return value
+
+
+def test_results_in_call_order():
+    # Later calls finish first; run one after another they would take 0.5 s
+    calls = [(slow, ("a", 0.3)), (slow, ("b", 0.2)), (slow, ("c", 0.0))]
+    started = time.perf_counter()
+
+    assert gather(calls) == ["a", "b", "c"]
+    assert time.perf_counter() - started < 0.45
+    assert gather([]) == []
+
+
+def test_first_failure_reraised_after_every_call():
+    finished = []
+
+    def record(name, error=None):
+        time.sleep(0.05)
+        finished.append(name)
+        if error:
+            raise error
+
+    first, second = ValueError("first"), KeyError("second")
+    calls = [(record, ("ok",)), (record, ("bad", first)), (record, ("worse", second)), (record, ("late",))]
+
+    with pytest.raises(ValueError) as raised:
+        gather(calls)
+    assert raised.value is first
+    assert sorted(finished) == ["bad", "late", "ok", "worse"]
+
+
+def gather_page():
+    """A page gathering three calls that each report their thread and session."""
+    import threading
+
+    import streamlit as st
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    from rate_shop_tasks import gather
+
+    def context():
+        ctx = get_script_run_ctx(suppress_warning=True)
+        st.text(threading.current_thread().name)
+        return ctx.session_id if ctx else None
+
+    session_ids = gather([(context, ()), (context, ()), (context, ())])
+    st.text(",".join(str(s) for s in session_ids))
+    st.text(get_script_run_ctx().session_id)
+
+
+def test_threads_carry_script_context():
+    at = AppTest.from_function(gather_page).run()
+
+    assert not at.exception
+    *names, session_ids, session_id = [text.value for text in at.text]
+    # Elements written from the gather threads reach the page too
+    assert sorted(names) == ["ScriptRunner.scriptThread", "rate-shop-gather-1", "rate-shop-gather-2"]
+    assert session_ids == ",".join([session_id] * 3)
@@ -0,0 +1,101 @@
+"""Loader telemetry against the fake BigQuery client."""
+import json
+
+import pandas as pd
+import pytest
+
+import rate_shop_bq
+import rate_shop_telemetry as telemetry
+from benchmarks.fake_bigquery import MB, FakeClient
+
+
+@pytest.fixture
+def client(monkeypatch):
+    frame = pd.DataFrame({"course": ["a", "b", "c"], "price": [40.0, 55.0, 61.0]})
+    fake = FakeClient(frame, setup_seconds=0, query_seconds=0, page_seconds=0)
+    rate_shop_bq.use_clients(fake)
+    telemetry.reset()
+    yield fake
+    rate_shop_bq.reset_clients()
+    telemetry.reset()
+
+
+def cached_loader():
+    """A loader shaped like the app's: a dict cache in place of st.cache_data."""
+    cache = {}
+
+    @telemetry.timed_loader(name="prices")
+    def load(key):
+        if key not in cache:
+            telemetry.cache_miss()
+            cache[key] = rate_shop_bq.run_query(f"SELECT * FROM prices -- {key}")
+        return cache[key]
+
+    return load
+
+
+def test_miss_records_job_statistics(client):
+    load = cached_loader()
+    frame = load("2026-03")
+
+    (call,) = telemetry.recent_calls()
+    assert call["loader"] == "prices"
+    assert call["cache"] == "miss"
+    assert call["rows"] == len(frame) == 3
+    assert call["error"] is None
+
+    (query,) = call["queries"]
+    job = client.queries[0]
+    assert query["source"] == "bigquery"
+    assert query["job_id"] == job.job_id
+    assert query["bytes_processed"] == job.total_bytes_processed > 0
+    assert query["bytes_billed"] == 10 * MB
+    assert query["rows"] == 3
+
+
+def test_hit_runs_no_query(client):
+    load = cached_loader()
+    load("2026-03")
+    load("2026-03")
+    load("2026-04")
+
+    assert [c["cache"] for c in telemetry.recent_calls()] == ["miss", "hit", "miss"]
+    assert len(client.queries) == 2
+
+    (summary,) = telemetry.loader_summary(telemetry.recent_calls()).to_dict("records")
+    assert summary["calls"] == 3
+    assert summary["hits"] == 1
+    assert summary["misses"] == 2
+    assert summary["hit_ratio"] == pytest.approx(0.33)
+    assert summary["queries"] == 2
+    assert summary["bytes_billed"] == 20 * MB
+
+
+def test_uncached_loader_and_errors(client):
+    @telemetry.timed_loader(cached=False)
+    def broken():
+        raise ValueError("no table")
+
+    with pytest.raises(ValueError):
+        broken()
+
+    (call,) = telemetry.recent_calls()
+    assert call["loader"] == "broken"
+    assert call["cache"] == "uncached"
+    assert call["error"] == "ValueError: no table"
+
+
+def test_log_is_opt_in(client, monkeypatch, tmp_path):
+    log = tmp_path / "telemetry.jsonl"
+    load = cached_loader()
+
+    monkeypatch.setattr(telemetry, "TELEMETRY_LOG", "")
+    load("2026-03")
+    assert not log.exists()
+
+    monkeypatch.setattr(telemetry, "TELEMETRY_LOG", str(log))
+    load("2026-03")
+    load("2026-04")
+    calls = telemetry.read_log(log)
+    assert [c["cache"] for c in calls] == ["hit", "miss"]
+    assert json.loads(log.read_text().splitlines()[-1])["queries"][0]["bytes_billed"] == 10 * MB